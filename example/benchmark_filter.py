@@ -0,0 +1,176 @@
+"""Microbenchmark of the default filter chain.
+
+Measures the time per call of the filter chain on a representative set of parameter-value-tuples:
+all combinations generated for the complete parameter-value-matrix and all sub tuples, which
+appear while a combination is build parameter by parameter.
+
+The same tuples are passed to the filter chain of the current source tree and to the filter chain
+of a baseline revision, by default the last revision before the version thresholds of the rules
+were precomputed. The baseline source tree is exported with git archive. Both filter chains are
+measured in a separate Python process with the same measurement code, so each process imports only
+one version of bashi. The processes of both revisions are started alternately for several rounds
+and the best time of each revision is compared, which reduces the influence of a noisy machine.
+
+To show the effect of a single precomputed version threshold, the script also measures a version
+comparison with a constant against the same comparison with a version literal, which is parsed on
+each call.
+
+Usage: python benchmark_filter.py [baseline revision]
+"""
+
+from typing import Callable, List, Tuple
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+from collections import OrderedDict
+import packaging.version as pkv
+from bashi.types import ParameterValueTuple
+from bashi.generator import generate_combination_list
+from bashi.versions import get_parameter_value_matrix, UBUNTU_ROCM_MIN_VERSION
+
+REPEATS = 5
+# number of alternating measurements of the baseline and the current filter chain
+ROUNDS = 3
+# last revision, where the filter rules parsed the version thresholds on each call
+BASELINE_REVISION = "70d5192"
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(REPOSITORY_DIR, "src")
+
+# measurement code, which runs in a separate process
+# reads the parameter-value-tuples from stdin and prints the time per call in nano seconds
+MEASURE_CODE = """
+import json, sys, timeit
+from collections import OrderedDict
+import packaging.version as pkv
+from bashi.types import ParameterValue
+from bashi.filter_chain import get_default_filter_chain
+
+rows = [
+    OrderedDict((param, ParameterValue(name, pkv.parse(version))) for param, name, version in row)
+    for row in json.load(sys.stdin)
+]
+filter_chain = get_default_filter_chain()
+
+def run():
+    for row in rows:
+        filter_chain(row)
+
+print(min(timeit.repeat(run, number=1, repeat=int(sys.argv[1]))) / len(rows) * 1e9)
+"""
+
+
+def get_representative_rows() -> List[ParameterValueTuple]:
+    """Returns all generated combinations and all of their prefixes.
+
+    Returns:
+        List[ParameterValueTuple]: list of parameter-value-tuples
+    """
+    rows: List[ParameterValueTuple] = []
+    for comb in generate_combination_list(get_parameter_value_matrix()):
+        row: ParameterValueTuple = OrderedDict()
+        for param, param_val in comb.items():
+            row[param] = param_val
+            rows.append(OrderedDict(row))
+    return rows
+
+
+def encode_rows(rows: List[ParameterValueTuple]) -> str:
+    """Serialize the parameter-value-tuples independent of the bashi version.
+
+    Args:
+        rows (List[ParameterValueTuple]): parameter-value-tuples
+
+    Returns:
+        str: JSON list of rows, each row is a list of (parameter, value-name, value-version)
+    """
+    encoded: List[List[Tuple[str, str, str]]] = [
+        [(param, param_val.name, str(param_val.version)) for param, param_val in row.items()]
+        for row in rows
+    ]
+    return json.dumps(encoded)
+
+
+def time_per_call_ns(source_dir: str, encoded_rows: str) -> float:
+    """Measures the time of a single call of the default filter chain of a source tree.
+
+    Args:
+        source_dir (str): directory, which contains the bashi package
+        encoded_rows (str): parameter-value-tuples created by encode_rows()
+
+    Returns:
+        float: best time per call of all repeats in nano seconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_CODE, str(REPEATS)],
+        input=encoded_rows,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": source_dir},
+    )
+    return float(result.stdout)
+
+
+def export_source_tree(revision: str, directory: str) -> str:
+    """Export the src directory of a git revision.
+
+    Args:
+        revision (str): git revision
+        directory (str): target directory
+
+    Returns:
+        str: path of the exported src directory
+    """
+    archive = subprocess.run(
+        ["git", "-C", REPOSITORY_DIR, "archive", "--format=tar", revision, "--", "src"],
+        capture_output=True,
+        check=True,
+    ).stdout
+    archive_path = os.path.join(directory, "src.tar")
+    with open(archive_path, "wb") as archive_file:
+        archive_file.write(archive)
+    with tarfile.open(archive_path) as tar:
+        tar.extractall(directory, filter="data")
+    return os.path.join(directory, "src")
+
+
+def time_comparison_ns(comparison: Callable[[], bool], number: int = 100000) -> float:
+    """Measures the time of a single version comparison.
+
+    Args:
+        comparison (Callable[[], bool]): function which compares two versions
+        number (int, optional): number of calls per repeat. Defaults to 100000.
+
+    Returns:
+        float: best time per call of all repeats in nano seconds
+    """
+    return min(timeit.repeat(comparison, number=number, repeat=REPEATS)) / number * 1e9
+
+
+if __name__ == "__main__":
+    baseline_revision = sys.argv[1] if len(sys.argv) > 1 else BASELINE_REVISION
+    representative_rows = encode_rows(get_representative_rows())
+    print(f"number of parameter-value-tuples: {len(json.loads(representative_rows))}")
+
+    baseline_times: List[float] = []
+    current_times: List[float] = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        baseline_dir = export_source_tree(baseline_revision, tmp_dir)
+        for _ in range(ROUNDS):
+            baseline_times.append(time_per_call_ns(baseline_dir, representative_rows))
+            current_times.append(time_per_call_ns(SOURCE_DIR, representative_rows))
+
+    print(f"filter chain {baseline_revision:>9}: {min(baseline_times):8.0f} ns/call")
+    print(f"filter chain   current: {min(current_times):8.0f} ns/call")
+    print(f"speedup of the filter chain:  {min(baseline_times) / min(current_times):.2f}x")
+
+    version = pkv.parse("18.04")
+    literal_ns = time_comparison_ns(lambda: version < pkv.parse("20.04"))
+    constant_ns = time_comparison_ns(lambda: version < UBUNTU_ROCM_MIN_VERSION)
+    print(f"comparison with literal:  {literal_ns:8.0f} ns/call")
+    print(f"comparison with constant: {constant_ns:8.0f} ns/call")
+    print(f"speedup per version threshold: {literal_ns / constant_ns:.1f}x")
@@ -0,0 +1,64 @@
+"""Benchmark of the start-up time of bashi-validate.
+
+Measures the wall time of complete bashi-validate processes, which check a single row, and
+compares it with the start-up time of the Python interpreter itself. Each measurement starts a new
+process, therefore the time contains the interpreter start, the imports, the argument parsing and
+the filter chain.
+"""
+
+from typing import List
+import statistics
+import subprocess
+import sys
+import time
+
+REPEATS = 20
+# maximum start-up time of bashi-validate in milliseconds
+STARTUP_TARGET_MS = 150.0
+
+VALIDATE_ARGS: List[str] = [
+    "--host-compiler",
+    "gcc@10",
+    "--device-compiler",
+    "nvcc@12.0",
+    "--alpaka_ACC_GPU_CUDA_ENABLE",
+    "12.0",
+    "--cmake",
+    "3.22",
+]
+
+
+def time_process_ms(args: List[str]) -> List[float]:
+    """Starts a Python process several times and measures the wall time of each run.
+
+    Args:
+        args (List[str]): arguments of the Python interpreter
+
+    Returns:
+        List[float]: wall time of each run in milliseconds
+    """
+    times: List[float] = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], stdout=subprocess.DEVNULL, check=False)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+if __name__ == "__main__":
+    interpreter_ms = time_process_ms(["-c", "pass"])
+    typeguard_ms = time_process_ms(["-c", "import typeguard"])
+    validate_ms = time_process_ms(["-m", "bashiValidate.validate", *VALIDATE_ARGS])
+
+    for name, times in (
+        ("python interpreter", interpreter_ms),
+        ("import typeguard", typeguard_ms),
+        ("bashi-validate", validate_ms),
+    ):
+        print(f"{name:20} min {min(times):7.1f} ms  median {statistics.median(times):7.1f} ms")
+
+    median_ms = statistics.median(validate_ms)
+    print(
+        f"bashi-validate target: {STARTUP_TARGET_MS:.0f} ms -> "
+        f"{'reached' if median_ms <= STARTUP_TARGET_MS else 'missed'}"
+    )
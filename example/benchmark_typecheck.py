@@ -0,0 +1,81 @@
+"""Benchmark of the runtime type checking.
+
+Compares the import time of the bashi modules and the runtime of
+get_expected_bashi_parameter_value_pairs() on the complete parameter-value-matrix with and without
+type checking. The functions are instrumented when their module is imported. Therefore, each mode
+is measured in a new process, which sets the environment variable BASHI_TYPECHECK.
+"""
+
+from typing import Dict
+import json
+import os
+import subprocess
+import sys
+import time
+import timeit
+
+REPEATS = 5
+
+
+def measure() -> Dict[str, float]:
+    """Measures the current process.
+
+    Returns:
+        Dict[str, float]: import time and best runtime of get_expected_bashi_parameter_value_pairs()
+            in seconds
+    """
+    # pylint: disable=import-outside-toplevel
+    start = time.perf_counter()
+    from bashi.results import get_expected_bashi_parameter_value_pairs
+    from bashi.versions import get_parameter_value_matrix
+
+    import_time = time.perf_counter() - start
+
+    parameter_matrix = get_parameter_value_matrix()
+    runtime = min(
+        timeit.repeat(
+            lambda: get_expected_bashi_parameter_value_pairs(parameter_matrix),
+            number=1,
+            repeat=REPEATS,
+        )
+    )
+    return {"import": import_time, "runtime": runtime}
+
+
+def measure_process(typecheck: bool) -> Dict[str, float]:
+    """Runs the measurement in a new process.
+
+    Args:
+        typecheck (bool): value of BASHI_TYPECHECK
+
+    Returns:
+        Dict[str, float]: result of measure()
+    """
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure"],
+        env={**os.environ, "BASHI_TYPECHECK": str(int(typecheck))},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+if __name__ == "__main__":
+    if "--measure" in sys.argv:
+        print(json.dumps(measure()))
+        sys.exit(0)
+
+    with_typecheck = measure_process(True)
+    without_typecheck = measure_process(False)
+
+    print("                                            BASHI_TYPECHECK=1  BASHI_TYPECHECK=0")
+    for key, name in (
+        ("import", "import bashi.results"),
+        ("runtime", "get_expected_bashi_parameter_value_pairs"),
+    ):
+        print(
+            f"{name:42} {with_typecheck[key] * 1000:14.1f} ms  "
+            f"{without_typecheck[key] * 1000:14.1f} ms  "
+            f"speedup {with_typecheck[key] / without_typecheck[key]:.2f}x"
+        )
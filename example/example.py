@@ -401,8 +401,9 @@ def create_yaml(combination_list: CombinationList):
 
 
 if __name__ == "__main__":
-    param_matrix = get_parameter_value_matrix()
-    # append project specific parameter-values
+    # the parameter-value-matrix of bashi is read-only, derive a modifiable matrix to append project
+    # specific parameter-values
+    param_matrix = get_parameter_value_matrix().derive()
     param_matrix["SoftwareA"] = [
         ParameterValue("SoftwareA", ValueVersion("1.0")),
         ParameterValue("SoftwareA", ValueVersion("2.0")),
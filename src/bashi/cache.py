@@ -0,0 +1,585 @@
+"""Persistent on-disk cache of generated combination-lists.
+
+Generating the combination-list for the same parameter-value-matrix gives always the same result.
+Therefore, the combination-list can be stored on the disk and reused, for example in the next CI
+pipeline run. The cache is content-addressed: the key is a hash of all inputs of the generator, the
+parameter-value-matrix, the bashi version, the source code of the bashi filter rules and the
+pair-wise engine, the engine name and a fingerprint of the custom filter. If an input changes, the
+key changes and the combination-list is generated again.
+
+A cache entry stores each combination as the indices of the parameter-values in the
+parameter-value-matrix, therefore an entry can only be loaded with the same
+parameter-value-matrix.
+"""
+
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple
+from collections import OrderedDict
+from types import BuiltinFunctionType, CodeType, FunctionType, ModuleType
+import hashlib
+import importlib.metadata
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+from bashi.types import Combination, CombinationList, FilterFunction, ParameterValueMatrix
+from bashi import (
+    globals as bashi_globals,
+    types as bashi_types,
+    interning,
+    utils,
+    versions,
+    rules,
+    filter_compiler,
+    filter_backend,
+    filter_software_dependency,
+    filter_chain,
+    encoding,
+    compatibility,
+    engine,
+    generator,
+)
+from bashi.generator import generate_combination_list, ENGINE_BASHI
+
+# modules, whose source code affects the generated combination-list
+FINGERPRINT_MODULES = (
+    bashi_globals,
+    bashi_types,
+    interning,
+    utils,
+    versions,
+    rules,
+    filter_compiler,
+    filter_backend,
+    filter_software_dependency,
+    filter_chain,
+    encoding,
+    compatibility,
+    engine,
+    generator,
+)
+
+# file extension of a cache entry
+CACHE_ENTRY_SUFFIX: str = ".bashi"
+# first bytes of a cache entry, contains the version of the file format
+CACHE_ENTRY_MAGIC: bytes = b"BASHICL1"
+
+# computed by the first call of get_rule_set_fingerprint()
+_rule_set_fingerprint: Optional[str] = None  # pylint: disable=invalid-name
+
+
+def get_bashi_version() -> str:
+    """Returns the version of the installed bashi library.
+
+    Returns:
+        str: the version or "unknown", if bashi is not installed
+    """
+    try:
+        return importlib.metadata.version("bashi")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_rule_set_fingerprint() -> str:
+    """Returns a hash of the source code of the bashi filter rules, the supported versions and the
+    pair-wise engine. The hash is computed only once.
+
+    Returns:
+        str: hex digest of the hash
+    """
+    global _rule_set_fingerprint  # pylint: disable=global-statement
+    if _rule_set_fingerprint is None:
+        hash_object = hashlib.sha256()
+        for module in FINGERPRINT_MODULES:
+            hash_object.update(module.__name__.encode())
+            with open(str(module.__file__), "rb") as module_file:
+                hash_object.update(module_file.read())
+        _rule_set_fingerprint = hash_object.hexdigest()
+    return _rule_set_fingerprint
+
+
+def get_filter_fingerprint(custom_filter: FilterFunction) -> str:
+    """Returns a hash of a custom filter function. The hash contains the byte code of the function
+    and the values it depends on: the global variables used by the function, the values captured in
+    its closure and its default arguments. Functions, which are called by the custom filter, are
+    added recursively in the same way. Functions and global variables of the Python standard
+    library and of bashi, as well as modules and classes, are only identified by their name,
+    therefore changes of their source code or of their attributes do not change the fingerprint.
+    Sets are hashed independent of their iteration order, which depends on the hash seed of the
+    process.
+
+    Args:
+        custom_filter (FilterFunction): the custom filter function
+
+    Raises:
+        ValueError: If the custom filter has no byte code, for example if it is a functools.partial
+            object or a builtin function, or it depends on a value, whose representation changes
+            in each process, for example an object with the default repr().
+
+    Returns:
+        str: hex digest of the hash
+    """
+    if not isinstance(getattr(custom_filter, "__code__", None), CodeType):
+        raise ValueError(
+            f"Cannot create fingerprint of {custom_filter!r}, because it has no byte code. "
+            "Please set the custom filter fingerprint manually."
+        )
+    hash_object = hashlib.sha256()
+    _hash_function(hash_object.update, custom_filter, set())
+    return hash_object.hexdigest()
+
+
+def _hash_function(update: Callable[[bytes], None], function: Any, visited: Set[int]):
+    """Adds the byte code of a Python function and all values it depends on to a hash.
+
+    Args:
+        update (Callable[[bytes], None]): update function of the hash
+        function (Any): the function
+        visited (Set[int]): ids of the already added functions, breaks recursion cycles
+    """
+    if id(function) in visited:
+        update(f"<recursion {function.__qualname__}>".encode())
+        return
+    visited.add(id(function))
+
+    code: CodeType = function.__code__
+    _hash_code(update, code)
+    for name in sorted(_get_global_names(code)):
+        if name in function.__globals__:
+            update(f"global {name}=".encode())
+            value = function.__globals__[name]
+            library_name = _get_library_global_name(name, value)
+            if library_name is not None:
+                update(f"<{library_name}>".encode())
+            else:
+                _hash_value(update, value, visited)
+    for cell in function.__closure__ or ():
+        update(b"closure=")
+        try:
+            cell_contents = cell.cell_contents
+        except ValueError:
+            # the variable of the closure is not assigned yet
+            update(b"<empty>")
+            continue
+        _hash_value(update, cell_contents, visited)
+    for default in function.__defaults__ or ():
+        update(b"default=")
+        _hash_value(update, default, visited)
+    for name, default in sorted((function.__kwdefaults__ or {}).items()):
+        update(f"default {name}=".encode())
+        _hash_value(update, default, visited)
+
+
+def _get_global_names(code: CodeType) -> Set[str]:
+    """Returns the names, which can refer to global variables, of a code object and all nested code
+    objects.
+
+    Args:
+        code (CodeType): the code object
+
+    Returns:
+        Set[str]: names of possible global variables
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _get_global_names(const)
+    return names
+
+
+def _hash_value(update: Callable[[bytes], None], value: Any, visited: Set[int]):
+    """Adds a value, which is used by a custom filter, to a hash.
+
+    Args:
+        update (Callable[[bytes], None]): update function of the hash
+        value (Any): the value
+        visited (Set[int]): ids of the already added functions
+
+    Raises:
+        ValueError: If the value has no representation, which is equal in each process.
+    """
+    if isinstance(value, ModuleType):
+        update(f"<module {value.__name__}>".encode())
+    elif isinstance(value, FunctionType) and not _is_library_module(value.__module__):
+        _hash_function(update, value, visited)
+    elif isinstance(value, (type, FunctionType, BuiltinFunctionType)):
+        update(f"<{value.__module__}.{value.__qualname__}>".encode())
+    elif isinstance(value, (set, frozenset)):
+        # the iteration order of a set depends on the hash seed of the process
+        element_digests: List[bytes] = []
+        for element in value:
+            element_hash = hashlib.sha256()
+            _hash_value(element_hash.update, element, set(visited))
+            element_digests.append(element_hash.digest())
+        update(f"<{type(value).__qualname__} {len(element_digests)}>".encode())
+        for element_digest in sorted(element_digests):
+            update(element_digest)
+    elif isinstance(value, (list, tuple)):
+        update(f"<{type(value).__qualname__} {len(value)}>".encode())
+        for element in value:
+            _hash_value(update, element, visited)
+    elif isinstance(value, dict):
+        update(f"<{type(value).__qualname__} {len(value)}>".encode())
+        for key, element in value.items():
+            _hash_value(update, key, visited)
+            _hash_value(update, element, visited)
+    else:
+        representation = repr(value)
+        if " at 0x" in representation:
+            raise ValueError(
+                f"Cannot create fingerprint of the custom filter, because it depends on "
+                f"{representation}, whose representation is different in each process. "
+                "Please set the custom filter fingerprint manually."
+            )
+        update(f"{type(value).__qualname__}:{representation}".encode())
+
+
+def _is_library_module(module_name: Optional[str]) -> bool:
+    """Returns True, if the module is part of the Python standard library or of bashi.
+
+    Args:
+        module_name (Optional[str]): name of the module
+
+    Returns:
+        bool: True for modules, whose source code and values are not part of the fingerprint
+    """
+    package = str(module_name).split(".", maxsplit=1)[0]
+    return package == "bashi" or package in sys.stdlib_module_names
+
+
+def _get_library_global_name(name: str, value: Any) -> Optional[str]:
+    """Returns the qualified name of a global variable, which was imported from a module of the
+    Python standard library or of bashi. The source code of bashi is already part of the cache key,
+    therefore the name identifies the value.
+
+    Args:
+        name (str): name of the global variable
+        value (Any): value of the global variable
+
+    Returns:
+        Optional[str]: the qualified name, e.g. bashi.versions.NVCC_GCC_MAX_VERSION, or None if
+            the value is a literal or is not defined by a library module
+    """
+    # literals are hashed by value, because the same name and value can also be defined by the
+    # custom filter module
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return None
+    library_names = [
+        f"{module_name}.{name}"
+        for module_name, module in list(sys.modules.items())
+        if isinstance(module, ModuleType)
+        and _is_library_module(module_name)
+        and vars(module).get(name) is value
+    ]
+    # the order of sys.modules depends on the import order
+    return min(library_names, default=None)
+
+
+def _hash_code(update: Callable[[bytes], None], code: CodeType):
+    """Adds the byte code, the names and the constants of a code object to a hash. Nested code
+    objects, for example of inner functions, are added recursively.
+
+    Args:
+        update (Callable[[bytes], None]): update function of the hash
+        code (CodeType): the code object
+    """
+    update(code.co_code)
+    update(repr((code.co_names, code.co_varnames, code.co_freevars)).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _hash_code(update, const)
+        else:
+            update(repr(const).encode())
+
+
+def get_cache_key(
+    parameter_value_matrix: ParameterValueMatrix,
+    custom_filter_fingerprint: str = "",
+    engine_name: str = ENGINE_BASHI,
+) -> str:
+    """Returns the content-addressed key of a combination-list.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): the parameter-value-matrix
+        custom_filter_fingerprint (str, optional): Fingerprint of the custom filter, see
+            get_filter_fingerprint(). Defaults to "".
+        engine_name (str, optional): Name of the pair-wise engine. Defaults to ENGINE_BASHI.
+
+    Returns:
+        str: hex digest of the key
+    """
+    hash_object = hashlib.sha256()
+    for part in (
+        get_bashi_version(),
+        get_rule_set_fingerprint(),
+        engine_name,
+        custom_filter_fingerprint,
+    ):
+        hash_object.update(part.encode())
+        hash_object.update(b"\0")
+    for param, param_vals in parameter_value_matrix.items():
+        hash_object.update(param.encode())
+        hash_object.update(b"\0")
+        for param_val in param_vals:
+            hash_object.update(f"{param_val.name}\0{param_val.version}\0".encode())
+        hash_object.update(b"\1")
+    return hash_object.hexdigest()
+
+
+class CombinationListCache:
+    """Directory with cached combination-lists. Each combination-list is stored in a single file.
+    Loading an entry updates its modification time, therefore the eviction removes the least
+    recently used entries first.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        """Create the cache. The directory is created, if it does not exist.
+
+        Args:
+            directory (str): path of the cache directory
+            max_size (Optional[int], optional): Maximum size of all cache entries in bytes. If
+                None, the size is not limited. Defaults to None.
+            max_age (Optional[float], optional): Maximum time in seconds since the last use of a
+                cache entry. If None, the age is not limited. Defaults to None.
+
+        Raises:
+            ValueError: If max_size or max_age is negative.
+        """
+        if max_size is not None and max_size < 0:
+            raise ValueError(f"max_size needs to be positive: {max_size}")
+        if max_age is not None and max_age < 0:
+            raise ValueError(f"max_age needs to be positive: {max_age}")
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+        os.makedirs(directory, exist_ok=True)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_ENTRY_SUFFIX)
+
+    def load(
+        self, key: str, parameter_value_matrix: ParameterValueMatrix
+    ) -> Optional[CombinationList]:
+        """Loads a combination-list from the cache.
+
+        Args:
+            key (str): key of the cache entry, see get_cache_key()
+            parameter_value_matrix (ParameterValueMatrix): the parameter-value-matrix, which was
+                used to create the key
+
+        Returns:
+            Optional[CombinationList]: The combination-list or None, if the cache contains no
+                entry for the key. Broken entries are removed and handled like a missing entry.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as entry_file:
+                data = entry_file.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            combination_list = _decode_combination_list(data, parameter_value_matrix)
+        except (ValueError, IndexError, struct.error, zlib.error):
+            os.remove(path)
+            return None
+
+        os.utime(path)
+        return combination_list
+
+    def store(
+        self,
+        key: str,
+        parameter_value_matrix: ParameterValueMatrix,
+        combination_list: CombinationList,
+    ):
+        """Stores a combination-list in the cache and evicts old entries afterwards.
+
+        Args:
+            key (str): key of the cache entry, see get_cache_key()
+            parameter_value_matrix (ParameterValueMatrix): the parameter-value-matrix, which was
+                used to generate the combination-list
+            combination_list (CombinationList): the combination-list
+        """
+        data = _encode_combination_list(combination_list, parameter_value_matrix)
+        # write to a temporary file and rename it, so that a concurrent process never reads an
+        # incomplete entry
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as entry_file:
+                entry_file.write(data)
+            os.replace(tmp_path, self._get_path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def _entries(self) -> Iterator[Tuple[str, os.stat_result]]:
+        for name in os.listdir(self.directory):
+            if name.endswith(CACHE_ENTRY_SUFFIX):
+                path = os.path.join(self.directory, name)
+                try:
+                    yield (path, os.stat(path))
+                except FileNotFoundError:
+                    # removed by a concurrent process
+                    continue
+
+    def evict(self):
+        """Removes all entries, which are older than max_age. Afterwards, the least recently used
+        entries are removed until the size of all entries is not larger than max_size.
+        """
+        now = time.time()
+        entries: List[Tuple[str, os.stat_result]] = []
+        for path, stat in self._entries():
+            if self.max_age is not None and now - stat.st_mtime > self.max_age:
+                _remove_entry(path)
+            else:
+                entries.append((path, stat))
+
+        if self.max_size is None:
+            return
+
+        size = sum(stat.st_size for _, stat in entries)
+        entries.sort(key=lambda entry: entry[1].st_mtime)
+        for path, stat in entries:
+            if size <= self.max_size:
+                break
+            _remove_entry(path)
+            size -= stat.st_size
+
+    def clear(self):
+        """Removes all entries."""
+        for path, _ in self._entries():
+            _remove_entry(path)
+
+
+def _remove_entry(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _encode_combination_list(
+    combination_list: CombinationList, parameter_value_matrix: ParameterValueMatrix
+) -> bytes:
+    """Encodes each parameter-value of the combination-list as index in the list of
+    parameter-values of the parameter-value-matrix.
+
+    Args:
+        combination_list (CombinationList): the combination-list
+        parameter_value_matrix (ParameterValueMatrix): the parameter-value-matrix
+
+    Raises:
+        ValueError: If a combination contains a parameter-value, which is not part of the
+            parameter-value-matrix.
+
+    Returns:
+        bytes: magic, number of parameters and combinations and the zlib compressed indices
+    """
+    value_indices = [
+        {param_val: index for index, param_val in enumerate(param_vals)}
+        for param_vals in parameter_value_matrix.values()
+    ]
+    indices: List[int] = []
+    for comb in combination_list:
+        if list(comb.keys()) != list(parameter_value_matrix.keys()):
+            raise ValueError(f"The parameters of the combination does not match the matrix: {comb}")
+        for param_indices, param_val in zip(value_indices, comb.values()):
+            if param_val not in param_indices:
+                raise ValueError(f"{param_val} is not part of the parameter-value-matrix")
+            indices.append(param_indices[param_val])
+    return (
+        CACHE_ENTRY_MAGIC
+        + struct.pack("<II", len(parameter_value_matrix), len(combination_list))
+        + zlib.compress(struct.pack(f"<{len(indices)}I", *indices))
+    )
+
+
+def _decode_combination_list(
+    data: bytes, parameter_value_matrix: ParameterValueMatrix
+) -> CombinationList:
+    """Reverse function of _encode_combination_list().
+
+    Args:
+        data (bytes): the encoded combination-list
+        parameter_value_matrix (ParameterValueMatrix): the parameter-value-matrix
+
+    Raises:
+        ValueError: If the data is not a encoded combination-list of the parameter-value-matrix.
+
+    Returns:
+        CombinationList: the combination-list
+    """
+    if not data.startswith(CACHE_ENTRY_MAGIC):
+        raise ValueError("unknown file format")
+    header_end = len(CACHE_ENTRY_MAGIC) + struct.calcsize("<II")
+    number_of_parameters, number_of_combinations = struct.unpack(
+        "<II", data[len(CACHE_ENTRY_MAGIC) : header_end]
+    )
+    if number_of_parameters != len(parameter_value_matrix):
+        raise ValueError("number of parameters does not match")
+    indices = struct.unpack(
+        f"<{number_of_parameters * number_of_combinations}I", zlib.decompress(data[header_end:])
+    )
+
+    if number_of_parameters == 0:
+        return [OrderedDict() for _ in range(number_of_combinations)]
+
+    parameters = list(parameter_value_matrix.items())
+    combination_list: CombinationList = []
+    for offset in range(0, len(indices), number_of_parameters):
+        comb: Combination = OrderedDict()
+        for (param, param_vals), index in zip(
+            parameters, indices[offset : offset + number_of_parameters]
+        ):
+            comb[param] = param_vals[index]
+        combination_list.append(comb)
+    return combination_list
+
+
+def generate_combination_list_cached(
+    parameter_value_matrix: ParameterValueMatrix,
+    cache: CombinationListCache,
+    custom_filter: FilterFunction = lambda _: True,
+    engine_name: str = ENGINE_BASHI,
+    custom_filter_fingerprint: Optional[str] = None,
+) -> CombinationList:
+    """Cached version of generate_combination_list(). Returns the combination-list from the cache,
+    if it contains an entry for the inputs. Otherwise, the combination-list is generated and
+    stored in the cache.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        cache (CombinationListCache): the cache
+        custom_filter (FilterFunction, optional): Custom filter function to extend bashi
+            filters. Defaults is lambda _: True.
+        engine_name (str, optional): Pair-wise engine, see generate_combination_list(). Defaults
+            to ENGINE_BASHI.
+        custom_filter_fingerprint (Optional[str], optional): Identifies the custom filter. Needs to
+            change, if the result of the custom filter changes. If None, the fingerprint is
+            computed from the byte code of the custom filter with get_filter_fingerprint().
+            Defaults to None.
+
+    Returns:
+        CombinationList: combination-list
+    """
+    if custom_filter_fingerprint is None:
+        custom_filter_fingerprint = get_filter_fingerprint(custom_filter)
+    key = get_cache_key(parameter_value_matrix, custom_filter_fingerprint, engine_name)
+
+    combination_list = cache.load(key, parameter_value_matrix)
+    if combination_list is None:
+        combination_list = generate_combination_list(
+            parameter_value_matrix, custom_filter, engine_name
+        )
+        cache.store(key, parameter_value_matrix, combination_list)
+    return combination_list
@@ -0,0 +1,158 @@
+"""Precomputed compatibility of all parameter-value-pairs of a parameter-value-matrix.
+
+All bashi filter rules are written as rules with two parameters (see docs/rules.md). Therefore the
+validity of each parameter-value-pair can be computed once per parameter-value-matrix. Checking a
+parameter-value-tuple needs afterwards only some bit operations instead of running the filter
+chain.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+from collections import OrderedDict
+
+from bashi.types import (
+    Parameter,
+    ParameterValueMatrix,
+    ParameterValueTuple,
+    FilterFunction,
+)
+from bashi.encoding import EncodedMatrix
+from bashi.filter_chain import get_default_filter_chain
+
+
+class PairCompatibilityIndex:
+    """Stores for each parameter-value a bitset of all parameter-values, which can be combined with
+    it. The bit positions are the value ids of the EncodedMatrix.
+
+    The index is exact for filter functions, which contains only rules with one or two parameters,
+    like all bashi filter rules. For filter functions with rules with three or more parameters, the
+    index is a necessary but not sufficient condition for a valid parameter-value-tuple.
+    """
+
+    def __init__(
+        self,
+        parameter_value_matrix: ParameterValueMatrix,
+        filter_function: Optional[FilterFunction] = None,
+    ):
+        """Evaluate the filter function for each parameter-value-pair of the
+        parameter-value-matrix.
+
+        Args:
+            parameter_value_matrix (ParameterValueMatrix): the parameter-value-matrix
+            filter_function (Optional[FilterFunction], optional): Filter function, which decides
+                whether a parameter-value-tuple is valid. If None, the default filter chain of
+                get_default_filter_chain() is used. Defaults to None.
+        """
+        if filter_function is None:
+            filter_function = get_default_filter_chain()
+
+        self.matrix = EncodedMatrix(parameter_value_matrix)
+        # bitset of all parameter-values, which passes the filter function as single value
+        self.usable: int = 0
+        # compatible[id] is a bitset of all value ids, which can be combined with id
+        self.compatible: List[int] = [0] * len(self.matrix)
+
+        singles = [self.matrix.decode_value(value_id) for value_id in range(len(self.matrix))]
+        for value_id, single in enumerate(singles):
+            if filter_function(OrderedDict([single])):
+                self.usable |= 1 << value_id
+
+        value_parameter = self.matrix.value_parameter
+        for id1, single1 in enumerate(singles):
+            if not self.usable >> id1 & 1:
+                continue
+            # value ids of the same parameter are consecutive, therefore start with the first value
+            # of the next parameter
+            for id2 in range(self.matrix.parameter_values[value_parameter[id1]].stop, len(singles)):
+                if not self.usable >> id2 & 1:
+                    continue
+                if filter_function(OrderedDict([single1, singles[id2]])):
+                    self.compatible[id1] |= 1 << id2
+                    self.compatible[id2] |= 1 << id1
+
+    def is_compatible(self, value_id1: int, value_id2: int) -> bool:
+        """Check if two parameter-values can be combined.
+
+        Args:
+            value_id1 (int): value id of the first parameter-value
+            value_id2 (int): value id of the second parameter-value
+
+        Returns:
+            bool: True if the parameter-value-pair is valid.
+        """
+        return bool(self.compatible[value_id1] >> value_id2 & 1)
+
+    def is_valid_ids(self, value_ids: Sequence[int]) -> bool:
+        """Check if all parameter-value-pairs of a parameter-value-tuple are valid.
+
+        Args:
+            value_ids (Sequence[int]): value ids of the parameter-value-tuple
+
+        Returns:
+            bool: True if the parameter-value-tuple is valid.
+        """
+        row_mask = 0
+        for value_id in value_ids:
+            row_mask |= 1 << value_id
+
+        if row_mask & self.usable != row_mask:
+            return False
+
+        for value_id in value_ids:
+            if (row_mask ^ (1 << value_id)) & ~self.compatible[value_id]:
+                return False
+        return True
+
+    def contains(self, row: ParameterValueTuple) -> bool:
+        """Check if all parameter-values of the parameter-value-tuple are part of the index.
+
+        Args:
+            row (ParameterValueTuple): the parameter-value-tuple
+
+        Returns:
+            bool: True if all parameter-values are known.
+        """
+        return all(item in self.matrix.value_ids for item in row.items())
+
+    def is_valid(self, row: ParameterValueTuple) -> bool:
+        """Check if all parameter-value-pairs of a parameter-value-tuple are valid.
+
+        Args:
+            row (ParameterValueTuple): the parameter-value-tuple
+
+        Raises:
+            KeyError: If a parameter-value is not part of the index.
+
+        Returns:
+            bool: True if the parameter-value-tuple is valid.
+        """
+        return self.is_valid_ids(self.matrix.encode_row(row))
+
+    def get_invalid_parameters(self, row: ParameterValueTuple) -> List[Tuple[Parameter, ...]]:
+        """Returns all single parameters and parameter pairs, which are not valid.
+
+        Args:
+            row (ParameterValueTuple): the parameter-value-tuple
+
+        Raises:
+            KeyError: If a parameter-value is not part of the index.
+
+        Returns:
+            List[Tuple[Parameter, ...]]: List of invalid parameters (tuple with a single parameter)
+                and invalid parameter pairs (tuple with two parameters). The order of the parameters
+                is the same like in the parameter-value-tuple.
+        """
+        invalid: List[Tuple[Parameter, ...]] = []
+        params = list(row.keys())
+        value_ids = self.matrix.encode_row(row)
+
+        for index1, value_id1 in enumerate(value_ids):
+            if not self.usable >> value_id1 & 1:
+                invalid.append((params[index1],))
+                continue
+            for index2 in range(index1 + 1, len(value_ids)):
+                if self.usable >> value_ids[index2] & 1 and not self.is_compatible(
+                    value_id1, value_ids[index2]
+                ):
+                    invalid.append((params[index1], params[index2]))
+
+        return invalid
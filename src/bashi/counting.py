@@ -0,0 +1,202 @@
+"""Count the valid combinations of a parameter-value-matrix.
+
+Enumerating the Cartesian product of the parameter-value-matrix is not feasible for the complete
+bashi matrix. Instead, the counter works on the PairCompatibilityIndex:
+
+- parameters, whose parameter-values can be combined without restriction, are split in independent
+  groups and the counts of the groups are multiplied
+- each group is counted with a depth-first search, which keeps a bitset of all parameter-values
+  compatible with the already assigned parameter-values, and stops if a following parameter has no
+  compatible parameter-value anymore
+- the number of completions depends only on the compatible parameter-values of the remaining
+  parameters, therefore the results are memoized with this bitset as key
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import math
+
+from bashi.types import ParameterValueMatrix, FilterFunction
+from bashi.filter_chain import get_default_filter_chain
+from bashi.compatibility import PairCompatibilityIndex
+from bashi.generator import generate_combination_list
+from bashi.engine import _iter_bits
+
+CombinationStatistics = NamedTuple(
+    "CombinationStatistics",
+    [
+        # number of combinations of the Cartesian product including invalid combinations
+        ("cartesian_product", int),
+        # number of valid combinations
+        ("valid_combinations", int),
+        # number of combinations generated by the pair-wise engine
+        ("pairwise_combinations", int),
+        # fraction of the valid combinations, which are saved by the pair-wise combination
+        ("reduction_ratio", float),
+    ],
+)
+
+
+def count_valid_combinations(
+    parameter_value_matrix: ParameterValueMatrix,
+    custom_filter: FilterFunction = lambda _: True,
+    pair_index: Optional[PairCompatibilityIndex] = None,
+) -> int:
+    """Count all combinations of the parameter-value-matrix, which pass the filter chain.
+
+    The result is exact, if the filter chain contains only rules with one or two parameters, like
+    all bashi filter rules. If the custom filter contains rules with three or more parameters, the
+    result is an upper bound.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        custom_filter (FilterFunction, optional): Custom filter function to extend bashi
+            filters. Defaults is lambda _: True.
+        pair_index (Optional[PairCompatibilityIndex], optional): Precomputed compatibility of the
+            parameter-value-pairs, created with the same parameter-value-matrix and
+            get_default_filter_chain(custom_filter). Defaults to None.
+
+    Returns:
+        int: number of valid combinations
+    """
+    if pair_index is None:
+        pair_index = PairCompatibilityIndex(
+            parameter_value_matrix, get_default_filter_chain(custom_filter)
+        )
+
+    number_of_params = len(pair_index.matrix.parameters)
+    # bitset of the usable parameter-values of each parameter
+    masks = [
+        pair_index.matrix.parameter_mask(param_id) & pair_index.usable
+        for param_id in range(number_of_params)
+    ]
+
+    count = 1
+    for group in _get_independent_groups(masks, pair_index.compatible):
+        count *= _count_group(group, masks, pair_index.compatible)
+        if count == 0:
+            break
+    return count
+
+
+def get_combination_statistics(
+    parameter_value_matrix: ParameterValueMatrix,
+    custom_filter: FilterFunction = lambda _: True,
+) -> CombinationStatistics:
+    """Compares the number of pair-wise generated combinations with the number of all valid
+    combinations.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        custom_filter (FilterFunction, optional): Custom filter function to extend bashi
+            filters. Defaults is lambda _: True.
+
+    Returns:
+        CombinationStatistics: the statistics
+    """
+    pair_index = PairCompatibilityIndex(
+        parameter_value_matrix, get_default_filter_chain(custom_filter)
+    )
+    valid_combinations = count_valid_combinations(parameter_value_matrix, custom_filter, pair_index)
+    pairwise_combinations = len(
+        generate_combination_list(parameter_value_matrix, custom_filter, pair_index=pair_index)
+    )
+    return CombinationStatistics(
+        cartesian_product=math.prod(
+            len(param_vals) for param_vals in parameter_value_matrix.values()
+        ),
+        valid_combinations=valid_combinations,
+        pairwise_combinations=pairwise_combinations,
+        reduction_ratio=(
+            1.0 - pairwise_combinations / valid_combinations if valid_combinations else 0.0
+        ),
+    )
+
+
+def _get_independent_groups(masks: List[int], compatible: List[int]) -> List[List[int]]:
+    """Split the parameters in groups. Two parameters are in different groups, if each
+    parameter-value of the first parameter can be combined with each parameter-value of the second
+    parameter, also indirectly via other parameters.
+
+    Args:
+        masks (List[int]): bitset of the usable parameter-values of each parameter
+        compatible (List[int]): compatible parameter-values of each parameter-value
+
+    Returns:
+        List[List[int]]: Parameter ids of each group. Inside a group, the parameters are ordered,
+            so that each parameter is restricted by as many previous parameters as possible.
+    """
+    number_of_params = len(masks)
+    restricts: List[List[int]] = [[] for _ in range(number_of_params)]
+    for param1 in range(number_of_params):
+        for param2 in range(param1 + 1, number_of_params):
+            if any(
+                compatible[value_id] & masks[param2] != masks[param2]
+                for value_id in _iter_bits(masks[param1])
+            ):
+                restricts[param1].append(param2)
+                restricts[param2].append(param1)
+
+    groups: List[List[int]] = []
+    visited = [False] * number_of_params
+    for start in sorted(range(number_of_params), key=lambda p: -len(restricts[p])):
+        if visited[start]:
+            continue
+        group = [start]
+        visited[start] = True
+        # the next parameter is the parameter with the most restrictions by the parameters
+        # already in the group
+        candidates: Dict[int, int] = {}
+        while True:
+            for param in restricts[group[-1]]:
+                if not visited[param]:
+                    candidates[param] = candidates.get(param, 0) + 1
+            if not candidates:
+                break
+            # on a tie, take the parameter with the lowest id
+            next_param = max(sorted(candidates), key=candidates.__getitem__)
+            del candidates[next_param]
+            visited[next_param] = True
+            group.append(next_param)
+        groups.append(group)
+    return groups
+
+
+def _count_group(group: List[int], masks: List[int], compatible: List[int]) -> int:
+    """Count the valid combinations of the parameters of a group.
+
+    Args:
+        group (List[int]): parameter ids in the order of assignment
+        masks (List[int]): bitset of the usable parameter-values of each parameter
+        compatible (List[int]): compatible parameter-values of each parameter-value
+
+    Returns:
+        int: number of valid combinations
+    """
+    group_masks = [masks[param] for param in group]
+    # bitset of the parameter-values of the parameter at a depth and all following parameters
+    remaining_masks = group_masks + [0]
+    for depth in range(len(group) - 1, -1, -1):
+        remaining_masks[depth] |= remaining_masks[depth + 1]
+    memo: Dict[Tuple[int, int], int] = {}
+
+    def count(depth: int, allowed: int) -> int:
+        if depth == len(group) - 1:
+            return (allowed & group_masks[depth]).bit_count()
+
+        key = (depth, allowed & remaining_masks[depth])
+        result = memo.get(key)
+        if result is not None:
+            return result
+
+        result = 0
+        for value_id in _iter_bits(allowed & group_masks[depth]):
+            new_allowed = allowed & compatible[value_id]
+            # each following parameter needs at least one compatible parameter-value
+            if all(new_allowed & mask for mask in group_masks[depth + 1 :]):
+                result += count(depth + 1, new_allowed)
+        memo[key] = result
+        return result
+
+    return count(0, sum(group_masks))
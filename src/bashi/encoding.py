@@ -0,0 +1,205 @@
+"""Integer encoding of the parameter-value-matrix.
+
+Comparing and hashing `ParameterValue` objects is expensive, because each of them contains a
+`packaging.version.Version`. The `EncodedMatrix` maps each parameter and each parameter-value to a
+small integer once. Internal algorithms, like the pair-wise engine, the PairCompatibilityIndex and
+the ParameterValuePairIndex, work on the integers and the `ParameterValue` objects are only
+restored at the API boundary.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple
+from collections import OrderedDict
+
+from bashi.types import (
+    Parameter,
+    ParameterValue,
+    ParameterValueMatrix,
+    ParameterValuePair,
+    ParameterValueSingle,
+    ParameterValueTuple,
+    ValueName,
+    ValueVersion,
+    Combination,
+)
+
+
+# pylint: disable=too-many-instance-attributes
+class EncodedMatrix:
+    """Integer encoded parameter-value-matrix.
+
+    Each parameter is identified by a parameter id, which is the position of the parameter in the
+    parameter-value-matrix. Each parameter-value is identified by a global value id, which is the
+    position of the parameter-value, if all parameter-value-lists are concatenated in the order of
+    the parameter-value-matrix. Therefore the value ids of a parameter are consecutive.
+
+    Value-names and value-versions are also mapped to integers. The version keys are sortable:
+    comparing the version keys of two parameter-values gives the same result like comparing the
+    value-versions.
+    """
+
+    def __init__(self, parameter_value_matrix: ParameterValueMatrix):
+        """Encode the parameter-value-matrix.
+
+        Args:
+            parameter_value_matrix (ParameterValueMatrix): the parameter-value-matrix
+        """
+        self.parameters: List[Parameter] = list(parameter_value_matrix.keys())
+        self.parameter_ids: Dict[Parameter, int] = {
+            param: param_id for param_id, param in enumerate(self.parameters)
+        }
+        # parameter-value for each value id
+        self.values: List[ParameterValue] = []
+        # value ids of each parameter
+        self.parameter_values: List[range] = []
+        # parameter id for each value id
+        self.value_parameter: array = array("I")
+        # maps the parameter and parameter-value to the value id
+        self.value_ids: Dict[Tuple[Parameter, ParameterValue], int] = {}
+
+        for param_id, param in enumerate(self.parameters):
+            first_value_id = len(self.values)
+            for param_val in parameter_value_matrix[param]:
+                self.value_ids.setdefault((param, param_val), len(self.values))
+                self.values.append(param_val)
+                self.value_parameter.append(param_id)
+            self.parameter_values.append(range(first_value_id, len(self.values)))
+
+        self.names: List[ValueName] = sorted(set(param_val.name for param_val in self.values))
+        self.name_ids: Dict[ValueName, int] = {name: i for i, name in enumerate(self.names)}
+        self.versions: List[ValueVersion] = sorted(
+            set(param_val.version for param_val in self.values)
+        )
+        self.version_ids: Dict[ValueVersion, int] = {
+            version: i for i, version in enumerate(self.versions)
+        }
+
+        # value-name id and sortable value-version key for each value id
+        self.value_name: array = array("I", (self.name_ids[val.name] for val in self.values))
+        self.version_key: array = array("I", (self.version_ids[val.version] for val in self.values))
+
+    def __len__(self) -> int:
+        """Number of parameter-values in the matrix.
+
+        Returns:
+            int: number of parameter-values
+        """
+        return len(self.values)
+
+    def parameter_mask(self, param_id: int) -> int:
+        """Returns a bitset, where all value ids of a parameter are set.
+
+        Args:
+            param_id (int): parameter id
+
+        Returns:
+            int: bitset of value ids
+        """
+        value_range = self.parameter_values[param_id]
+        return ((1 << len(value_range)) - 1) << value_range.start
+
+    def encode_value(self, parameter: Parameter, parameter_value: ParameterValue) -> int:
+        """Returns the value id of a parameter-value.
+
+        Args:
+            parameter (Parameter): the parameter
+            parameter_value (ParameterValue): the parameter-value
+
+        Raises:
+            KeyError: If the parameter-value is not part of the matrix.
+
+        Returns:
+            int: value id
+        """
+        return self.value_ids[(parameter, parameter_value)]
+
+    def encode_row(self, row: ParameterValueTuple) -> List[int]:
+        """Encodes a parameter-value-tuple or combination to a list of value ids. The order of the
+        value ids is the same like in the parameter-value-tuple.
+
+        Args:
+            row (ParameterValueTuple): parameter-value-tuple
+
+        Raises:
+            KeyError: If a parameter-value is not part of the matrix.
+
+        Returns:
+            List[int]: value ids
+        """
+        return [self.value_ids[item] for item in row.items()]
+
+    def encode_pair(self, parameter_value_pair: ParameterValuePair) -> Tuple[int, int]:
+        """Encodes a parameter-value-pair to a tuple of value ids.
+
+        Args:
+            parameter_value_pair (ParameterValuePair): the parameter-value-pair
+
+        Raises:
+            KeyError: If a parameter-value is not part of the matrix.
+
+        Returns:
+            Tuple[int, int]: value ids of the first and second parameter-value
+        """
+        return (
+            self.value_ids[parameter_value_pair.first],
+            self.value_ids[parameter_value_pair.second],
+        )
+
+    def decode_value(self, value_id: int) -> ParameterValueSingle:
+        """Returns parameter and parameter-value of a value id.
+
+        Args:
+            value_id (int): value id
+
+        Returns:
+            ParameterValueSingle: the parameter-value-single
+        """
+        return ParameterValueSingle(
+            self.parameters[self.value_parameter[value_id]], self.values[value_id]
+        )
+
+    def decode_row(self, value_ids: Iterable[int]) -> ParameterValueTuple:
+        """Decodes value ids to a parameter-value-tuple. The parameters are ordered like in the
+        parameter-value-matrix.
+
+        Args:
+            value_ids (Iterable[int]): value ids
+
+        Returns:
+            ParameterValueTuple: the parameter-value-tuple or combination, if value ids contains a
+                parameter-value of each parameter
+        """
+        row: ParameterValueTuple = OrderedDict()
+        for value_id in sorted(value_ids):
+            row[self.parameters[self.value_parameter[value_id]]] = self.values[value_id]
+        return row
+
+    def decode_combination(self, value_ids: Sequence[int]) -> Combination:
+        """Decodes value ids to a combination. Same like decode_row() but checks that the
+        combination is complete.
+
+        Args:
+            value_ids (Sequence[int]): value ids
+
+        Raises:
+            ValueError: If the value ids do not contain a parameter-value for each parameter.
+
+        Returns:
+            Combination: the combination
+        """
+        comb = self.decode_row(value_ids)
+        if len(comb) != len(self.parameters):
+            raise ValueError("value ids does not contain a parameter-value for each parameter")
+        return comb
+
+    def decode_pair(self, value_id1: int, value_id2: int) -> ParameterValuePair:
+        """Decodes two value ids to a parameter-value-pair.
+
+        Args:
+            value_id1 (int): value id of the first parameter-value
+            value_id2 (int): value id of the second parameter-value
+
+        Returns:
+            ParameterValuePair: the parameter-value-pair
+        """
+        return ParameterValuePair(self.decode_value(value_id1), self.decode_value(value_id2))
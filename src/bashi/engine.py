@@ -0,0 +1,393 @@
+"""Native pair-wise engine of the bashi library.
+
+The engine replaces the covertable library. It works on integer-encoded parameter-values and
+represents sets of parameter-values as bitsets (Python int), see PairCompatibilityIndex. Each
+combination is build greedy: the engine starts with the uncovered parameter-value-pair, which has
+the most uncovered partners, and adds parameter after parameter the parameter-value, which covers
+the most new parameter-value-pairs. Each partial combination (parameter-value-tuple) is checked
+with the filter function, so the engine supports the same filter rules as the covertable library.
+
+If a partial combination cannot be completed, the engine uses backtracking. Parameter-value-pairs,
+which cannot be part of any valid combination, are skipped instead of raising an exception. The
+backtracking of a single combination is limited. If the limit is reached, the parameter-value-pair
+is skipped too, although a valid combination may exist. Skipped parameter-value-pairs are reported
+with an UncoveredPairsWarning.
+
+Optionally, each parameter-value has a cost, for example the cost of the CI runner, which is
+required by an enabled GPU backend. The cost of a combination is the largest cost of its
+parameter-values. With costs, the engine completes a combination preferably with parameter-values,
+which do not increase the cost of the combination. Therefore, the expensive parameter-values are
+combined with each other instead of making cheap combinations expensive.
+"""
+
+from typing import Iterator, List, Optional, Tuple
+from collections import OrderedDict
+import warnings
+
+from bashi.types import (
+    ParameterValueMatrix,
+    ParameterValueTuple,
+    FilterFunction,
+    CostFunction,
+    Combination,
+)
+from bashi.compatibility import PairCompatibilityIndex
+
+# maximum number of backtracking steps to complete a single combination
+MAX_BACKTRACKING_STEPS: int = 10000
+# maximum number of skipped parameter-value-pairs, which are listed in the UncoveredPairsWarning
+MAX_REPORTED_PAIRS: int = 5
+
+
+class UncoveredPairsWarning(UserWarning):
+    """Warning, that the generated combinations do not contain all valid parameter-value-pairs.
+
+    Use warnings.simplefilter("error", UncoveredPairsWarning) to raise an exception instead.
+    """
+
+
+# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-few-public-methods
+class PairwiseEngine:
+    """Generates combinations which contains all valid parameter-value-pairs of a
+    parameter-value-matrix at least one time.
+
+    Each parameter-value of the parameter-value-matrix is identified by the value id of the
+    EncodedMatrix.
+    """
+
+    def __init__(
+        self,
+        parameter_value_matrix: ParameterValueMatrix,
+        filter_function: FilterFunction,
+        pair_index: Optional[PairCompatibilityIndex] = None,
+        cost_function: Optional[CostFunction] = None,
+        max_backtracking_steps: int = MAX_BACKTRACKING_STEPS,
+    ):
+        """Encode the parameter-value-matrix and check which parameter-value-pairs are allowed by
+        the filter function.
+
+        Args:
+            parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+                parameter-values.
+            filter_function (FilterFunction): Filter function, which decides whether a
+                parameter-value-tuple is valid.
+            pair_index (Optional[PairCompatibilityIndex], optional): Precomputed compatibility of
+                the parameter-value-pairs. Needs to be created from the same parameter-value-matrix
+                and filter function. If None, the index is created. Defaults to None.
+            cost_function (Optional[CostFunction], optional): Returns the cost of a
+                parameter-value. If not None, the engine tries to minimize the sum of the costs of
+                all combinations instead of the number of combinations. Defaults to None.
+            max_backtracking_steps (int, optional): Maximum number of backtracking steps to
+                complete a single combination. Defaults to MAX_BACKTRACKING_STEPS.
+
+        Raises:
+            ValueError: If the pair_index was created from a different parameter-value-matrix.
+        """
+        if pair_index is None:
+            pair_index = PairCompatibilityIndex(parameter_value_matrix, filter_function)
+        elif (
+            pair_index.matrix.parameters != list(parameter_value_matrix.keys())
+            or [
+                param_val
+                for param_vals in parameter_value_matrix.values()
+                for param_val in param_vals
+            ]
+            != pair_index.matrix.values
+        ):
+            raise ValueError("pair_index was created from a different parameter-value-matrix")
+
+        self.filter_function = filter_function
+        self.matrix = pair_index.matrix
+        # bitset of all value ids of a parameter
+        self.parameter_masks: List[int] = [
+            self.matrix.parameter_mask(param_id) for param_id in range(len(self.matrix.parameters))
+        ]
+        # compatible[id] is a bitset of all value ids, which can be combined with id
+        self.compatible: List[int] = pair_index.compatible
+        # uncovered[id] is a bitset of all value ids, which are not combined with id in a
+        # generated combination yet
+        self.uncovered: List[int] = list(pair_index.compatible)
+        # parameter-value-pairs, which cannot be completed to a valid combination
+        self.uncoverable: List[Tuple[int, int]] = []
+        # parameter-value-pairs, which were skipped because the backtracking reached
+        # max_backtracking_steps; a valid combination can exist for them
+        self.unresolved: List[Tuple[int, int]] = []
+        self.max_backtracking_steps = max_backtracking_steps
+        # cost of each value id
+        self.costs: Optional[List[float]] = None
+        if cost_function is not None:
+            self.costs = [
+                cost_function(*self.matrix.decode_value(value_id))
+                for value_id in range(len(self.matrix))
+            ]
+
+    def generate(self) -> Iterator[Combination]:
+        """Generate combinations until all valid parameter-value-pairs are covered. Each
+        combination is returned as soon as it is complete.
+
+        Parameter-value-pairs, which cannot be covered, are stored in uncoverable and unresolved.
+        If there are any, an UncoveredPairsWarning is emitted after the last combination.
+
+        Yields:
+            Combination: the next combination
+        """
+        if 0 in self.parameter_masks:
+            return
+
+        if len(self.matrix.parameters) == 1:
+            # there are no pairs, but each valid parameter-value should be part of a combination
+            for value_id in range(len(self.matrix)):
+                comb: Combination = OrderedDict([self.matrix.decode_value(value_id)])
+                if self.filter_function(comb):
+                    yield comb
+            return
+
+        while True:
+            seed = self._select_seed()
+            if seed is None:
+                break
+
+            row_ids, budget_exhausted = self._build_row(seed)
+            if row_ids is None:
+                self._discard_pair(*seed)
+                if budget_exhausted:
+                    self.unresolved.append(seed)
+                else:
+                    self.uncoverable.append(seed)
+                continue
+
+            self._mark_covered(row_ids)
+            yield self.matrix.decode_combination(row_ids)
+
+        self._warn_uncovered_pairs()
+
+    def add_combination(self, combination: Combination) -> bool:
+        """Add an existing combination, for example of a previous combination-list. If the
+        combination is still valid, all of its parameter-value-pairs are marked as covered and
+        generate() only creates combinations for the remaining parameter-value-pairs.
+
+        Args:
+            combination (Combination): The combination. The order of the parameters can be
+                different from the parameter-value-matrix.
+
+        Returns:
+            bool: True, if the combination was added. False, if the combination does not contain
+                exactly the parameters of the parameter-value-matrix, contains a parameter-value
+                which is not part of the parameter-value-matrix or does not pass the filter
+                function.
+        """
+        if len(combination) != len(self.matrix.parameters):
+            return False
+        try:
+            row_ids = self.matrix.encode_row(combination)
+        except KeyError:
+            return False
+
+        for value_id in row_ids:
+            for partner_id in row_ids:
+                if value_id != partner_id and not self.compatible[value_id] >> partner_id & 1:
+                    return False
+        if not self.filter_function(self.matrix.decode_row(row_ids)):
+            return False
+
+        self._mark_covered(row_ids)
+        return True
+
+    def _select_seed(self) -> Optional[Tuple[int, int]]:
+        """Select the first uncovered parameter-value-pair of the next combination. Takes the
+        parameter-value with the most uncovered partners and it's partner with the most uncovered
+        partners.
+
+        Returns:
+            Optional[Tuple[int, int]]: Global ids of the pair or None, if all pairs are covered.
+        """
+        best_id = -1
+        best_count = 0
+        for value_id, uncovered in enumerate(self.uncovered):
+            count = uncovered.bit_count()
+            if count > best_count:
+                best_id, best_count = value_id, count
+
+        if best_id == -1:
+            return None
+
+        partner_id = -1
+        partner_count = -1
+        for candidate in _iter_bits(self.uncovered[best_id]):
+            count = self.uncovered[candidate].bit_count()
+            if count > partner_count:
+                partner_id, partner_count = candidate, count
+
+        return (best_id, partner_id)
+
+    def _build_row(self, seed: Tuple[int, int]) -> Tuple[Optional[List[int]], bool]:
+        """Complete the seed pair to a full combination.
+
+        Args:
+            seed (Tuple[int, int]): value ids of the seed pair
+
+        Returns:
+            Tuple[Optional[List[int]], bool]: Global ids of the combination or None, if no valid
+                combination was found. The second value is True, if the search was aborted
+                because the backtracking budget was exhausted.
+        """
+        assigned: List[int] = list(seed)
+        row: ParameterValueTuple = OrderedDict(self.matrix.decode_value(v) for v in assigned)
+        if not self.filter_function(row):
+            return None, False
+
+        seed_params = (self.matrix.value_parameter[seed[0]], self.matrix.value_parameter[seed[1]])
+        open_params = [
+            param_id
+            for param_id in range(len(self.matrix.parameters))
+            if param_id not in seed_params
+        ]
+        allowed = self.compatible[seed[0]] & self.compatible[seed[1]]
+
+        budget = [self.max_backtracking_steps]
+        if self._complete_row(assigned, row, allowed, open_params, 0, budget):
+            return assigned, False
+        return None, budget[0] < 0
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _complete_row(
+        self,
+        assigned: List[int],
+        row: ParameterValueTuple,
+        allowed: int,
+        open_params: List[int],
+        depth: int,
+        budget: List[int],
+    ) -> bool:
+        """Assign recursive a parameter-value to each open parameter. Chooses the parameter-value,
+        which covers the most uncovered parameter-value-pairs.
+
+        Args:
+            assigned (List[int]): Global ids of the already assigned parameter-values.
+            row (ParameterValueTuple): Already assigned parameter-values.
+            allowed (int): Bitset of parameter-values, which are compatible with all assigned
+                parameter-values.
+            open_params (List[int]): Parameters, which needs to be assigned.
+            depth (int): Position of the next parameter in open_params.
+            budget (List[int]): Remaining backtracking steps.
+
+        Returns:
+            bool: True if the row could be completed.
+        """
+        if depth == len(open_params):
+            return True
+
+        param_index = open_params[depth]
+        param = self.matrix.parameters[param_index]
+        candidates = self._get_candidates(assigned, self.parameter_masks[param_index] & allowed)
+
+        for candidate in candidates:
+            budget[0] -= 1
+            if budget[0] < 0:
+                return False
+
+            new_allowed = allowed & self.compatible[candidate]
+            # forward checking: each open parameter needs at least one possible parameter-value
+            if any(self.parameter_masks[p] & new_allowed == 0 for p in open_params[depth + 1 :]):
+                continue
+
+            row[param] = self.matrix.values[candidate]
+            if self.filter_function(row):
+                assigned.append(candidate)
+                if self._complete_row(assigned, row, new_allowed, open_params, depth + 1, budget):
+                    return True
+                assigned.pop()
+            del row[param]
+
+        return False
+
+    def _get_candidates(self, assigned: List[int], candidate_mask: int) -> List[int]:
+        """Returns the candidates for the next parameter-value of a partial combination. The
+        candidate, which covers the most uncovered parameter-value-pairs, is the first. If the
+        parameter-values have costs, candidates which do not increase the cost of the combination
+        are preferred.
+
+        Args:
+            assigned (List[int]): Global ids of the already assigned parameter-values.
+            candidate_mask (int): Bitset of the possible parameter-values.
+
+        Returns:
+            List[int]: value ids of the candidates in the order, in which they should be tried
+        """
+        assigned_mask = 0
+        for value_id in assigned:
+            assigned_mask |= 1 << value_id
+
+        candidates = list(_iter_bits(candidate_mask))
+        if self.costs is None:
+            candidates.sort(key=lambda v: -(self.uncovered[v] & assigned_mask).bit_count())
+        else:
+            costs = self.costs
+            row_cost = max(costs[value_id] for value_id in assigned)
+            candidates.sort(
+                key=lambda v: (
+                    max(row_cost, costs[v]),
+                    -(self.uncovered[v] & assigned_mask).bit_count(),
+                )
+            )
+        return candidates
+
+    def _mark_covered(self, row_ids: List[int]):
+        """Mark all parameter-value-pairs of a combination as covered.
+
+        Args:
+            row_ids (List[int]): value ids of the combination
+        """
+        row_mask = 0
+        for value_id in row_ids:
+            row_mask |= 1 << value_id
+        for value_id in row_ids:
+            self.uncovered[value_id] &= ~row_mask
+
+    def _warn_uncovered_pairs(self):
+        """Emit an UncoveredPairsWarning, if parameter-value-pairs were skipped."""
+        if not self.uncoverable and not self.unresolved:
+            return
+
+        def value_str(value_id: int) -> str:
+            param, param_val = self.matrix.decode_value(value_id)
+            return f"{param}={param_val.name}@{param_val.version}"
+
+        skipped = self.uncoverable + self.unresolved
+        examples = ", ".join(
+            f"({value_str(id1)}, {value_str(id2)})" for id1, id2 in skipped[:MAX_REPORTED_PAIRS]
+        )
+        warnings.warn(
+            f"{len(skipped)} valid parameter-value-pairs are not covered: "
+            f"{len(self.uncoverable)} cannot be part of any valid combination and for "
+            f"{len(self.unresolved)} the search was aborted after {self.max_backtracking_steps} "
+            f"backtracking steps. First skipped pairs: {examples}",
+            UncoveredPairsWarning,
+            stacklevel=3,
+        )
+
+    def _discard_pair(self, id1: int, id2: int):
+        """Remove a parameter-value-pair from the uncovered parameter-value-pairs.
+
+        Args:
+            id1 (int): value id of the first parameter-value
+            id2 (int): value id of the second parameter-value
+        """
+        self.uncovered[id1] &= ~(1 << id2)
+        self.uncovered[id2] &= ~(1 << id1)
+
+
+def _iter_bits(bitset: int) -> Iterator[int]:
+    """Iterate over the positions of all set bits, starting with the lowest bit.
+
+    Args:
+        bitset (int): the bitset
+
+    Yields:
+        int: position of a set bit
+    """
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
@@ -1,16 +1,254 @@
 """Contains default filter chain and avoids circular import"""
 
-from typeguard import typechecked
-from bashi.types import FilterFunction
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence
+from collections import OrderedDict
+import json
+from bashi.typecheck import typechecked
+from bashi.types import FilterFunction, ParameterValueTuple
 
-from bashi.filter_compiler import compiler_filter
-from bashi.filter_backend import backend_filter
-from bashi.filter_software_dependency import software_dependency_filter
+from bashi.filter_compiler import compiler_filter, COMPILER_RULES
+from bashi.filter_backend import backend_filter, BACKEND_RULES
+from bashi.filter_software_dependency import software_dependency_filter, SOFTWARE_DEPENDENCY_RULES
+from bashi.rules import Rule, RuleFilterFunction, RuleProfiler, RuleSet
+
+# default number of parameter-value-tuples, which are stored by the MemoizedFilterChain
+DEFAULT_FILTER_CACHE_SIZE: int = 2**16
+# default number of parameter-value-tuples, which are used by the AdaptiveFilterChain to determine
+# the rule order
+DEFAULT_WARM_UP_SIZE: int = 2**12
+
+FilterCacheInfo = NamedTuple(
+    "FilterCacheInfo", [("hits", int), ("misses", int), ("maxsize", int), ("currsize", int)]
+)
+
+
+class MemoizedFilterChain:
+    """Wraps a filter function and stores the results of the last called parameter-value-tuples in
+    a least recently used (LRU) cache.
+
+    The pair-wise algorithms call the filter function multiple times with the same
+    parameter-value-tuple or with growing prefixes of the same parameter-value-tuple. Because the
+    result of a filter function does not depend on the order of the parameters, the cache key is
+    the set of parameter and parameter-value items. Therefore the cache also hits if the same
+    parameter-values are passed in a different order.
+    """
+
+    def __init__(self, filter_function: FilterFunction, maxsize: int = DEFAULT_FILTER_CACHE_SIZE):
+        """Create the cache.
+
+        Args:
+            filter_function (FilterFunction): The filter function, which is memoized.
+            maxsize (int, optional): Maximum number of stored parameter-value-tuples. Defaults to
+                DEFAULT_FILTER_CACHE_SIZE.
+
+        Raises:
+            ValueError: If maxsize is smaller than 1.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize needs to be at least 1: {maxsize}")
+        self.filter_function = filter_function
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[Hashable, bool] = OrderedDict()
+
+    def __call__(self, row: ParameterValueTuple) -> bool:
+        """Returns the stored result for the parameter-value-tuple or calls the filter function.
+
+        Args:
+            row (ParameterValueTuple): parameter-value-tuple to check
+
+        Returns:
+            bool: the result of the filter function
+        """
+        key = frozenset(row.items())
+        result = self._cache.get(key)
+        if result is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = bool(self.filter_function(row))
+        self._cache[key] = result
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> FilterCacheInfo:
+        """Returns the statistics of the cache.
+
+        Returns:
+            FilterCacheInfo: number of cache hits, cache misses, the maximum size and the current
+                size of the cache
+        """
+        return FilterCacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """Remove all stored results and reset the statistics."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class AdaptiveFilterChain:  # pylint: disable=too-many-instance-attributes
+    """Evaluates the rules of all bashi filter functions in the order of their selectivity.
+
+    During the warm-up, each parameter-value-tuple is checked by all applicable rules and the
+    number of rejections of each rule identifier is counted. Evaluating all rules avoids that a
+    rule, which is evaluated early, hides the rejections of later rules. After warm_up_size
+    parameter-value-tuples, the rule order is frozen: rules with more rejections are evaluated
+    first. Rules with the same number of rejections keep the default order. The rule order depends
+    only on the checked parameter-value-tuples and not on the time, therefore it is deterministic.
+
+    The result of the filter chain does not depend on the rule order. The custom filter function is
+    always evaluated last.
+    """
+
+    def __init__(
+        self,
+        custom_filter_function: FilterFunction = lambda _: True,
+        warm_up_size: int = DEFAULT_WARM_UP_SIZE,
+        rule_order: Optional[Sequence[str]] = None,
+    ):
+        """Create the filter chain.
+
+        Args:
+            custom_filter_function (FilterFunction, optional): Custom filter function, which is
+                evaluated after the bashi rules. Defaults to lambda _: True.
+            warm_up_size (int, optional): Number of parameter-value-tuples, which are used to count
+                the rejections. Defaults to DEFAULT_WARM_UP_SIZE.
+            rule_order (Optional[Sequence[str]], optional): If not None, the warm-up is skipped and
+                the rules are evaluated in the given order of rule identifiers, for example loaded
+                with load_rule_order(). Rules, whose identifier is not part of the sequence, are
+                evaluated afterwards in the default order. Defaults to None.
+
+        Raises:
+            ValueError: If warm_up_size is smaller than 1 or rule_order contains an unknown rule
+                identifier.
+        """
+        if warm_up_size < 1:
+            raise ValueError(f"warm_up_size needs to be at least 1: {warm_up_size}")
+        self.custom_filter_function = custom_filter_function
+        self.warm_up_size = warm_up_size
+        self.warm_up_rows = 0
+        self.rejections: Dict[str, int] = {}
+        # rules of all bashi filter functions in the default order
+        self._rules: List[Rule] = [
+            rule
+            for rule_set in (COMPILER_RULES, BACKEND_RULES, SOFTWARE_DEPENDENCY_RULES)
+            for rule in rule_set.rules
+        ]
+        self._default_order: List[str] = list(dict.fromkeys(rule.rule_id for rule in self._rules))
+        self._rule_order: Optional[List[str]] = None
+        self._filter_function: Optional[RuleFilterFunction] = None
+        if rule_order is not None:
+            self.freeze(rule_order)
+
+    @property
+    def frozen(self) -> bool:
+        """True, if the rule order is fixed."""
+        return self._rule_order is not None
+
+    @property
+    def rule_order(self) -> List[str]:
+        """The rule identifiers in the order of evaluation. Before the rule order is frozen, it is
+        the order, which would be used if the warm-up ended now."""
+        if self._rule_order is not None:
+            return list(self._rule_order)
+        return sorted(self._default_order, key=lambda rule_id: -self.rejections.get(rule_id, 0))
+
+    def freeze(self, rule_order: Optional[Sequence[str]] = None):
+        """Ends the warm-up and fixes the rule order.
+
+        Args:
+            rule_order (Optional[Sequence[str]], optional): Order of the rule identifiers. If
+                None, the order is determined by the number of rejections counted so far. Defaults
+                to None.
+
+        Raises:
+            ValueError: If rule_order contains an unknown rule identifier.
+        """
+        if rule_order is None:
+            rule_order = self.rule_order
+        for rule_id in rule_order:
+            if rule_id not in self._default_order:
+                raise ValueError(f"unknown rule identifier: {rule_id}")
+        position = {rule_id: index for index, rule_id in enumerate(rule_order)}
+        self._rule_order = list(rule_order) + [
+            rule_id for rule_id in self._default_order if rule_id not in position
+        ]
+        position = {rule_id: index for index, rule_id in enumerate(self._rule_order)}
+
+        rule_set = RuleSet()
+        # the sort is stable, therefore rules with the same identifier keep their order
+        for rule in sorted(self._rules, key=lambda rule: position[rule.rule_id]):
+            rule_set.add(rule.rule_id, rule.parameters, rule.predicate)
+        self._filter_function = rule_set.make_filter()
+
+    def save_rule_order(self, path: str):
+        """Writes the rule order and the counted rejections in a JSON file, which can be loaded
+        with load_rule_order().
+
+        Args:
+            path (str): path of the profile file
+        """
+        with open(path, "w", encoding="utf-8") as profile_file:
+            json.dump(
+                {"rule_order": self.rule_order, "rejections": self.rejections},
+                profile_file,
+                indent=2,
+            )
+
+    def __call__(self, row: ParameterValueTuple) -> bool:
+        """Check if the parameter-value-tuple passes all bashi rules and the custom filter function.
+
+        Args:
+            row (ParameterValueTuple): parameter-value-tuple to check
+
+        Returns:
+            bool: True, if the parameter-value-tuple is valid
+        """
+        if self._filter_function is not None:
+            return self._filter_function(row, None) and self.custom_filter_function(row)
+
+        passed = True
+        for rule in self._rules:
+            for param in rule.parameters:
+                if param not in row:
+                    break
+            else:
+                if not rule.predicate(row, None):
+                    self.rejections[rule.rule_id] = self.rejections.get(rule.rule_id, 0) + 1
+                    passed = False
+
+        self.warm_up_rows += 1
+        if self.warm_up_rows >= self.warm_up_size:
+            self.freeze()
+
+        return passed and self.custom_filter_function(row)
+
+
+def load_rule_order(path: str) -> List[str]:
+    """Loads the rule order from a profile file written by AdaptiveFilterChain.save_rule_order().
+
+    Args:
+        path (str): path of the profile file
+
+    Returns:
+        List[str]: the rule identifiers in the order of evaluation
+    """
+    with open(path, "r", encoding="utf-8") as profile_file:
+        return list(json.load(profile_file)["rule_order"])
 
 
 @typechecked
 def get_default_filter_chain(
     custom_filter_function: FilterFunction = lambda _: True,
+    memoize_size: Optional[int] = None,
+    rule_profiler: Optional[RuleProfiler] = None,
+    adaptive_warm_up: Optional[int] = None,
+    rule_order: Optional[Sequence[str]] = None,
 ) -> FilterFunction:
     """Concatenate the bashi filter functions in the default order and return them as one function
     with a single entry point.
@@ -19,13 +257,70 @@ def get_default_filter_chain(
         custom_filter_function (FilterFunction): This function is added as the last filter level and
             allows the user to add custom filter rules without having to create the entire filter
             chain from scratch. Defaults to lambda_:True.
+        memoize_size (Optional[int]): If not None, the filter chain is wrapped in a
+            MemoizedFilterChain, which stores the results of the last memoize_size
+            parameter-value-tuples. The hit and miss statistics can be requested via
+            cache_info(). Defaults to None.
+        rule_profiler (Optional[RuleProfiler]): If not None, the bashi filter functions record the
+            number of evaluations, the number of rejections and the evaluation time of each rule
+            in the profiler. Defaults to None.
+        adaptive_warm_up (Optional[int]): If not None, returns an AdaptiveFilterChain, which
+            evaluates the rules of the first adaptive_warm_up parameter-value-tuples to count the
+            rejections of each rule. Afterwards, the rules with the most rejections are evaluated
+            first. Defaults to None.
+        rule_order (Optional[Sequence[str]]): If not None, returns an AdaptiveFilterChain, which
+            evaluates the rules in the given order of rule identifiers without warm-up. The order
+            can be loaded from a profile file with load_rule_order(). Defaults to None.
+
+    Raises:
+        ValueError: If rule_profiler is used together with adaptive_warm_up or rule_order.
 
     Returns:
         FilterFunction: The filter function chain, which can be directly used in bashi.FilterAdapter
     """
-    return (
+    filter_chain: FilterFunction = (
         lambda row: compiler_filter(row)
         and backend_filter(row)
         and software_dependency_filter(row)
         and custom_filter_function(row)
     )
+    if rule_profiler is not None:
+        if adaptive_warm_up is not None or rule_order is not None:
+            raise ValueError("rule_profiler cannot be combined with adaptive_warm_up or rule_order")
+        filter_chain = _get_profiled_filter_chain(custom_filter_function, rule_profiler)
+    elif adaptive_warm_up is not None or rule_order is not None:
+        filter_chain = AdaptiveFilterChain(
+            custom_filter_function,
+            DEFAULT_WARM_UP_SIZE if adaptive_warm_up is None else adaptive_warm_up,
+            rule_order,
+        )
+
+    if memoize_size is not None:
+        return MemoizedFilterChain(filter_chain, memoize_size)
+    return filter_chain
+
+
+def _get_profiled_filter_chain(
+    custom_filter_function: FilterFunction, rule_profiler: RuleProfiler
+) -> FilterFunction:
+    """Same like the default filter chain, but the rules records their statistics in the profiler.
+
+    Args:
+        custom_filter_function (FilterFunction): custom filter function, which is not profiled
+        rule_profiler (RuleProfiler): stores the statistics of each rule
+
+    Returns:
+        FilterFunction: the profiled filter chain
+    """
+    profiled_filters = [
+        rule_set.make_filter(rule_profiler)
+        for rule_set in (COMPILER_RULES, BACKEND_RULES, SOFTWARE_DEPENDENCY_RULES)
+    ]
+
+    def filter_chain(row: ParameterValueTuple) -> bool:
+        for profiled_filter in profiled_filters:
+            if not profiled_filter(row, None):
+                return False
+        return custom_filter_function(row)
+
+    return filter_chain
@@ -8,16 +8,317 @@ which rule.
 """
 
 from typing import Optional, IO
-import packaging.version as pkv
-from typeguard import typechecked
+from bashi.typecheck import typechecked
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
-from bashi.types import ParameterValueTuple
-from bashi.versions import NVCC_GCC_MAX_VERSION, NVCC_CLANG_MAX_VERSION, CLANG_CUDA_MAX_CUDA_VERSION
+from bashi.types import Parameter, ParameterValueTuple
+from bashi.versions import (
+    NVCC_GCC_MAX_VERSION,
+    NVCC_CLANG_MAX_VERSION,
+    CLANG_CUDA_MAX_CUDA_VERSION,
+    NVCC_CLANG_DISABLED_MIN_VERSION,
+    NVCC_CLANG_DISABLED_MAX_VERSION,
+    CLANG_CUDA_MIN_VERSION,
+    UBUNTU_ROCM_MIN_VERSION,
+)
 from bashi.utils import reason
+from bashi.rules import RuleSet
 
 # uncomment me for debugging
 # from bashi.utils import print_row_nice
 
+# all rules of compiler_filter() in the order of evaluation
+COMPILER_RULES = RuleSet()
+
+
+@COMPILER_RULES.rule("c1", HOST_COMPILER)
+def _c1(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    # NVCC as HOST_COMPILER is not allow
+    # this rule will be never used, because of an implementation detail of the covertable library
+    # it is not possible to add NVCC as HOST_COMPILER and filter out afterwards
+    # this rule is only used by bashi-verify
+    if row[HOST_COMPILER].name == NVCC:
+        reason(output, "nvcc is not allowed as host compiler")
+        return False
+    return True
+
+
+@COMPILER_RULES.rule("c2", HOST_COMPILER, DEVICE_COMPILER)
+def _c2(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    # related to rule c13
+    if NVCC in (row[HOST_COMPILER].name, row[DEVICE_COMPILER].name) and row[
+        HOST_COMPILER
+    ].name not in (GCC, CLANG):
+        reason(output, "only gcc and clang are allowed as nvcc host compiler")
+        return False
+    return True
+
+
+@COMPILER_RULES.rule("c3", HOST_COMPILER, DEVICE_COMPILER)
+def _c3(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    if (
+        NVCC not in (row[HOST_COMPILER].name, row[DEVICE_COMPILER].name)
+        and row[HOST_COMPILER].name != row[DEVICE_COMPILER].name
+    ):
+        reason(output, "host and device compiler name must be the same (except for nvcc)")
+        return False
+    return True
+
+
+@COMPILER_RULES.rule("c4", HOST_COMPILER, DEVICE_COMPILER)
+def _c4(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    if (
+        NVCC not in (row[HOST_COMPILER].name, row[DEVICE_COMPILER].name)
+        and row[HOST_COMPILER].version != row[DEVICE_COMPILER].version
+    ):
+        reason(
+            output,
+            "host and device compiler version must be the same (except for nvcc)",
+        )
+        return False
+    return True
+
+
+@COMPILER_RULES.rule("c5", HOST_COMPILER, DEVICE_COMPILER)
+def _c5(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    # related to rule b10
+    # remove all unsupported nvcc gcc version combinations
+    # define which is the latest supported gcc compiler for a nvcc version
+    if row[DEVICE_COMPILER].name != NVCC or row[HOST_COMPILER].name != GCC:
+        return True
+
+    # if a nvcc version is not supported by bashi, assume that the version supports the
+    # latest gcc compiler version
+    if row[DEVICE_COMPILER].version <= NVCC_GCC_MAX_VERSION[0].nvcc:
+        # check the maximum supported gcc version for the given nvcc version
+        for nvcc_gcc_comb in NVCC_GCC_MAX_VERSION:
+            if row[DEVICE_COMPILER].version >= nvcc_gcc_comb.nvcc:
+                if row[HOST_COMPILER].version > nvcc_gcc_comb.host:
+                    reason(
+                        output,
+                        f"nvcc {row[DEVICE_COMPILER].version} "
+                        f"does not support gcc {row[HOST_COMPILER].version}",
+                    )
+                    return False
+                break
+    return True
+
+
+@COMPILER_RULES.rule("c7", HOST_COMPILER, DEVICE_COMPILER)
+def _c7(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    # related to rule b11
+    if (
+        row[DEVICE_COMPILER].name == NVCC
+        and row[HOST_COMPILER].name == CLANG
+        and row[DEVICE_COMPILER].version >= NVCC_CLANG_DISABLED_MIN_VERSION
+        and row[DEVICE_COMPILER].version <= NVCC_CLANG_DISABLED_MAX_VERSION
+    ):
+        reason(
+            output,
+            "clang as host compiler is disabled for nvcc 11.3 to 11.5",
+        )
+        return False
+    return True
+
+
+@COMPILER_RULES.rule("c6", HOST_COMPILER, DEVICE_COMPILER)
+def _c6(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    # related to rule b12
+    # remove all unsupported nvcc clang version combinations
+    # define which is the latest supported clang compiler for a nvcc version
+    if row[DEVICE_COMPILER].name != NVCC or row[HOST_COMPILER].name != CLANG:
+        return True
+
+    # if a nvcc version is not supported by bashi, assume that the version supports the
+    # latest clang compiler version
+    if row[DEVICE_COMPILER].version <= NVCC_CLANG_MAX_VERSION[0].nvcc:
+        # check the maximum supported gcc version for the given nvcc version
+        for nvcc_clang_comb in NVCC_CLANG_MAX_VERSION:
+            if row[DEVICE_COMPILER].version >= nvcc_clang_comb.nvcc:
+                if row[HOST_COMPILER].version > nvcc_clang_comb.host:
+                    reason(
+                        output,
+                        f"nvcc {row[DEVICE_COMPILER].version} "
+                        f"does not support clang {row[HOST_COMPILER].version}",
+                    )
+                    return False
+                break
+    return True
+
+
+@COMPILER_RULES.rule("c15", DEVICE_COMPILER, ALPAKA_ACC_GPU_CUDA_ENABLE)
+def _c15_nvcc(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    # related to rule b9
+    if (
+        row[DEVICE_COMPILER].name == NVCC
+        and row[ALPAKA_ACC_GPU_CUDA_ENABLE].version != row[DEVICE_COMPILER].version
+    ):
+        reason(output, "nvcc and CUDA backend needs to have the same version")
+        return False
+    return True
+
+
+@COMPILER_RULES.rule("c16", DEVICE_COMPILER, ALPAKA_ACC_GPU_HIP_ENABLE)
+def _c16_nvcc(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    # related to rule b14
+    if row[DEVICE_COMPILER].name == NVCC and row[ALPAKA_ACC_GPU_HIP_ENABLE].version != OFF_VER:
+        reason(output, "nvcc does not support the HIP backend.")
+        return False
+    return True
+
+
+@COMPILER_RULES.rule("c17", DEVICE_COMPILER, ALPAKA_ACC_SYCL_ENABLE)
+def _c17_nvcc(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    # related to rule b15
+    if row[DEVICE_COMPILER].name == NVCC and row[ALPAKA_ACC_SYCL_ENABLE].version != OFF_VER:
+        reason(output, "nvcc does not support the SYCL backend.")
+        return False
+    return True
+
+
+def _add_clang_cuda_version_rule(compiler: Parameter):
+    """Adds rule c8 for the host or device compiler.
+
+    Args:
+        compiler (Parameter): HOST_COMPILER or DEVICE_COMPILER
+    """
+
+    @COMPILER_RULES.rule("c8", compiler)
+    def _c8(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b11
+        # clang-cuda 13 and older is not supported
+        # this rule will be never used, because of an implementation detail of the covertable
+        # library it is not possible to add the clang-cuda versions and filter it out afterwards
+        # this rule is only used by bashi-verify
+        if row[compiler].name == CLANG_CUDA and row[compiler].version < CLANG_CUDA_MIN_VERSION:
+            reason(output, "all clang versions older than 14 are disabled as CUDA Compiler")
+            return False
+        return True
+
+
+# pylint: disable=too-many-locals
+def _add_compiler_backend_rules(compiler: Parameter):
+    """Adds the rules c9 to c19, which are checked for the host and the device compiler.
+
+    Args:
+        compiler (Parameter): HOST_COMPILER or DEVICE_COMPILER
+    """
+
+    @COMPILER_RULES.rule("c9", compiler, ALPAKA_ACC_GPU_HIP_ENABLE)
+    def _c9(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b1
+        if row[compiler].name == HIPCC and row[ALPAKA_ACC_GPU_HIP_ENABLE].version == OFF_VER:
+            reason(output, "hipcc requires an enabled HIP backend.")
+            return False
+        return True
+
+    @COMPILER_RULES.rule("c10", compiler, ALPAKA_ACC_SYCL_ENABLE)
+    def _c10(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b2
+        if row[compiler].name == HIPCC and row[ALPAKA_ACC_SYCL_ENABLE].version != OFF_VER:
+            reason(output, "hipcc does not support the SYCL backend.")
+            return False
+        return True
+
+    @COMPILER_RULES.rule("c11", compiler, ALPAKA_ACC_GPU_CUDA_ENABLE)
+    def _c11(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b2
+        if row[compiler].name == HIPCC and row[ALPAKA_ACC_GPU_CUDA_ENABLE].version != OFF_VER:
+            reason(output, "hipcc does not support the CUDA backend.")
+            return False
+        return True
+
+    @COMPILER_RULES.rule("c19", compiler, UBUNTU)
+    def _c19(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # all ROCm images are Ubuntu 20.04 based or newer
+        # related to rule d3
+        if row[compiler].name == HIPCC and row[UBUNTU].version < UBUNTU_ROCM_MIN_VERSION:
+            reason(
+                output,
+                "ROCm and also the hipcc compiler is not available on Ubuntu older than 20.04",
+            )
+            return False
+        return True
+
+    @COMPILER_RULES.rule("c12", compiler, ALPAKA_ACC_SYCL_ENABLE)
+    def _c12(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b4
+        if row[compiler].name == ICPX and row[ALPAKA_ACC_SYCL_ENABLE].version == OFF_VER:
+            reason(output, "icpx requires an enabled SYCL backend.")
+            return False
+        return True
+
+    @COMPILER_RULES.rule("c13", compiler, ALPAKA_ACC_GPU_HIP_ENABLE)
+    def _c13(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b5
+        if row[compiler].name == ICPX and row[ALPAKA_ACC_GPU_HIP_ENABLE].version != OFF_VER:
+            reason(output, "icpx does not support the HIP backend.")
+            return False
+        return True
+
+    @COMPILER_RULES.rule("c14", compiler, ALPAKA_ACC_GPU_CUDA_ENABLE)
+    def _c14(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b6
+        if row[compiler].name == ICPX and row[ALPAKA_ACC_GPU_CUDA_ENABLE].version != OFF_VER:
+            reason(output, "icpx does not support the CUDA backend.")
+            return False
+        return True
+
+    @COMPILER_RULES.rule("c15", compiler, ALPAKA_ACC_GPU_CUDA_ENABLE)
+    def _c15(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b16
+        if row[compiler].name == CLANG_CUDA and row[ALPAKA_ACC_GPU_CUDA_ENABLE].version == OFF_VER:
+            reason(output, "clang-cuda requires an enabled CUDA backend.")
+            return False
+        return True
+
+    @COMPILER_RULES.rule("c16", compiler, ALPAKA_ACC_GPU_CUDA_ENABLE)
+    def _c16(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b17
+        if row[compiler].name != CLANG_CUDA or row[ALPAKA_ACC_GPU_CUDA_ENABLE].version == OFF_VER:
+            return True
+
+        # if a clang-cuda version is newer than the latest known clang-cuda version,
+        # we needs to assume that it supports every CUDA SDK version
+        # pylint: disable=duplicate-code
+        if row[compiler].version <= CLANG_CUDA_MAX_CUDA_VERSION[0].clang_cuda:
+            # check if know clang-cuda version supports CUDA SDK version
+            for version_combination in CLANG_CUDA_MAX_CUDA_VERSION:
+                if row[compiler].version >= version_combination.clang_cuda:
+                    if row[ALPAKA_ACC_GPU_CUDA_ENABLE].version > version_combination.cuda:
+                        reason(
+                            output,
+                            f"clang-cuda {row[compiler].version} does not support "
+                            f"CUDA {row[ALPAKA_ACC_GPU_CUDA_ENABLE].version}.",
+                        )
+                        return False
+                    break
+        return True
+
+    @COMPILER_RULES.rule("c17", compiler, ALPAKA_ACC_GPU_HIP_ENABLE)
+    def _c17(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b14
+        if row[compiler].name == CLANG_CUDA and row[ALPAKA_ACC_GPU_HIP_ENABLE].version != OFF_VER:
+            reason(output, "clang-cuda does not support the HIP backend.")
+            return False
+        return True
+
+    @COMPILER_RULES.rule("c18", compiler, ALPAKA_ACC_SYCL_ENABLE)
+    def _c18(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # related to rule b15
+        if row[compiler].name == CLANG_CUDA and row[ALPAKA_ACC_SYCL_ENABLE].version != OFF_VER:
+            reason(output, "clang-cuda does not support the SYCL backend.")
+            return False
+        return True
+
+
+for _compiler in (HOST_COMPILER, DEVICE_COMPILER):
+    _add_clang_cuda_version_rule(_compiler)
+
+for _compiler in (HOST_COMPILER, DEVICE_COMPILER):
+    _add_compiler_backend_rules(_compiler)
+
+_compiler_filter = COMPILER_RULES.make_filter()
+
 
 @typechecked
 def compiler_filter_typechecked(
@@ -30,14 +331,12 @@ def compiler_filter_typechecked(
     return compiler_filter(row, output)
 
 
-# pylint: disable=too-many-branches
-# pylint: disable=too-many-return-statements
-# pylint: disable=too-many-statements
 def compiler_filter(
     row: ParameterValueTuple,
     output: Optional[IO[str]] = None,
 ) -> bool:
-    """Filter rules basing on host and device compiler names and versions.
+    """Filter rules basing on host and device compiler names and versions. The rules are defined
+    in COMPILER_RULES.
 
     Args:
         row (ParameterValueTuple): parameter-value-tuple to verify.
@@ -51,233 +350,4 @@ def compiler_filter(
     # uncomment me for debugging
     # print_row_nice(row, bashi_validate=False)
 
-    # Rule: c1
-    # NVCC as HOST_COMPILER is not allow
-    # this rule will be never used, because of an implementation detail of the covertable library
-    # it is not possible to add NVCC as HOST_COMPILER and filter out afterwards
-    # this rule is only used by bashi-verify
-    if HOST_COMPILER in row and row[HOST_COMPILER].name == NVCC:
-        reason(output, "nvcc is not allowed as host compiler")
-        return False
-
-    if HOST_COMPILER in row and DEVICE_COMPILER in row:
-        if NVCC in (row[HOST_COMPILER].name, row[DEVICE_COMPILER].name):
-            # Rule: c2
-            # related to rule c13
-            if row[HOST_COMPILER].name not in (GCC, CLANG):
-                reason(output, "only gcc and clang are allowed as nvcc host compiler")
-                return False
-        else:
-            # Rule: c3
-            if row[HOST_COMPILER].name != row[DEVICE_COMPILER].name:
-                reason(output, "host and device compiler name must be the same (except for nvcc)")
-                return False
-
-            # Rule: c4
-            if row[HOST_COMPILER].version != row[DEVICE_COMPILER].version:
-                reason(
-                    output,
-                    "host and device compiler version must be the same (except for nvcc)",
-                )
-                return False
-
-    # now idea, how remove nested blocks without hitting the performance
-    # pylint: disable=too-many-nested-blocks
-    if DEVICE_COMPILER in row and row[DEVICE_COMPILER].name == NVCC:
-        if HOST_COMPILER in row and row[HOST_COMPILER].name == GCC:
-            # Rule: c5
-            # related to rule b10
-            # remove all unsupported nvcc gcc version combinations
-            # define which is the latest supported gcc compiler for a nvcc version
-
-            # if a nvcc version is not supported by bashi, assume that the version supports the
-            # latest gcc compiler version
-            if row[DEVICE_COMPILER].version <= NVCC_GCC_MAX_VERSION[0].nvcc:
-                # check the maximum supported gcc version for the given nvcc version
-                for nvcc_gcc_comb in NVCC_GCC_MAX_VERSION:
-                    if row[DEVICE_COMPILER].version >= nvcc_gcc_comb.nvcc:
-                        if row[HOST_COMPILER].version > nvcc_gcc_comb.host:
-                            reason(
-                                output,
-                                f"nvcc {row[DEVICE_COMPILER].version} "
-                                f"does not support gcc {row[HOST_COMPILER].version}",
-                            )
-                            return False
-                        break
-
-        if HOST_COMPILER in row and row[HOST_COMPILER].name == CLANG:
-            # Rule: c7
-            # related to rule b11
-            if row[DEVICE_COMPILER].version >= pkv.parse("11.3") and row[
-                DEVICE_COMPILER
-            ].version <= pkv.parse("11.5"):
-                reason(
-                    output,
-                    "clang as host compiler is disabled for nvcc 11.3 to 11.5",
-                )
-                return False
-
-            # Rule: c6
-            # related to rule b12
-            # remove all unsupported nvcc clang version combinations
-            # define which is the latest supported clang compiler for a nvcc version
-
-            # if a nvcc version is not supported by bashi, assume that the version supports the
-            # latest clang compiler version
-            if row[DEVICE_COMPILER].version <= NVCC_CLANG_MAX_VERSION[0].nvcc:
-                # check the maximum supported gcc version for the given nvcc version
-                for nvcc_clang_comb in NVCC_CLANG_MAX_VERSION:
-                    if row[DEVICE_COMPILER].version >= nvcc_clang_comb.nvcc:
-                        if row[HOST_COMPILER].version > nvcc_clang_comb.host:
-                            reason(
-                                output,
-                                f"nvcc {row[DEVICE_COMPILER].version} "
-                                f"does not support clang {row[HOST_COMPILER].version}",
-                            )
-                            return False
-                        break
-
-        # Rule: c15
-        # related to rule b9
-        if (
-            ALPAKA_ACC_GPU_CUDA_ENABLE in row
-            and row[ALPAKA_ACC_GPU_CUDA_ENABLE].version != row[DEVICE_COMPILER].version
-        ):
-            reason(output, "nvcc and CUDA backend needs to have the same version")
-            return False
-
-        # Rule: c16
-        # related to rule b14
-        if ALPAKA_ACC_GPU_HIP_ENABLE in row and row[ALPAKA_ACC_GPU_HIP_ENABLE].version != OFF_VER:
-            reason(output, "nvcc does not support the HIP backend.")
-            return False
-
-        # Rule: c17
-        # related to rule b15
-        if ALPAKA_ACC_SYCL_ENABLE in row and row[ALPAKA_ACC_SYCL_ENABLE].version != OFF_VER:
-            reason(output, "nvcc does not support the SYCL backend.")
-            return False
-
-    # Rule: c8
-    # related to rule b11
-    # clang-cuda 13 and older is not supported
-    # this rule will be never used, because of an implementation detail of the covertable library
-    # it is not possible to add the clang-cuda versions and filter it out afterwards
-    # this rule is only used by bashi-verify
-    for compiler in (HOST_COMPILER, DEVICE_COMPILER):
-        if (
-            compiler in row
-            and row[compiler].name == CLANG_CUDA
-            and row[compiler].version < pkv.parse("14")
-        ):
-            reason(output, "all clang versions older than 14 are disabled as CUDA Compiler")
-            return False
-
-    for compiler in (HOST_COMPILER, DEVICE_COMPILER):
-        if compiler in row and row[compiler].name == HIPCC:
-            # Rule: c9
-            # related to rule b1
-            if (
-                ALPAKA_ACC_GPU_HIP_ENABLE in row
-                and row[ALPAKA_ACC_GPU_HIP_ENABLE].version == OFF_VER
-            ):
-                reason(output, "hipcc requires an enabled HIP backend.")
-                return False
-
-            # Rule: c10
-            # related to rule b2
-            if ALPAKA_ACC_SYCL_ENABLE in row and row[ALPAKA_ACC_SYCL_ENABLE].version != OFF_VER:
-                reason(output, "hipcc does not support the SYCL backend.")
-                return False
-
-            # Rule: c11
-            # related to rule b2
-            if (
-                ALPAKA_ACC_GPU_CUDA_ENABLE in row
-                and row[ALPAKA_ACC_GPU_CUDA_ENABLE].version != OFF_VER
-            ):
-                reason(output, "hipcc does not support the CUDA backend.")
-                return False
-            # Rule: c19
-            # all ROCm images are Ubuntu 20.04 based or newer
-            # related to rule d3
-            if UBUNTU in row and row[UBUNTU].version < pkv.parse("20.04"):
-                reason(
-                    output,
-                    "ROCm and also the hipcc compiler is not available on Ubuntu older than 20.04",
-                )
-                return False
-
-        if compiler in row and row[compiler].name == ICPX:
-            # Rule: c12
-            # related to rule b4
-            if ALPAKA_ACC_SYCL_ENABLE in row and row[ALPAKA_ACC_SYCL_ENABLE].version == OFF_VER:
-                reason(output, "icpx requires an enabled SYCL backend.")
-                return False
-
-            # Rule: c13
-            # related to rule b5
-            if (
-                ALPAKA_ACC_GPU_HIP_ENABLE in row
-                and row[ALPAKA_ACC_GPU_HIP_ENABLE].version != OFF_VER
-            ):
-                reason(output, "icpx does not support the HIP backend.")
-                return False
-
-            # Rule: c14
-            # related to rule b6
-            if (
-                ALPAKA_ACC_GPU_CUDA_ENABLE in row
-                and row[ALPAKA_ACC_GPU_CUDA_ENABLE].version != OFF_VER
-            ):
-                reason(output, "icpx does not support the CUDA backend.")
-                return False
-
-        if compiler in row and row[compiler].name == CLANG_CUDA:
-            # Rule: c15
-            # related to rule b16
-            if (
-                ALPAKA_ACC_GPU_CUDA_ENABLE in row
-                and row[ALPAKA_ACC_GPU_CUDA_ENABLE].version == OFF_VER
-            ):
-                reason(output, "clang-cuda requires an enabled CUDA backend.")
-                return False
-
-            if (
-                ALPAKA_ACC_GPU_CUDA_ENABLE in row
-                and row[ALPAKA_ACC_GPU_CUDA_ENABLE].version != OFF_VER
-            ):
-                # Rule: c16
-                # related to rule b17
-                # if a clang-cuda version is newer than the latest known clang-cuda version,
-                # we needs to assume that it supports every CUDA SDK version
-                # pylint: disable=duplicate-code
-                if row[compiler].version <= CLANG_CUDA_MAX_CUDA_VERSION[0].clang_cuda:
-                    # check if know clang-cuda version supports CUDA SDK version
-                    for version_combination in CLANG_CUDA_MAX_CUDA_VERSION:
-                        if row[compiler].version >= version_combination.clang_cuda:
-                            if row[ALPAKA_ACC_GPU_CUDA_ENABLE].version > version_combination.cuda:
-                                reason(
-                                    output,
-                                    f"clang-cuda {row[compiler].version} does not support "
-                                    f"CUDA {row[ALPAKA_ACC_GPU_CUDA_ENABLE].version}.",
-                                )
-                                return False
-                            break
-
-            # Rule: c17
-            # related to rule b14
-            if (
-                ALPAKA_ACC_GPU_HIP_ENABLE in row
-                and row[ALPAKA_ACC_GPU_HIP_ENABLE].version != OFF_VER
-            ):
-                reason(output, "clang-cuda does not support the HIP backend.")
-                return False
-
-            # Rule: c18
-            # related to rule b15
-            if ALPAKA_ACC_SYCL_ENABLE in row and row[ALPAKA_ACC_SYCL_ENABLE].version != OFF_VER:
-                reason(output, "clang-cuda does not support the SYCL backend.")
-                return False
-
-    return True
+    return _compiler_filter(row, output)
@@ -0,0 +1,90 @@
+"""Incremental evaluation of the bashi filter chain.
+
+The pair-wise algorithms build a combination parameter by parameter and call the filter chain after
+each new parameter-value. If the parameter-value-tuple was already valid before the new
+parameter-value was added, only the rules which read the new parameter can change the result. The
+rule registries of the filter modules define which parameters are read by each rule.
+"""
+
+from typing import Dict, List, Optional
+from collections import OrderedDict
+
+from bashi.types import (
+    Parameter,
+    ParameterValue,
+    ParameterValueTuple,
+    FilterFunction,
+)
+from bashi.rules import Rule, RuleSet
+from bashi.filter_compiler import COMPILER_RULES
+from bashi.filter_backend import BACKEND_RULES
+from bashi.filter_software_dependency import SOFTWARE_DEPENDENCY_RULES
+
+# rule sets of the default filter chain in the default order
+DEFAULT_RULE_SETS: List[RuleSet] = [COMPILER_RULES, BACKEND_RULES, SOFTWARE_DEPENDENCY_RULES]
+
+
+# pylint: disable=too-few-public-methods
+class IncrementalFilterChain:
+    """Checks if a valid parameter-value-tuple is still valid after adding a new parameter-value.
+    Only the rules, which read the new parameter, are evaluated. The result is the same like the
+    result of the default filter chain of get_default_filter_chain() for the extended
+    parameter-value-tuple.
+    """
+
+    def __init__(self, custom_filter_function: Optional[FilterFunction] = None):
+        """Create the parameter-to-rule table of the bashi rules.
+
+        Args:
+            custom_filter_function (Optional[FilterFunction], optional): Custom filter function,
+                which is evaluated after the bashi filter functions. The dependencies of the custom
+                filter function are unknown. Therefore it is always called with the complete
+                parameter-value-tuple. Defaults to None.
+        """
+        self.custom_filter_function = custom_filter_function
+        # for each parameter all rules, which read the parameter
+        self.dependencies: Dict[Parameter, List[Rule]] = {}
+        for rule_set in DEFAULT_RULE_SETS:
+            for rule in rule_set.rules:
+                for param in rule.parameters:
+                    self.dependencies.setdefault(param, []).append(rule)
+
+    def check_parameter_value(
+        self,
+        row: ParameterValueTuple,
+        parameter: Parameter,
+        parameter_value: ParameterValue,
+    ) -> bool:
+        """Check if a parameter-value-tuple, which passes the filter chain, is still valid after
+        adding a new parameter-value.
+
+        Args:
+            row (ParameterValueTuple): Parameter-value-tuple, which passes the filter chain. The
+                parameter-value-tuple is not modified.
+            parameter (Parameter): parameter of the new parameter-value
+            parameter_value (ParameterValue): the new parameter-value
+
+        Raises:
+            ValueError: If the parameter is already part of the parameter-value-tuple.
+
+        Returns:
+            bool: True, if the extended parameter-value-tuple passes the filter chain.
+        """
+        if parameter in row:
+            raise ValueError(f"{parameter} is already part of the parameter-value-tuple")
+
+        extended_row: ParameterValueTuple = OrderedDict(row)
+        extended_row[parameter] = parameter_value
+
+        for rule in self.dependencies.get(parameter, ()):
+            for param in rule.parameters:
+                if param not in extended_row:
+                    break
+            else:
+                if not rule.predicate(extended_row, None):
+                    return False
+
+        if self.custom_filter_function is not None:
+            return self.custom_filter_function(extended_row)
+
+        return True
@@ -9,10 +9,17 @@ which rule.
 
 from typing import Optional, IO
 import packaging.version as pkv
-from typeguard import typechecked
-from bashi.types import ParameterValueTuple
+from bashi.typecheck import typechecked
+from bashi.types import Parameter, ParameterValueTuple
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.versions import (
+    UBUNTU_ROCM_MIN_VERSION,
+    UBUNTU_GCC_MIN_VERSION,
+    GCC_UBUNTU_MAX_VERSION,
+    CMAKE_CLANG_CUDA_MAX_DISABLED_VERSION,
+)
 from bashi.utils import reason
+from bashi.rules import RuleSet
 
 
 def __ubuntu_version_to_string(version: pkv.Version) -> str:
@@ -48,6 +55,86 @@ def __pretty_name_compiler(constant: str) -> str:
     return "unknown compiler type"
 
 
+# all rules of software_dependency_filter() in the order of evaluation
+SOFTWARE_DEPENDENCY_RULES = RuleSet()
+
+
+def _add_ubuntu_gcc_rule(compiler_type: Parameter):
+    """Adds rule d1 for the host or device compiler.
+
+    Args:
+        compiler_type (Parameter): HOST_COMPILER or DEVICE_COMPILER
+    """
+
+    @SOFTWARE_DEPENDENCY_RULES.rule("d1", UBUNTU, compiler_type)
+    def _d1(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # GCC 6 and older is not available in Ubuntu 20.04 and newer
+        if (
+            row[UBUNTU].version >= UBUNTU_GCC_MIN_VERSION
+            and row[compiler_type].name == GCC
+            and row[compiler_type].version <= GCC_UBUNTU_MAX_VERSION
+        ):
+            reason(
+                output,
+                f"{__pretty_name_compiler(compiler_type)} GCC {row[compiler_type].version} "
+                "is not available in Ubuntu "
+                f"{__ubuntu_version_to_string(row[UBUNTU].version)}",
+            )
+            return False
+        return True
+
+
+def _add_cmake_clang_cuda_rule(compiler_type: Parameter):
+    """Adds rule d2 for the host or device compiler.
+
+    Args:
+        compiler_type (Parameter): HOST_COMPILER or DEVICE_COMPILER
+    """
+
+    @SOFTWARE_DEPENDENCY_RULES.rule("d2", CMAKE, compiler_type)
+    def _d2(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+        # CMAKE 3.19 and older is not available with clang cuda as device and host compiler
+        if (
+            row[CMAKE].version <= CMAKE_CLANG_CUDA_MAX_DISABLED_VERSION
+            and row[compiler_type].name == CLANG_CUDA
+        ):
+            reason(
+                output,
+                f"{__pretty_name_compiler(compiler_type)} CLANG_CUDA "
+                "is not available in CMAKE "
+                f"{row[CMAKE].version}",
+            )
+            return False
+        return True
+
+
+for _compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
+    _add_ubuntu_gcc_rule(_compiler_type)
+
+for _compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
+    _add_cmake_clang_cuda_rule(_compiler_type)
+
+
+@SOFTWARE_DEPENDENCY_RULES.rule("d3", UBUNTU, ALPAKA_ACC_GPU_HIP_ENABLE)
+def _d3(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+    # all ROCm images are Ubuntu 20.04 based or newer
+    # related to rule c19
+    # pylint: disable=duplicate-code
+    if (
+        row[UBUNTU].version < UBUNTU_ROCM_MIN_VERSION
+        and row[ALPAKA_ACC_GPU_HIP_ENABLE].version != OFF_VER
+    ):
+        reason(
+            output,
+            "ROCm and also the hipcc compiler is not available on Ubuntu older than 20.04",
+        )
+        return False
+    return True
+
+
+_software_dependency_filter = SOFTWARE_DEPENDENCY_RULES.make_filter()
+
+
 @typechecked
 def software_dependency_filter_typechecked(
     row: ParameterValueTuple,
@@ -63,7 +150,8 @@ def software_dependency_filter(
     row: ParameterValueTuple,
     output: Optional[IO[str]] = None,
 ) -> bool:
-    """Filter rules handling software dependencies and compiler settings.
+    """Filter rules handling software dependencies and compiler settings. The rules are defined in
+    SOFTWARE_DEPENDENCY_RULES.
 
     Args:
         row (ParameterValueTuple): parameter-value-tuple to verify.
@@ -74,46 +162,4 @@ def software_dependency_filter(
     Returns:
         bool: True, if parameter-value-tuple is valid.
     """
-
-    # Rule: d1
-    # GCC 6 and older is not available in Ubuntu 20.04 and newer
-
-    if UBUNTU in row and row[UBUNTU].version >= pkv.parse("20.04"):
-        for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
-            if compiler_type in row and row[compiler_type].name == GCC:
-                if row[compiler_type].version <= pkv.parse("6"):
-                    reason(
-                        output,
-                        f"{__pretty_name_compiler(compiler_type)} GCC {row[compiler_type].version} "
-                        "is not available in Ubuntu "
-                        f"{__ubuntu_version_to_string(row[UBUNTU].version)}",
-                    )
-                    return False
-
-    # Rule: d2
-    # CMAKE 3.19 and older is not available with clang cuda as device and host compiler
-
-    if CMAKE in row and row[CMAKE].version <= pkv.parse("3.18"):
-        for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
-            if compiler_type in row and row[compiler_type].name == CLANG_CUDA:
-                reason(
-                    output,
-                    f"{__pretty_name_compiler(compiler_type)} CLANG_CUDA "
-                    "is not available in CMAKE "
-                    f"{row[CMAKE].version}",
-                )
-                return False
-    # Rule: d3
-    # all ROCm images are Ubuntu 20.04 based or newer
-    # related to rule c19
-
-    if UBUNTU in row and row[UBUNTU].version < pkv.parse("20.04"):
-        if ALPAKA_ACC_GPU_HIP_ENABLE in row and row[ALPAKA_ACC_GPU_HIP_ENABLE].version != OFF_VER:
-            reason(
-                output,
-                "ROCm and also the hipcc compiler "
-                "is not available on Ubuntu "
-                "older than 20.04",
-            )
-            return False
-    return True
+    return _software_dependency_filter(row, output)
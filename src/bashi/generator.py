@@ -1,54 +1,260 @@
 """Functions to generate the combination-list"""
 
-from typing import Dict, List
+from typing import Dict, Iterator, Optional
 from collections import OrderedDict
 
-from covertable import make  # type: ignore
-
 from bashi.types import (
     Parameter,
     ParameterValue,
     ParameterValueMatrix,
     FilterFunction,
+    CostFunction,
     Combination,
     CombinationList,
 )
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from bashi.filter_chain import get_default_filter_chain
+from bashi.engine import PairwiseEngine
+from bashi.compatibility import PairCompatibilityIndex
+
+# names of the supported pair-wise engines
+ENGINE_BASHI: str = "bashi"
+ENGINE_COVERTABLE: str = "covertable"
 
 
 def generate_combination_list(
     parameter_value_matrix: ParameterValueMatrix,
     custom_filter: FilterFunction = lambda _: True,
+    engine: str = ENGINE_BASHI,
+    pair_index: Optional[PairCompatibilityIndex] = None,
+    cost_function: Optional[CostFunction] = None,
 ) -> CombinationList:
     """Generate combination-list from the parameter-value-matrix. The combination list contains
     all valid parameter-value-pairs at least one time.
 
+    If the native engine cannot cover a valid parameter-value-pair, because there is no valid
+    combination for it or the backtracking limit was reached, the pair is skipped and a
+    bashi.engine.UncoveredPairsWarning is emitted.
+
     Args:
         parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
         parameter-values.
         custom_filter (FilterFunction, optional): Custom filter function to extend bashi
         filters. Defaults is lambda _: True.
+        engine (str, optional): Pair-wise engine, which generates the combinations. Ether
+            ENGINE_BASHI for the native engine or ENGINE_COVERTABLE for the covertable library,
+            which needs to be installed separately. Defaults to ENGINE_BASHI.
+        pair_index (Optional[PairCompatibilityIndex], optional): Precomputed compatibility of the
+            parameter-value-pairs, created with the same parameter-value-matrix and
+            get_default_filter_chain(custom_filter). Avoids recomputing the index, if several
+            combination-lists are generated from the same matrix. Only used by ENGINE_BASHI.
+            Defaults to None.
+        cost_function (Optional[CostFunction], optional): Returns the cost of a parameter-value,
+            for example 10 for an enabled GPU backend, because the job needs an expensive GPU
+            runner. The cost of a combination is the largest cost of its parameter-values. If not
+            None, the engine tries to minimize the total cost of the combination-list, see
+            get_combination_list_cost(), instead of the number of combinations. Only supported by
+            ENGINE_BASHI. Defaults to None.
+
+    Raises:
+        ValueError: If the engine is unknown, the pair_index was created from a different
+            parameter-value-matrix or the engine does not support a cost function.
+
     Returns:
         CombinationList: combination-list
     """
+    return list(
+        iter_combinations(parameter_value_matrix, custom_filter, engine, pair_index, cost_function)
+    )
+
+
+def iter_combinations(
+    parameter_value_matrix: ParameterValueMatrix,
+    custom_filter: FilterFunction = lambda _: True,
+    engine: str = ENGINE_BASHI,
+    pair_index: Optional[PairCompatibilityIndex] = None,
+    cost_function: Optional[CostFunction] = None,
+) -> Iterator[Combination]:
+    """Streaming version of generate_combination_list(). Yields each combination as soon as the
+    engine has completed it, so the caller can process a combination while the next one is
+    generated. The combinations are the same and in the same order like the combination-list of
+    generate_combination_list().
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        custom_filter (FilterFunction, optional): Custom filter function to extend bashi
+            filters. Defaults is lambda _: True.
+        engine (str, optional): Pair-wise engine, see generate_combination_list(). Defaults to
+            ENGINE_BASHI.
+        pair_index (Optional[PairCompatibilityIndex], optional): Precomputed compatibility of the
+            parameter-value-pairs, see generate_combination_list(). Defaults to None.
+        cost_function (Optional[CostFunction], optional): Cost of each parameter-value, see
+            generate_combination_list(). If not None, the first combination is yielded after all
+            combinations are generated. Defaults to None.
+
+    Raises:
+        ValueError: If the engine is unknown, the pair_index was created from a different
+            parameter-value-matrix or the engine does not support a cost function. The error is
+            raised, when the generator is created and not when the first combination is requested.
+
+    Returns:
+        Iterator[Combination]: iterator over the combinations
+    """
     filter_chain = get_default_filter_chain(custom_filter)
 
-    comb_list: CombinationList = []
+    if engine == ENGINE_BASHI:
+        if cost_function is not None:
+            return iter(
+                _generate_cheapest_combination_list(
+                    parameter_value_matrix, filter_chain, pair_index, cost_function
+                )
+            )
+        return PairwiseEngine(parameter_value_matrix, filter_chain, pair_index).generate()
+
+    if engine == ENGINE_COVERTABLE:
+        if cost_function is not None:
+            raise ValueError(f"Engine {engine} does not support a cost function")
+        return _iter_combinations_covertable(parameter_value_matrix, filter_chain)
+
+    raise ValueError(
+        f"Unknown engine: {engine}\nKnown engines: {[ENGINE_BASHI, ENGINE_COVERTABLE]}"
+    )
+
+
+def get_combination_list_cost(
+    combination_list: CombinationList, cost_function: CostFunction
+) -> float:
+    """Returns the total cost of a combination-list. The cost of a combination is the largest cost
+    of its parameter-values.
+
+    Args:
+        combination_list (CombinationList): the combination-list
+        cost_function (CostFunction): returns the cost of a parameter-value
+
+    Returns:
+        float: sum of the costs of all combinations
+    """
+    return sum(
+        max((cost_function(param, param_val) for param, param_val in comb.items()), default=0.0)
+        for comb in combination_list
+    )
+
+
+def regenerate_combination_list(
+    previous_combination_list: CombinationList,
+    parameter_value_matrix: ParameterValueMatrix,
+    custom_filter: FilterFunction = lambda _: True,
+    pair_index: Optional[PairCompatibilityIndex] = None,
+) -> CombinationList:
+    """Incremental version of generate_combination_list() for a changed parameter-value-matrix,
+    for example if a new compiler version was added. All combinations of the previous
+    combination-list, which are still valid, are kept. New combinations are only generated for the
+    parameter-value-pairs, which are not covered by the kept combinations. Therefore, most
+    combinations and the jobs created from them stay the same.
+
+    Only supported by the native pair-wise engine.
+
+    Args:
+        previous_combination_list (CombinationList): Combination-list created from the previous
+            parameter-value-matrix.
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        custom_filter (FilterFunction, optional): Custom filter function to extend bashi
+            filters. Defaults is lambda _: True.
+        pair_index (Optional[PairCompatibilityIndex], optional): Precomputed compatibility of the
+            parameter-value-pairs, see generate_combination_list(). Defaults to None.
+
+    Raises:
+        ValueError: If the pair_index was created from a different parameter-value-matrix.
+
+    Returns:
+        CombinationList: Combination-list, which contains all valid parameter-value-pairs at least
+            one time. Starts with the kept combinations in the previous order, followed by the new
+            combinations. A previous combination is not kept, if it does not contain exactly the
+            parameters of the parameter-value-matrix, contains a parameter-value, which was removed
+            from the parameter-value-matrix or does not pass the filter chain anymore.
+    """
+    engine = PairwiseEngine(
+        parameter_value_matrix, get_default_filter_chain(custom_filter), pair_index
+    )
+
+    combination_list: CombinationList = []
+    for comb in previous_combination_list:
+        if engine.add_combination(comb):
+            combination_list.append(
+                OrderedDict((param, comb[param]) for param in parameter_value_matrix)
+            )
+    combination_list += engine.generate()
+    return combination_list
+
+
+def _generate_cheapest_combination_list(
+    parameter_value_matrix: ParameterValueMatrix,
+    filter_chain: FilterFunction,
+    pair_index: Optional[PairCompatibilityIndex],
+    cost_function: CostFunction,
+) -> CombinationList:
+    """Generate the combination-list with and without the cost function and return the cheaper
+    one. Preferring cheap parameter-values saves costs for most parameter-value-matrices, but it
+    can also break up combinations, which the engine would find without costs.
 
-    all_pairs: List[Dict[Parameter, ParameterValue]] = make(
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        filter_chain (FilterFunction): The complete filter chain.
+        pair_index (Optional[PairCompatibilityIndex]): Precomputed compatibility of the
+            parameter-value-pairs. If None, the index is created.
+        cost_function (CostFunction): Returns the cost of a parameter-value.
+
+    Returns:
+        CombinationList: combination-list with the lower total cost
+    """
+    if pair_index is None:
+        pair_index = PairCompatibilityIndex(parameter_value_matrix, filter_chain)
+
+    cost_combination_list = list(
+        PairwiseEngine(parameter_value_matrix, filter_chain, pair_index, cost_function).generate()
+    )
+    combination_list = list(
+        PairwiseEngine(parameter_value_matrix, filter_chain, pair_index).generate()
+    )
+    if get_combination_list_cost(cost_combination_list, cost_function) < get_combination_list_cost(
+        combination_list, cost_function
+    ):
+        return cost_combination_list
+    return combination_list
+
+
+def _iter_combinations_covertable(
+    parameter_value_matrix: ParameterValueMatrix,
+    filter_chain: FilterFunction,
+) -> Iterator[Combination]:
+    """Generate the combinations with the covertable library.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+        parameter-values.
+        filter_chain (FilterFunction): The complete filter chain.
+
+    Yields:
+        Combination: the next combination
+    """
+    # covertable is an optional dependency
+    # make_async() is the generator version of covertable.make()
+    from covertable.main import make_async  # type: ignore # pylint: disable=import-outside-toplevel
+
+    all_pairs: Iterator[Dict[Parameter, ParameterValue]] = make_async(
         factors=parameter_value_matrix,
         length=2,
         pre_filter=filter_chain,
     )  # type: ignore
 
-    # convert List[Dict[Parameter, ParameterValue]] to CombinationList
+    # convert Dict[Parameter, ParameterValue] to Combination
     for all_pair in all_pairs:
         tmp_comb: Combination = OrderedDict({})
         # covertable does not keep the ordering of the parameters
         # therefore we sort it
         for param in parameter_value_matrix.keys():
             tmp_comb[param] = all_pair[param]
-        comb_list.append(tmp_comb)
-
-    return comb_list
+        yield tmp_comb
@@ -1,8 +1,8 @@
 """This module contains constants used in the bashi library."""
 
-from typing import List
-import packaging.version
+from typing import Dict, List
 from bashi.types import Parameter, ValueName, ValueVersion
+from bashi.interning import intern_version
 
 # parameter key names, whit special meaning
 HOST_COMPILER: Parameter = "host_compiler"
@@ -45,10 +45,25 @@ CMAKE: str = "cmake"
 BOOST: str = "boost"
 CXX_STANDARD: str = "cxx_standard"
 
+# short names for parameter
+PARAMETER_SHORT_NAME: Dict[Parameter, str] = {
+    HOST_COMPILER: "host",
+    DEVICE_COMPILER: "device",
+    ALPAKA_ACC_CPU_B_OMP2_T_SEQ_ENABLE: "bOpenMP2thread",
+    ALPAKA_ACC_CPU_B_SEQ_T_OMP2_ENABLE: "bOpenMP2block",
+    ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE: "bSeq",
+    ALPAKA_ACC_CPU_B_SEQ_T_THREADS_ENABLE: "bThreads",
+    ALPAKA_ACC_CPU_B_TBB_T_SEQ_ENABLE: "bTBB",
+    ALPAKA_ACC_GPU_CUDA_ENABLE: "bCUDA",
+    ALPAKA_ACC_GPU_HIP_ENABLE: "bHIP",
+    ALPAKA_ACC_SYCL_ENABLE: "bSYCL",
+    CXX_STANDARD: "c++",
+}
+
 OFF: str = "0.0.0"
 ON: str = "1.0.0"
-OFF_VER: ValueVersion = packaging.version.parse(OFF)
-ON_VER: ValueVersion = packaging.version.parse(ON)
+OFF_VER: ValueVersion = intern_version(OFF)
+ON_VER: ValueVersion = intern_version(ON)
 
 # values are used for remove_parameter_value_pair
 ANY_PARAM: Parameter = "*"
@@ -0,0 +1,79 @@
+"""Interning of versions.
+
+The same versions, e.g. ON and OFF, are parsed many times. intern_version() returns the same version
+object for the same version string, as long as the version object is used somewhere. This saves
+memory for large lists of parameter-value-pairs and comparisons of identical versions are
+short-circuited.
+"""
+
+from typing import Tuple, Union
+import weakref
+import packaging.version
+
+
+def _get_weakref_slots(base: type) -> Tuple[str, ...]:
+    """Returns the slots, which a subclass of base needs to support weak references.
+
+    Only newer versions of packaging define Version with __slots__. Without slots, the instances
+    support weak references already and adding the slot again raises a TypeError.
+
+    Args:
+        base (type): base class
+
+    Returns:
+        Tuple[str, ...]: ("__weakref__",) if the instances of base do not support weak references,
+            otherwise an empty tuple
+    """
+    if hasattr(base, "__weakref__"):
+        return ()
+    return ("__weakref__",)
+
+
+class InternedVersion(packaging.version.Version):
+    """Version, which is shared by all users of the same version string. Behaves like
+    packaging.version.Version, but supports weak references and compares equal to itself without
+    comparing the version parts.
+    """
+
+    __slots__ = _get_weakref_slots(packaging.version.Version)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        return super().__eq__(other)
+
+    __hash__ = packaging.version.Version.__hash__
+
+    def __repr__(self) -> str:
+        return f"<Version('{self}')>"
+
+    def __reduce__(self):
+        # unpickled versions, e.g. the results of a worker process, are interned again
+        return (intern_version, (str(self),))
+
+
+# maps version strings to the interned versions
+# an entry is removed automatically, if its version is not used anymore
+_interned_versions: "weakref.WeakValueDictionary[str, InternedVersion]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def intern_version(version: Union[str, int, float]) -> packaging.version.Version:
+    """Parse a version like packaging.version.parse(). Returns the same version object for the same
+    version string, as long as the version object is used somewhere.
+
+    Args:
+        version (Union[str, int, float]): The version. Numbers are converted to a string first.
+
+    Raises:
+        packaging.version.InvalidVersion: If the version cannot be parsed.
+
+    Returns:
+        packaging.version.Version: The interned version.
+    """
+    version_str = str(version)
+    interned = _interned_versions.get(version_str)
+    if interned is None:
+        interned = _interned_versions.setdefault(version_str, InternedVersion(version_str))
+    return interned
@@ -0,0 +1,348 @@
+"""Reduce the number of combinations of a combination-list.
+
+The pair-wise engines build the combinations greedy, therefore the combination-list is usually not
+minimal. Each combination is a CI job, so removing a combination saves a complete job. The
+minimization keeps all parameter-value-pairs of the original combination-list covered and runs two
+steps until no combination can be removed anymore or the time budget is exceeded:
+
+- remove redundant combinations, whose parameter-value-pairs are all covered by other combinations
+- merge combinations: remove a combination and cover each of its parameter-value-pairs, which is not
+  covered by another combination, by changing a single parameter-value of another combination; if
+  the change uncovers other parameter-value-pairs, they are covered again by nested changes
+
+The minimization stops early, if the number of combinations reaches a lower bound.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+import time
+
+from bashi.types import CombinationList, FilterFunction, ParameterValueMatrix
+from bashi.filter_chain import get_default_filter_chain
+from bashi.compatibility import PairCompatibilityIndex
+
+# default time budget of the minimization in seconds
+DEFAULT_TIME_BUDGET: float = 10.0
+# maximum number of nested changes to cover a parameter-value-pair of a removed combination
+MAX_CHANGE_DEPTH: int = 2
+
+MinimizedCombinationList = NamedTuple(
+    "MinimizedCombinationList",
+    [
+        # the minimized combination-list
+        ("combination_list", CombinationList),
+        # number of removed combinations
+        ("saved_combinations", int),
+    ],
+)
+
+
+def minimize_combination_list(
+    combination_list: CombinationList,
+    parameter_value_matrix: ParameterValueMatrix,
+    custom_filter: FilterFunction = lambda _: True,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    pair_index: Optional[PairCompatibilityIndex] = None,
+) -> MinimizedCombinationList:
+    """Remove redundant combinations and merge combinations. The minimized combination-list
+    contains each parameter-value-pair of the original combination-list at least one time and each
+    combination passes the filter chain. For a fixed input, the result depends only on the time
+    budget.
+
+    Args:
+        combination_list (CombinationList): Combination-list generated from the
+            parameter-value-matrix, for example by generate_combination_list(). The list is not
+            modified.
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        custom_filter (FilterFunction, optional): Custom filter function to extend bashi
+            filters. Defaults is lambda _: True.
+        time_budget (float, optional): Maximum runtime of the minimization in seconds. Defaults to
+            DEFAULT_TIME_BUDGET.
+        pair_index (Optional[PairCompatibilityIndex], optional): Precomputed compatibility of the
+            parameter-value-pairs, created with the same parameter-value-matrix and
+            get_default_filter_chain(custom_filter). Defaults to None.
+
+    Raises:
+        ValueError: If a combination contains a parameter-value, which is not part of the
+            parameter-value-matrix, or the parameters are not the same like in the
+            parameter-value-matrix.
+
+    Returns:
+        MinimizedCombinationList: the minimized combination-list and the number of removed
+            combinations
+    """
+    filter_chain = get_default_filter_chain(custom_filter)
+    if pair_index is None:
+        pair_index = PairCompatibilityIndex(parameter_value_matrix, filter_chain)
+
+    rows: List[List[int]] = []
+    for comb in combination_list:
+        if list(comb.keys()) != pair_index.matrix.parameters:
+            raise ValueError(f"The parameters of the combination does not match the matrix: {comb}")
+        try:
+            rows.append(pair_index.matrix.encode_row(comb))
+        except KeyError as error:
+            raise ValueError(f"{error} is not part of the parameter-value-matrix") from error
+
+    minimizer = _Minimizer(rows, pair_index, filter_chain, time.perf_counter() + time_budget)
+    minimizer.run()
+
+    minimized_combination_list: CombinationList = [
+        pair_index.matrix.decode_combination(row_ids) for row_ids in minimizer.get_rows()
+    ]
+    return MinimizedCombinationList(
+        minimized_combination_list, len(combination_list) - len(minimized_combination_list)
+    )
+
+
+def _pair(value_id1: int, value_id2: int) -> Tuple[int, int]:
+    return (value_id1, value_id2) if value_id1 < value_id2 else (value_id2, value_id1)
+
+
+# pylint: disable=too-many-instance-attributes
+class _Minimizer:
+    """Stores the value ids of the combinations and how often each parameter-value-pair is
+    covered. Removed combinations are set to None to keep the row numbers stable.
+    """
+
+    def __init__(
+        self,
+        rows: List[List[int]],
+        pair_index: PairCompatibilityIndex,
+        filter_function: FilterFunction,
+        deadline: float,
+    ):
+        self.rows: List[Optional[List[int]]] = list(rows)
+        self.pair_index = pair_index
+        self.filter_function = filter_function
+        self.deadline = deadline
+        # number of combinations, which contains the parameter-value-pair
+        self.coverage: Dict[Tuple[int, int], int] = {}
+        # row numbers of the combinations, which contains the parameter-value
+        self.value_rows: Dict[int, Set[int]] = {}
+        # changes of the current merge: row number, parameter position and previous value id
+        self.changes: List[Tuple[int, int, int]] = []
+        # number of not removed combinations
+        self.number_of_rows = 0
+
+        for row_number, row_ids in enumerate(rows):
+            self._add_row(row_number, row_ids)
+        self.lower_bound = self._get_lower_bound()
+
+    def get_rows(self) -> List[List[int]]:
+        """Returns the value ids of the remaining combinations in the original order.
+
+        Returns:
+            List[List[int]]: value ids of each combination
+        """
+        return [row_ids for row_ids in self.rows if row_ids is not None]
+
+    def run(self):
+        """Run remove and merge steps until no combination can be removed or the time budget is
+        exceeded.
+        """
+        while time.perf_counter() < self.deadline:
+            self._remove_redundant_rows()
+            if self.number_of_rows <= self.lower_bound or not self._merge_rows():
+                return
+
+    def _get_lower_bound(self) -> int:
+        """Returns the minimal number of combinations, which can cover all parameter-value-pairs.
+        Each combination contains only one parameter-value of a parameter. Therefore, a
+        parameter-value with n partners of another parameter needs to be part of at least n
+        combinations.
+
+        Returns:
+            int: the lower bound
+        """
+        value_parameter = self.pair_index.matrix.value_parameter
+        # number of partners of each parameter-value for each other parameter
+        partners: Dict[Tuple[int, int], int] = {}
+        for value_id1, value_id2 in self.coverage:
+            for value_id, partner_id in ((value_id1, value_id2), (value_id2, value_id1)):
+                key = (value_id, value_parameter[partner_id])
+                partners[key] = partners.get(key, 0) + 1
+
+        max_partners: Dict[int, int] = {}
+        for (value_id, _), count in partners.items():
+            max_partners[value_id] = max(max_partners.get(value_id, 0), count)
+
+        parameter_bounds: Dict[int, int] = {}
+        for value_id, count in max_partners.items():
+            param_id = value_parameter[value_id]
+            parameter_bounds[param_id] = parameter_bounds.get(param_id, 0) + count
+        return max(parameter_bounds.values(), default=0)
+
+    def _add_row(self, row_number: int, row_ids: List[int]):
+        self.number_of_rows += 1
+        for index, value_id in enumerate(row_ids):
+            self.value_rows.setdefault(value_id, set()).add(row_number)
+            for partner_id in row_ids[index + 1 :]:
+                pair = _pair(value_id, partner_id)
+                self.coverage[pair] = self.coverage.get(pair, 0) + 1
+
+    def _remove_row(self, row_number: int) -> List[int]:
+        row_ids = self.rows[row_number]
+        assert row_ids is not None
+        for index, value_id in enumerate(row_ids):
+            self.value_rows[value_id].discard(row_number)
+            for partner_id in row_ids[index + 1 :]:
+                self.coverage[_pair(value_id, partner_id)] -= 1
+        self.rows[row_number] = None
+        self.number_of_rows -= 1
+        return row_ids
+
+    def _count_unique_pairs(self, row_ids: List[int]) -> int:
+        return sum(
+            1
+            for index, value_id in enumerate(row_ids)
+            for partner_id in row_ids[index + 1 :]
+            if self.coverage[_pair(value_id, partner_id)] == 1
+        )
+
+    def _remove_redundant_rows(self):
+        """Remove combinations, whose parameter-value-pairs are all covered by other combinations.
+        Starts with the last combination, because the greedy engines cover the fewest new
+        parameter-value-pairs with the last combinations.
+        """
+        for row_number in range(len(self.rows) - 1, -1, -1):
+            row_ids = self.rows[row_number]
+            if row_ids is not None and self._count_unique_pairs(row_ids) == 0:
+                self._remove_row(row_number)
+
+    def _merge_rows(self) -> bool:
+        """Try to remove each combination by changing other combinations. The combinations with
+        the fewest uniquely covered parameter-value-pairs are tried first.
+
+        Returns:
+            bool: True, if at least one combination was removed.
+        """
+        candidates = sorted(
+            (
+                (self._count_unique_pairs(row_ids), row_number)
+                for row_number, row_ids in enumerate(self.rows)
+                if row_ids is not None
+            )
+        )
+        merged = False
+        for _, row_number in candidates:
+            if time.perf_counter() >= self.deadline or self.number_of_rows <= self.lower_bound:
+                break
+            if self.rows[row_number] is not None and self._try_merge_row(row_number):
+                merged = True
+        return merged
+
+    def _try_merge_row(self, row_number: int) -> bool:
+        """Remove a combination and change other combinations, so that they cover the
+        parameter-value-pairs, which are not covered anymore. If it is not possible, all changes
+        are reverted.
+
+        Args:
+            row_number (int): row number of the combination
+
+        Returns:
+            bool: True, if the combination was removed.
+        """
+        row_ids = self._remove_row(row_number)
+        self.changes.clear()
+
+        for index, value_id in enumerate(row_ids):
+            for partner_id in row_ids[index + 1 :]:
+                if not self._recover_pair(value_id, partner_id, MAX_CHANGE_DEPTH):
+                    self._revert_changes(0)
+                    self.rows[row_number] = row_ids
+                    self._add_row(row_number, row_ids)
+                    return False
+        return True
+
+    def _recover_pair(self, value_id1: int, value_id2: int, depth: int) -> bool:
+        """Make sure, that a parameter-value-pair is covered by at least one combination.
+
+        Args:
+            value_id1 (int): value id of the first parameter-value
+            value_id2 (int): value id of the second parameter-value
+            depth (int): maximum number of nested changes, see _cover_pair()
+
+        Returns:
+            bool: True, if the parameter-value-pair is covered.
+        """
+        return (
+            self.coverage[_pair(value_id1, value_id2)] > 0
+            or self._cover_pair(value_id1, value_id2, depth)
+            or self._cover_pair(value_id2, value_id1, depth)
+        )
+
+    def _cover_pair(self, fixed_id: int, new_id: int, depth: int) -> bool:
+        """Search a combination, which contains the parameter-value fixed_id and can use the
+        parameter-value new_id instead of its current parameter-value of the same parameter.
+
+        If depth is larger than 0, the changed combination can lose parameter-value-pairs, which
+        are not covered by another combination, if they can be covered again by changing other
+        combinations with depth - 1. Otherwise, the change must not uncover any
+        parameter-value-pair.
+
+        Args:
+            fixed_id (int): value id of the parameter-value, which stays in the combination
+            new_id (int): value id of the parameter-value, which is added to the combination
+            depth (int): maximum number of nested changes
+
+        Returns:
+            bool: True, if a combination was changed and all parameter-value-pairs, which were
+                covered before, are still covered.
+        """
+        position = self.pair_index.matrix.value_parameter[new_id]
+        compatible = self.pair_index.compatible[new_id]
+        for row_number in sorted(self.value_rows[fixed_id]):
+            row_ids = self.rows[row_number]
+            if row_ids is None or fixed_id not in row_ids:
+                # changed by a nested change
+                continue
+            previous_id = row_ids[position]
+            others = [value_id for value_id in row_ids if value_id != previous_id]
+            lost_ids = [
+                value_id for value_id in others if self.coverage[_pair(previous_id, value_id)] == 1
+            ]
+            if (lost_ids and depth == 0) or any(
+                not compatible >> value_id & 1 for value_id in others
+            ):
+                continue
+
+            checkpoint = len(self.changes)
+            self._change_value(row_number, position, new_id)
+            self.changes.append((row_number, position, previous_id))
+            if self.filter_function(self.pair_index.matrix.decode_row(row_ids)) and all(
+                self._recover_pair(previous_id, value_id, depth - 1) for value_id in lost_ids
+            ):
+                return True
+            self._revert_changes(checkpoint)
+        return False
+
+    def _revert_changes(self, checkpoint: int):
+        """Revert all changes after the checkpoint.
+
+        Args:
+            checkpoint (int): number of changes, which are kept
+        """
+        while len(self.changes) > checkpoint:
+            row_number, position, previous_id = self.changes.pop()
+            self._change_value(row_number, position, previous_id)
+
+    def _change_value(self, row_number: int, position: int, new_id: int):
+        """Replace a parameter-value of a combination and update the coverage.
+
+        Args:
+            row_number (int): row number of the combination
+            position (int): position of the parameter in the combination
+            new_id (int): value id of the new parameter-value
+        """
+        row_ids = self.rows[row_number]
+        assert row_ids is not None
+        previous_id = row_ids[position]
+        self.value_rows[previous_id].discard(row_number)
+        self.value_rows.setdefault(new_id, set()).add(row_number)
+        for value_id in row_ids:
+            if value_id != previous_id:
+                self.coverage[_pair(previous_id, value_id)] -= 1
+                pair = _pair(new_id, value_id)
+                self.coverage[pair] = self.coverage.get(pair, 0) + 1
+        row_ids[position] = new_id
@@ -1,10 +1,16 @@
 """Create list of expected parameter-value-pairs respecting bashi filter rules"""
 
 from typing import List, Optional, Tuple
-from typeguard import typechecked
 from packaging.specifiers import SpecifierSet
+from bashi.typecheck import typechecked
 from bashi.types import ParameterValuePair, ParameterValueMatrix
-from bashi.utils import get_expected_parameter_value_pairs, remove_parameter_value_pairs, bi_filter
+from bashi.utils import (
+    get_expected_parameter_value_pairs,
+    remove_parameter_value_pairs,
+    bi_filter,
+    ParameterValuePairIndex,
+    ParameterValuePairs,
+)
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from bashi.versions import (
     COMPILERS,
@@ -30,7 +36,10 @@ def get_expected_bashi_parameter_value_pairs(
     Returns:
         List[ParameterValuePair]: list of all parameter-value-pairs supported by bashi
     """
-    param_val_pair_list = get_expected_parameter_value_pairs(parameter_matrix)
+    # the index allows to search only the parameter-value-pairs, which can match a rule
+    param_val_pair_list = ParameterValuePairIndex(
+        get_expected_parameter_value_pairs(parameter_matrix)
+    )
     removed_param_val_pair_list: List[ParameterValuePair] = []
 
     _remove_nvcc_host_compiler(param_val_pair_list, removed_param_val_pair_list)
@@ -84,16 +93,16 @@ def get_expected_bashi_parameter_value_pairs(
     _remove_all_rocm_images_older_than_ubuntu2004_based(
         param_val_pair_list, removed_param_val_pair_list
     )
-    return (param_val_pair_list, removed_param_val_pair_list)
+    return (param_val_pair_list.get_pairs(), removed_param_val_pair_list)
 
 
 def _remove_nvcc_host_compiler(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove nvcc as host compiler.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     remove_parameter_value_pairs(
@@ -105,12 +114,12 @@ def _remove_nvcc_host_compiler(
 
 
 def _remove_unsupported_clang_cuda_version(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove Clang-CUDA 13 and older
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
@@ -124,13 +133,13 @@ def _remove_unsupported_clang_cuda_version(
 
 
 def _remove_unsupported_nvcc_host_compiler(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all combinations where nvcc is device compiler and the host compiler is not gcc or
     clang.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_name in set(COMPILERS) - set([GCC, CLANG, NVCC]):
@@ -145,13 +154,13 @@ def _remove_unsupported_nvcc_host_compiler(
 
 
 def _remove_different_compiler_names(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all combinations, where host and device compiler name are different except the device
     compiler name is nvcc.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     # remove all combinations, where host and device compiler name are different except the device
@@ -170,13 +179,13 @@ def _remove_different_compiler_names(
 
 
 def _remove_different_compiler_versions(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all combinations, where host and device compiler name are equal and versions are
     different except the compiler name is nvcc.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
 
@@ -197,16 +206,21 @@ def _remove_different_compiler_versions(
 
         return True
 
-    bi_filter(parameter_value_pairs, removed_parameter_value_pairs, filter_function)
+    bi_filter(
+        parameter_value_pairs,
+        removed_parameter_value_pairs,
+        filter_function,
+        (HOST_COMPILER, DEVICE_COMPILER),
+    )
 
 
 def _remove_nvcc_unsupported_gcc_versions(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all gcc version, which are to new for a specific nvcc version.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     _remove_unsupported_nvcc_cuda_host_compiler_versions(
@@ -220,12 +234,12 @@ def _remove_nvcc_unsupported_gcc_versions(
 
 
 def _remove_nvcc_unsupported_clang_versions(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all clang version, which are to new for a specific nvcc version.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     _remove_unsupported_nvcc_cuda_host_compiler_versions(
@@ -239,7 +253,7 @@ def _remove_nvcc_unsupported_clang_versions(
 
 
 def _remove_unsupported_nvcc_cuda_host_compiler_versions(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
     host_compiler_name: str,
     second_parameter_name: Parameter,
@@ -318,7 +332,12 @@ def _remove_unsupported_nvcc_cuda_host_compiler_versions(
             oldest_nvcc_first[index + 1],
         )
 
-        bi_filter(parameter_value_pairs, removed_parameter_value_pairs, filter_function)
+        bi_filter(
+            parameter_value_pairs,
+            removed_parameter_value_pairs,
+            filter_function,
+            (HOST_COMPILER, second_parameter_name),
+        )
 
     # lower bound
     bi_filter(
@@ -330,6 +349,7 @@ def _remove_unsupported_nvcc_cuda_host_compiler_versions(
             second_value_name,
             inklusiv_min_version=oldest_nvcc_first[0],
         ),
+        (HOST_COMPILER, second_parameter_name),
     )
     # upper bound
     bi_filter(
@@ -341,17 +361,18 @@ def _remove_unsupported_nvcc_cuda_host_compiler_versions(
             second_value_name,
             exklusiv_max_version=oldest_nvcc_first[-1],
         ),
+        (HOST_COMPILER, second_parameter_name),
     )
 
 
 def _remove_specific_nvcc_clang_combinations(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where clang is host-compiler for nvcc 11.3, 11.4 and 11.5 as device
     compiler.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     remove_parameter_value_pairs(
@@ -367,12 +388,12 @@ def _remove_specific_nvcc_clang_combinations(
 
 
 def _remove_unsupported_compiler_for_hip_backend(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hip backend is enabled and the compiler is not hipcc.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_name in COMPILERS:
@@ -391,12 +412,12 @@ def _remove_unsupported_compiler_for_hip_backend(
 
 
 def _remove_disabled_hip_backend_for_hipcc(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hipcc is the compiler and the hip backend is disabled.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
@@ -413,12 +434,12 @@ def _remove_disabled_hip_backend_for_hipcc(
 
 
 def _remove_enabled_sycl_backend_for_hipcc(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hipcc is the compiler and the sycl backend is enabled.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
@@ -435,12 +456,12 @@ def _remove_enabled_sycl_backend_for_hipcc(
 
 
 def _remove_enabled_cuda_backend_for_hipcc(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hipcc is the compiler and the sycl backend is enabled.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
@@ -457,12 +478,12 @@ def _remove_enabled_cuda_backend_for_hipcc(
 
 
 def _remove_enabled_cuda_backend_for_enabled_hip_backend(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hipcc is the compiler and the sycl backend is enabled.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     remove_parameter_value_pairs(
@@ -478,12 +499,12 @@ def _remove_enabled_cuda_backend_for_enabled_hip_backend(
 
 
 def _remove_unsupported_compiler_for_sycl_backend(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hip backend is enabled and the compiler is not hipcc.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_name in COMPILERS:
@@ -502,12 +523,12 @@ def _remove_unsupported_compiler_for_sycl_backend(
 
 
 def _remove_disabled_sycl_backend_for_icpx(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hipcc is the compiler and the hip backend is disabled.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
@@ -524,12 +545,12 @@ def _remove_disabled_sycl_backend_for_icpx(
 
 
 def _remove_enabled_hip_backend_for_icpx(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hipcc is the compiler and the sycl backend is enabled.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
@@ -546,12 +567,12 @@ def _remove_enabled_hip_backend_for_icpx(
 
 
 def _remove_enabled_cuda_backend_for_icpx(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hipcc is the compiler and the sycl backend is enabled.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
@@ -568,12 +589,12 @@ def _remove_enabled_cuda_backend_for_icpx(
 
 
 def _remove_enabled_cuda_backend_for_enabled_sycl_backend(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the hipcc is the compiler and the sycl backend is enabled.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     remove_parameter_value_pairs(
@@ -589,13 +610,13 @@ def _remove_enabled_cuda_backend_for_enabled_sycl_backend(
 
 
 def _remove_nvcc_and_cuda_version_not_same(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where the device compiler version of nvcc is not equal to the CUDA backend.
     Filters also the disabled backend, because there is no nvcc@OFF.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
 
@@ -614,16 +635,21 @@ def _remove_nvcc_and_cuda_version_not_same(
 
         return True
 
-    bi_filter(parameter_value_pairs, removed_parameter_value_pairs, filter_function)
+    bi_filter(
+        parameter_value_pairs,
+        removed_parameter_value_pairs,
+        filter_function,
+        (DEVICE_COMPILER, ALPAKA_ACC_GPU_CUDA_ENABLE),
+    )
 
 
 def _remove_cuda_sdk_unsupported_gcc_versions(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all gcc version, which are to new for a specific cuda sdk version.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     _remove_unsupported_nvcc_cuda_host_compiler_versions(
@@ -637,12 +663,12 @@ def _remove_cuda_sdk_unsupported_gcc_versions(
 
 
 def _remove_cuda_sdk_unsupported_clang_versions(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all clang version, which are to new for a specific cuda sdk version.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     _remove_unsupported_nvcc_cuda_host_compiler_versions(
@@ -656,12 +682,12 @@ def _remove_cuda_sdk_unsupported_clang_versions(
 
 
 def _remove_device_compiler_gcc_clang_enabled_cuda_backend(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs where clang or gcc is device compiler the CUDA backend is enabled.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     for compiler in (GCC, CLANG):
@@ -678,12 +704,12 @@ def _remove_device_compiler_gcc_clang_enabled_cuda_backend(
 
 
 def _remove_specific_cuda_clang_combinations(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs, where clang is host-compiler for cuda sdk 11.3, 11.4 and 11.5.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
     remove_parameter_value_pairs(
@@ -699,7 +725,7 @@ def _remove_specific_cuda_clang_combinations(
 
 
 def _remove_unsupported_clang_sdk_versions_for_clang_cuda(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all CUDA SDK versions, which are not supported by a specific clang-cuda version.
@@ -710,7 +736,7 @@ def _remove_unsupported_clang_sdk_versions_for_clang_cuda(
 
     If clang-cuda version is new, than the latest supported clang-cuda version, do not filter it.
 
-    parameter_value_pairs (List[ParameterValuePair]): parameter-value-pair list
+    parameter_value_pairs (ParameterValuePairs): parameter-value-pair list
     removed_parameter_value_pairs (List[ParameterValuePair): list with removed parameter-value-pairs
     """
 
@@ -754,11 +780,16 @@ def _remove_unsupported_clang_sdk_versions_for_clang_cuda(
                                 return False
         return True
 
-    bi_filter(parameter_value_pairs, removed_parameter_value_pairs, filter_func)
+    bi_filter(
+        parameter_value_pairs,
+        removed_parameter_value_pairs,
+        filter_func,
+        (HOST_COMPILER, DEVICE_COMPILER, ALPAKA_ACC_GPU_CUDA_ENABLE),
+    )
 
 
 def _remove_unsupported_gcc_versions_for_ubuntu2004(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove pairs where GCC version 6 and older is used with Ubuntu 20.04 or newer.
@@ -781,7 +812,7 @@ def _remove_unsupported_gcc_versions_for_ubuntu2004(
 
 
 def _remove_unsupported_cmake_versions_for_clangcuda(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
@@ -798,7 +829,7 @@ def _remove_unsupported_cmake_versions_for_clangcuda(
 
 
 def _remove_all_rocm_images_older_than_ubuntu2004_based(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
 ):
     """Remove all pairs where Ubuntu is older than 20.04 and the HIP backend is enabled or the host
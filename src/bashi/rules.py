@@ -0,0 +1,176 @@
+"""Declarative registry of the filter rules.
+
+Each filter rule has an identifier (see docs/rules.md), the parameters which it reads and a
+predicate. The filter functions compiler_filter(), backend_filter() and
+software_dependency_filter() are generated from a RuleSet. Because each rule declares its
+parameters, a rule is only evaluated if all of its parameters are part of the
+parameter-value-tuple.
+"""
+
+from typing import Callable, Dict, FrozenSet, IO, List, NamedTuple, Optional, Tuple, TypeAlias
+import time
+
+from bashi.types import Parameter, ParameterValueTuple
+
+# A rule predicate returns True, if the parameter-value-tuple passes the rule. If it returns
+# False, it writes the reason in the output, if output is not None.
+RulePredicate: TypeAlias = Callable[[ParameterValueTuple, Optional[IO[str]]], bool]
+# filter function with an optional output for the reason, why the parameter-value-tuple does not
+# pass the filter
+RuleFilterFunction: TypeAlias = Callable[[ParameterValueTuple, Optional[IO[str]]], bool]
+
+# maximum number of different parameter sets, for which a generated filter function stores the
+# applicable rules
+MAX_CACHED_PARAMETER_SETS: int = 2**14
+
+Rule = NamedTuple(
+    "Rule",
+    [("rule_id", str), ("parameters", Tuple[Parameter, ...]), ("predicate", RulePredicate)],
+)
+
+
+class RuleProfiler:
+    """Collects for each rule identifier how often the rule was evaluated, how often it rejects a
+    parameter-value-tuple and the time spent in the rule predicate. Rules with the same identifier
+    are accumulated.
+    """
+
+    def __init__(self):
+        self.calls: Dict[str, int] = {}
+        self.rejections: Dict[str, int] = {}
+        self.time_ns: Dict[str, int] = {}
+
+    def record(self, rule_id: str, passed: bool, duration_ns: int):
+        """Adds a single evaluation of a rule.
+
+        Args:
+            rule_id (str): identifier of the rule
+            passed (bool): result of the rule predicate
+            duration_ns (int): evaluation time of the rule predicate in nano seconds
+        """
+        self.calls[rule_id] = self.calls.get(rule_id, 0) + 1
+        self.time_ns[rule_id] = self.time_ns.get(rule_id, 0) + duration_ns
+        if not passed:
+            self.rejections[rule_id] = self.rejections.get(rule_id, 0) + 1
+
+    def report(self) -> str:
+        """Returns a table with the statistics of each rule, sorted by the spent time.
+
+        Returns:
+            str: the table
+        """
+        lines = [f"{'rule':<6} {'calls':>10} {'rejections':>10} {'time [ms]':>10}"]
+        for rule_id in sorted(self.calls, key=lambda r: self.time_ns[r], reverse=True):
+            lines.append(
+                f"{rule_id:<6} {self.calls[rule_id]:>10} {self.rejections.get(rule_id, 0):>10} "
+                f"{self.time_ns[rule_id] / 1e6:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+class RuleSet:
+    """Ordered collection of filter rules. The rules are evaluated in the order in which they are
+    added. The first rule, which rejects a parameter-value-tuple, stops the evaluation.
+    """
+
+    def __init__(self):
+        self.rules: List[Rule] = []
+
+    def add(self, rule_id: str, parameters: Tuple[Parameter, ...], predicate: RulePredicate):
+        """Appends a rule to the rule set.
+
+        Args:
+            rule_id (str): Identifier of the rule, for example c1 or b42. Different rules can have
+                the same identifier, for example if the same rule is checked for the host and the
+                device compiler.
+            parameters (Tuple[Parameter, ...]): Parameters, which are read by the predicate. The
+                predicate is only called, if all parameters are part of the parameter-value-tuple.
+            predicate (RulePredicate): Returns False, if the parameter-value-tuple is not valid.
+        """
+        self.rules.append(Rule(rule_id, parameters, predicate))
+
+    def rule(
+        self, rule_id: str, *parameters: Parameter
+    ) -> Callable[[RulePredicate], RulePredicate]:
+        """Decorator version of add().
+
+        Args:
+            rule_id (str): identifier of the rule
+            parameters (Parameter): parameters, which are read by the predicate
+
+        Returns:
+            Callable[[RulePredicate], RulePredicate]: decorator, which returns the predicate
+                unchanged
+        """
+
+        def decorator(predicate: RulePredicate) -> RulePredicate:
+            self.add(rule_id, parameters, predicate)
+            return predicate
+
+        return decorator
+
+    def get_rule_parameters(self) -> Dict[str, Tuple[Parameter, ...]]:
+        """Returns for each rule identifier the parameters, which are read by the rule. If the same
+        identifier is used by more than one rule, the parameters of all rules are combined.
+
+        Returns:
+            Dict[str, Tuple[Parameter, ...]]: maps the rule identifier to the parameters
+        """
+        rule_parameters: Dict[str, Dict[Parameter, None]] = {}
+        for rule in self.rules:
+            params = rule_parameters.setdefault(rule.rule_id, {})
+            for param in rule.parameters:
+                params[param] = None
+        return {rule_id: tuple(params) for rule_id, params in rule_parameters.items()}
+
+    def make_filter(self, profiler: Optional[RuleProfiler] = None) -> RuleFilterFunction:
+        """Generates a filter function, which evaluates all rules in the order of the rule set.
+        Rules, whose parameters are not part of the parameter-value-tuple, are skipped. Later
+        changes of the rule set do not affect the generated filter function.
+
+        Args:
+            profiler (Optional[RuleProfiler], optional): If not None, the filter function records
+                the statistics of each evaluated rule in the profiler. Defaults to None.
+
+        Returns:
+            RuleFilterFunction: the filter function
+        """
+        rules = tuple(self.rules)
+        # the rules, which can be applied to a parameter-value-tuple, depends only on the
+        # parameters of the parameter-value-tuple
+        applicable_rules: Dict[FrozenSet[Parameter], Tuple[RulePredicate, ...]] = {}
+        if profiler is None:
+
+            def filter_function(row: ParameterValueTuple, output: Optional[IO[str]] = None) -> bool:
+                params = frozenset(row)
+                predicates = applicable_rules.get(params)
+                if predicates is None:
+                    if len(applicable_rules) >= MAX_CACHED_PARAMETER_SETS:
+                        applicable_rules.clear()
+                    predicates = tuple(
+                        rule.predicate for rule in rules if params.issuperset(rule.parameters)
+                    )
+                    applicable_rules[params] = predicates
+                for predicate in predicates:
+                    if not predicate(row, output):
+                        return False
+                return True
+
+            return filter_function
+
+        def profiled_filter_function(
+            row: ParameterValueTuple, output: Optional[IO[str]] = None
+        ) -> bool:
+            for rule in rules:
+                for param in rule.parameters:
+                    if param not in row:
+                        break
+                else:
+                    start = time.perf_counter_ns()
+                    passed = rule.predicate(row, output)
+                    profiler.record(rule.rule_id, passed, time.perf_counter_ns() - start)
+                    if not passed:
+                        return False
+            return True
+
+        return profiled_filter_function
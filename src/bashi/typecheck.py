@@ -0,0 +1,63 @@
+"""Optional runtime type checking of the bashi functions.
+
+The public functions of bashi are type checked at runtime with typeguard. Importing typeguard and
+instrumenting the functions takes most of the start-up time of short running processes like
+bashi-validate. Therefore, the bashi modules use the typechecked() decorator of this module, which
+applies the decorator of typeguard only if type checking is enabled.
+
+The functions are instrumented when their module is imported. Therefore, type checking needs to be
+disabled before the bashi modules are imported, either with set_typecheck_enabled() or by setting
+the environment variable BASHI_TYPECHECK=0.
+"""
+
+from typing import Any, Callable, Tuple, TypeVar
+import os
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+# values of the environment variable BASHI_TYPECHECK, which disable the type checking
+TYPECHECK_DISABLED_VALUES: Tuple[str, ...] = ("0", "false", "off", "no")
+
+# if False, typechecked() returns the function without instrumentation
+_typecheck_enabled: bool = (  # pylint: disable=invalid-name
+    os.environ.get("BASHI_TYPECHECK", "1").strip().lower() not in TYPECHECK_DISABLED_VALUES
+)
+
+
+def set_typecheck_enabled(enabled: bool):
+    """Enable or disable the type checking of the bashi functions. Affects only functions of
+    modules, which are imported afterwards.
+
+    Args:
+        enabled (bool): If False, typeguard is not imported and the functions are not instrumented.
+    """
+    global _typecheck_enabled  # pylint: disable=global-statement
+    _typecheck_enabled = enabled
+
+
+def is_typecheck_enabled() -> bool:
+    """Returns whether the bashi functions are type checked.
+
+    Returns:
+        bool: True if typechecked() instruments the functions.
+    """
+    return _typecheck_enabled
+
+
+def typechecked(target: T) -> T:
+    """Decorator, which checks the types of the arguments and the return value with typeguard, if
+    type checking is enabled.
+
+    Args:
+        target (T): function or class to decorate
+
+    Returns:
+        T: instrumented function or class if type checking is enabled, otherwise the target itself
+    """
+    if not _typecheck_enabled:
+        return target
+
+    # typeguard is expensive to import, therefore import it only on demand
+    from typeguard import typechecked as typeguard_typechecked  # pylint: disable=C0415
+
+    return typeguard_typechecked(target)
@@ -23,3 +23,5 @@ CombinationList: TypeAlias = List[Combination]
 
 # function signature of a filter function
 FilterFunction: TypeAlias = Callable[[ParameterValueTuple], bool]
+# function signature of a cost function, returns the cost of a parameter-value
+CostFunction: TypeAlias = Callable[[Parameter, ParameterValue], float]
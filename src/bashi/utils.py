@@ -2,13 +2,28 @@
 
 import dataclasses
 import sys
+from array import array
 from collections import OrderedDict
-from typing import IO, Dict, List, Optional, Union, Callable
+from typing import (
+    IO,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeAlias,
+    Union,
+)
 
 import packaging.version
-from packaging.specifiers import SpecifierSet, InvalidSpecifier
-from typeguard import typechecked
 
+from bashi.typecheck import typechecked
+from bashi.interning import intern_version
+from bashi.encoding import EncodedMatrix
 from bashi.types import (
     CombinationList,
     FilterFunction,
@@ -19,24 +34,10 @@ from bashi.types import (
     ParameterValueSingle,
     ParameterValueTuple,
     ValueName,
+    ValueVersion,
 )
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 
-# short names for parameter
-PARAMETER_SHORT_NAME: dict[Parameter, str] = {
-    HOST_COMPILER: "host",
-    DEVICE_COMPILER: "device",
-    ALPAKA_ACC_CPU_B_OMP2_T_SEQ_ENABLE: "bOpenMP2thread",
-    ALPAKA_ACC_CPU_B_SEQ_T_OMP2_ENABLE: "bOpenMP2block",
-    ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE: "bSeq",
-    ALPAKA_ACC_CPU_B_SEQ_T_THREADS_ENABLE: "bThreads",
-    ALPAKA_ACC_CPU_B_TBB_T_SEQ_ENABLE: "bTBB",
-    ALPAKA_ACC_GPU_CUDA_ENABLE: "bCUDA",
-    ALPAKA_ACC_GPU_HIP_ENABLE: "bHIP",
-    ALPAKA_ACC_SYCL_ENABLE: "bSYCL",
-    CXX_STANDARD: "c++",
-}
-
 
 @dataclasses.dataclass
 class FilterAdapter:
@@ -125,15 +126,15 @@ def create_parameter_value_pair(  # pylint: disable=too-many-arguments
     if isinstance(value_version1, packaging.version.Version):
         parsed_value_version1: packaging.version.Version = value_version1
     else:
-        parsed_value_version1: packaging.version.Version = packaging.version.parse(  # type: ignore
-            str(value_version1)
+        parsed_value_version1: packaging.version.Version = intern_version(  # type: ignore
+            value_version1
         )
 
     if isinstance(value_version2, packaging.version.Version):
         parsed_value_version2: packaging.version.Version = value_version2
     else:
-        parsed_value_version2: packaging.version.Version = packaging.version.parse(  # type: ignore
-            str(value_version2)
+        parsed_value_version2: packaging.version.Version = intern_version(  # type: ignore
+            value_version2
         )
 
     return ParameterValuePair(
@@ -192,35 +193,298 @@ def _loop_over_parameter_values(
         v1_parameter (Parameter): the first parameter
         v2_parameter (Parameter): the second parameter
     """
-    for v1_name, v1_version in parameters[v1_parameter]:
-        for v2_name, v2_version in parameters[v2_parameter]:
+    # the parameter-values of the matrix contain already parsed versions, therefore
+    # create_parameter_value_pair() is not required
+    for v1_param_val in parameters[v1_parameter]:
+        first = ParameterValueSingle(v1_parameter, v1_param_val)
+        for v2_param_val in parameters[v2_parameter]:
             expected_pairs.append(
-                create_parameter_value_pair(
-                    v1_parameter, v1_name, v1_version, v2_parameter, v2_name, v2_version
-                )
+                ParameterValuePair(first, ParameterValueSingle(v2_parameter, v2_param_val))
             )
 
 
+class ParameterValuePairIndex:  # pylint: disable=too-many-instance-attributes
+    """Array-backed store of a list of parameter-value-pairs.
+
+    The parameters, value-names and value-versions of both parameter-values are encoded as integers
+    and stored column-wise in arrays. For each column and each encoded value, the store holds a
+    bitset (Python int) of the positions of all pairs with this value. Search criteria are
+    translated into bitsets, and removal is done with bitwise operations instead of calling a
+    Python function per pair. Version ranges are resolved once to the set of matching version ids.
+
+    remove_parameter_value_pairs() and bi_filter() accept a ParameterValuePairIndex instead of a
+    list. Removed pairs are only marked as removed. The order of the remaining and removed
+    parameter-value-pairs is the same like with a list.
+    """
+
+    def __init__(self, parameter_value_pairs: List[ParameterValuePair]):
+        """Create the store.
+
+        Args:
+            parameter_value_pairs (List[ParameterValuePair]): The stored parameter-value-pairs. The
+                list is copied.
+        """
+        self._pairs: List[ParameterValuePair] = list(parameter_value_pairs)
+        # the parameter-values of the pairs are encoded like the parameter-values of a
+        # parameter-value-matrix, which contains each parameter-value of the pairs
+        pair_matrix: Dict[Parameter, Dict[ParameterValue, None]] = OrderedDict()
+        for pair in self._pairs:
+            for param, param_val in pair:
+                pair_matrix.setdefault(param, {})[param_val] = None
+        self._encoded = EncodedMatrix(
+            OrderedDict((param, list(param_vals)) for param, param_vals in pair_matrix.items())
+        )
+        self._parameter_ids: Dict[Parameter, int] = self._encoded.parameter_ids
+        self._name_ids: Dict[ValueName, int] = self._encoded.name_ids
+        self._version_ids: Dict[packaging.version.Version, int] = self._encoded.version_ids
+        first_value_ids = [self._encoded.value_ids[pair.first] for pair in self._pairs]
+        second_value_ids = [self._encoded.value_ids[pair.second] for pair in self._pairs]
+        # columns: parameter1, value-name1, value-version1, parameter2, value-name2, value-version2
+        self._columns: Tuple[array, ...] = tuple(
+            array("I", (encoded_column[value_id] for value_id in value_ids))
+            for value_ids in (first_value_ids, second_value_ids)
+            for encoded_column in (
+                self._encoded.value_parameter,
+                self._encoded.value_name,
+                self._encoded.version_key,
+            )
+        )
+        # for each column, the bitset of the pair positions for each encoded value
+        self._masks: List[List[int]] = [
+            [
+                _positions_to_mask(positions, len(self._pairs))
+                for positions in _group_positions(column, number_of_ids)
+            ]
+            for column, number_of_ids in zip(
+                self._columns,
+                (len(self._parameter_ids), len(self._name_ids), len(self._version_ids)) * 2,
+            )
+        ]
+        self._all = (1 << len(self._pairs)) - 1
+        # bitset of the remaining pairs
+        self._alive = self._all
+        self._size = len(self._pairs)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[ParameterValuePair]:
+        for position in _mask_to_positions(self._alive):
+            yield self._pairs[position]
+
+    def get_pairs(self) -> List[ParameterValuePair]:
+        """Returns the remaining parameter-value-pairs.
+
+        Returns:
+            List[ParameterValuePair]: remaining parameter-value-pairs in the original order
+        """
+        return list(self)
+
+    def _get_mask(self, column: int, ids: Dict[str, int], value: str, any_value: str) -> int:
+        """Returns the bitset of the pairs, whose column has the value. any_value matches all
+        pairs."""
+        if value == any_value:
+            return self._all
+        value_id = ids.get(value)
+        if value_id is None:
+            return 0
+        return self._masks[column][value_id]
+
+    def _get_version_mask(
+        self, column: int, version_filter: Callable[[packaging.version.Version], bool]
+    ) -> int:
+        """Returns the bitset of the pairs, whose version column passes the version filter. The
+        version filter is called only once for each distinct version."""
+        mask = 0
+        for version, version_id in self._version_ids.items():
+            if version_filter(version):
+                mask |= self._masks[column][version_id]
+        return mask
+
+    def _get_versions_mask(
+        self, value_version1: Union[int, float, str], value_version2: Union[int, float, str]
+    ) -> int:
+        """Returns the bitset of the pairs, which match the version search criteria of
+        remove_parameter_value_pairs()."""
+        # packaging.specifiers is expensive to import and not required by the filter functions
+        from packaging.specifiers import SpecifierSet  # pylint: disable=import-outside-toplevel
+
+        if (
+            value_version1 != ANY_VERSION
+            and value_version2 != ANY_VERSION
+            and _is_specifier_set(value_version1)
+            and _is_specifier_set(value_version2)
+        ):
+            specifier_set_version1 = SpecifierSet(str(value_version1))
+            specifier_set_version2 = SpecifierSet(str(value_version2))
+            return self._all & ~(
+                self._get_version_mask(2, lambda version: version in specifier_set_version1)
+                & self._get_version_mask(5, lambda version: version in specifier_set_version2)
+            )
+
+        mask = self._all
+        for column, value_version in ((2, value_version1), (5, value_version2)):
+            if value_version == ANY_VERSION:
+                continue
+            if _is_specifier_set(value_version):
+                specifier_set = SpecifierSet(str(value_version))
+                mask &= self._get_version_mask(
+                    column,
+                    lambda version, specifier_set=specifier_set: (  # type: ignore
+                        version not in specifier_set
+                    ),
+                )
+            else:
+                version_id = self._version_ids.get(intern_version(value_version))
+                mask &= 0 if version_id is None else self._masks[column][version_id]
+        return mask
+
+    def _remove_mask(self, mask: int, removed_parameter_value_pairs: List[ParameterValuePair]):
+        """Removes all remaining pairs of the bitset."""
+        mask &= self._alive
+        for position in _mask_to_positions(mask):
+            removed_parameter_value_pairs.append(self._pairs[position])
+            self._size -= 1
+        self._alive &= ~mask
+
+    def _remove_matching(
+        self,
+        first: Tuple[Parameter, ValueName, Union[int, float, str]],
+        second: Tuple[Parameter, ValueName, Union[int, float, str]],
+        removed_parameter_value_pairs: List[ParameterValuePair],
+    ):
+        """Removes all pairs, which match the search criteria of the first and second
+        parameter-value."""
+        self._remove_mask(
+            self._get_mask(0, self._parameter_ids, first[0], ANY_PARAM)
+            & self._get_mask(1, self._name_ids, first[1], ANY_NAME)
+            & self._get_mask(3, self._parameter_ids, second[0], ANY_PARAM)
+            & self._get_mask(4, self._name_ids, second[1], ANY_NAME)
+            & self._get_versions_mask(first[2], second[2]),
+            removed_parameter_value_pairs,
+        )
+
+    def remove(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        removed_parameter_value_pairs: List[ParameterValuePair],
+        parameter1: Parameter = ANY_PARAM,
+        value_name1: ValueName = ANY_NAME,
+        value_version1: Union[int, float, str] = ANY_VERSION,
+        parameter2: Parameter = ANY_PARAM,
+        value_name2: ValueName = ANY_NAME,
+        value_version2: Union[int, float, str] = ANY_VERSION,
+        symmetric: bool = True,
+    ) -> bool:
+        """Implementation of remove_parameter_value_pairs() with bitwise operations. See
+        remove_parameter_value_pairs() for the description of the arguments.
+
+        Returns:
+            bool: Return True, if parameter-value-pair was removed.
+        """
+        size_before = self._size
+        criteria1 = (parameter1, value_name1, value_version1)
+        criteria2 = (parameter2, value_name2, value_version2)
+        self._remove_matching(criteria1, criteria2, removed_parameter_value_pairs)
+        if symmetric:
+            self._remove_matching(criteria2, criteria1, removed_parameter_value_pairs)
+
+        return size_before != self._size
+
+    def bi_filter(
+        self,
+        removed_parameter_value_pairs: List[ParameterValuePair],
+        filter_function: Callable[[ParameterValuePair], bool],
+        parameters: Optional[Collection[Parameter]] = None,
+    ):
+        """Implementation of bi_filter() for the store. See bi_filter() for the description of the
+        arguments.
+        """
+        candidates = self._alive
+        if parameters is not None:
+            first_mask = 0
+            second_mask = 0
+            for param in parameters:
+                first_mask |= self._get_mask(0, self._parameter_ids, param, ANY_PARAM)
+                second_mask |= self._get_mask(3, self._parameter_ids, param, ANY_PARAM)
+            candidates &= first_mask & second_mask
+
+        self._remove_mask(
+            _positions_to_mask(
+                (
+                    position
+                    for position in _mask_to_positions(candidates)
+                    if not filter_function(self._pairs[position])
+                ),
+                len(self._pairs),
+            ),
+            removed_parameter_value_pairs,
+        )
+
+
+def _group_positions(column: array, number_of_ids: int) -> List[List[int]]:
+    """Returns for each id the positions in the column, which have the id."""
+    positions: List[List[int]] = [[] for _ in range(number_of_ids)]
+    for position, value_id in enumerate(column):
+        positions[value_id].append(position)
+    return positions
+
+
+def _positions_to_mask(positions: Iterable[int], size: int) -> int:
+    """Returns a bitset, where the bits of the positions are set."""
+    bits = bytearray(b"0" * size)
+    for position in positions:
+        bits[size - 1 - position] = ord("1")
+    return int(bits, 2) if size else 0
+
+
+def _mask_to_positions(mask: int) -> Iterator[int]:
+    """Returns the positions of the set bits of a bitset in ascending order."""
+    bits = format(mask, "b")[::-1]
+    position = bits.find("1")
+    while position != -1:
+        yield position
+        position = bits.find("1", position + 1)
+
+
+# list of parameter-value-pairs, which can be modified by bi_filter() and
+# remove_parameter_value_pairs()
+ParameterValuePairs: TypeAlias = Union[List[ParameterValuePair], ParameterValuePairIndex]
+
+
 @typechecked
 def bi_filter(
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
     filter_function: Callable[[ParameterValuePair], bool],
+    parameters: Optional[Collection[Parameter]] = None,
 ):
     """Filtering of parameter-value-pairs according to the specified filter function and put the
     filtered entries in the list of removed parameter-value-pairs.
 
     Args:
-        parameter_value_pairs (List[ParameterValuePair]): List to be filtered
+        parameter_value_pairs (ParameterValuePairs): List or ParameterValuePairIndex to be filtered
         removed_parameter_value_pairs (List[ParameterValuePair]): List into which the filtered
             elements are inserted
         filter_function (Callable[[ParameterValuePair], bool]): Filter function. Returns true if the
             element is to remain in parameter_value_pairs.
+        parameters (Optional[Collection[Parameter]], optional): If not None, the filter function
+            is only called for parameter-value-pairs whose both parameters are part of parameters.
+            All other parameter-value-pairs remain. Defaults to None.
     """
+    if isinstance(parameter_value_pairs, ParameterValuePairIndex):
+        parameter_value_pairs.bi_filter(removed_parameter_value_pairs, filter_function, parameters)
+        return
+
     tmp_parameter_value_pairs: List[ParameterValuePair] = []
 
     for param_val_pair in parameter_value_pairs:
-        if filter_function(param_val_pair):
+        if (
+            parameters is not None
+            and (
+                param_val_pair.first.parameter not in parameters
+                or param_val_pair.second.parameter not in parameters
+            )
+        ) or filter_function(param_val_pair):
             tmp_parameter_value_pairs.append(param_val_pair)
         else:
             removed_parameter_value_pairs.append(param_val_pair)
@@ -228,10 +492,20 @@ def bi_filter(
     parameter_value_pairs[:] = tmp_parameter_value_pairs
 
 
-# pylint: disable=too-many-locals
+def _is_specifier_set(version: Union[int, float, str]) -> bool:
+    # pylint: disable=import-outside-toplevel
+    from packaging.specifiers import SpecifierSet, InvalidSpecifier
+
+    try:
+        SpecifierSet(str(version))
+        return True
+    except InvalidSpecifier:
+        return False
+
+
 @typechecked
 def remove_parameter_value_pairs(  # pylint: disable=too-many-arguments
-    parameter_value_pairs: List[ParameterValuePair],
+    parameter_value_pairs: ParameterValuePairs,
     removed_parameter_value_pairs: List[ParameterValuePair],
     parameter1: Parameter = ANY_PARAM,
     value_name1: ValueName = ANY_NAME,
@@ -246,8 +520,10 @@ def remove_parameter_value_pairs(  # pylint: disable=too-many-arguments
     criteria is `ANY_*`. If a criterion is `ANY_*`, it is ignored and it is always a match.
 
     Args:
-        parameter_value_pairs (List[ParameterValuePair]): list where parameter-value-pairs will be
-            removed
+        parameter_value_pairs (ParameterValuePairs): list where parameter-value-pairs will be
+            removed. A list is filtered in a single pass. If it is a ParameterValuePairIndex,
+            only the matching buckets are searched, which is faster if many search criteria are
+            applied to the same parameter-value-pairs.
         parameter1 (Parameter, optional): Name of the first parameter. Defaults to ANY_PARAM.
         value_name1 (ValueName, optional): Name of the first value-name. Defaults to ANY_NAME.
         value_version1 (Union[int, float, str], optional): Name of the first value-version. Either
@@ -268,96 +544,216 @@ def remove_parameter_value_pairs(  # pylint: disable=too-many-arguments
     Returns:
         bool: Return True, if parameter-value-pair was removed.
     """
-    filter_list: List[Callable[[ParameterValuePair], bool]] = []
-    if parameter1 != ANY_PARAM:
-        filter_list.append(lambda param_val: param_val.first.parameter == parameter1)
+    if isinstance(parameter_value_pairs, ParameterValuePairIndex):
+        return parameter_value_pairs.remove(
+            removed_parameter_value_pairs,
+            parameter1,
+            value_name1,
+            value_version1,
+            parameter2,
+            value_name2,
+            value_version2,
+            symmetric,
+        )
+
+    # building a ParameterValuePairIndex costs more than a single pass over the list, therefore
+    # a list is filtered directly
+    matches = _get_pair_matcher(
+        parameter1, value_name1, value_version1, parameter2, value_name2, value_version2
+    )
+    matches_swapped = _get_pair_matcher(  # pylint: disable=arguments-out-of-order
+        parameter2, value_name2, value_version2, parameter1, value_name1, value_version1
+    )
+    remaining: List[ParameterValuePair] = []
+    removed: List[ParameterValuePair] = []
+    # pairs, which only match the swapped search criteria, are removed after the pairs, which
+    # match the search criteria
+    removed_swapped: List[ParameterValuePair] = []
+    for param_val_pair in parameter_value_pairs:
+        if matches(param_val_pair):
+            removed.append(param_val_pair)
+        elif symmetric and matches_swapped(param_val_pair):
+            removed_swapped.append(param_val_pair)
+        else:
+            remaining.append(param_val_pair)
+
+    if not removed and not removed_swapped:
+        return False
+    removed_parameter_value_pairs += removed
+    removed_parameter_value_pairs += removed_swapped
+    parameter_value_pairs[:] = remaining
+    return True
+
+
+def _get_pair_matcher(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    parameter1: Parameter,
+    value_name1: ValueName,
+    value_version1: Union[int, float, str],
+    parameter2: Parameter,
+    value_name2: ValueName,
+    value_version2: Union[int, float, str],
+) -> Callable[[ParameterValuePair], bool]:
+    """Returns a function, which checks if a parameter-value-pair matches the search criteria of
+    remove_parameter_value_pairs() without swapping the first and second parameter-value."""
+    versions_match = _get_versions_matcher(value_version1, value_version2)
+    any_version = value_version1 == ANY_VERSION and value_version2 == ANY_VERSION
+
+    def matches(param_val_pair: ParameterValuePair) -> bool:
+        # the comparisons are not merged with `in`, because creating a tuple per call is slower
+        # pylint: disable=consider-using-in
+        first, second = param_val_pair
+        if parameter1 != ANY_PARAM and first[0] != parameter1:
+            return False
+        if parameter2 != ANY_PARAM and second[0] != parameter2:
+            return False
+        if value_name1 != ANY_NAME and first[1][0] != value_name1:
+            return False
+        if value_name2 != ANY_NAME and second[1][0] != value_name2:
+            return False
+        return any_version or versions_match(first[1][1], second[1][1])
 
-    if value_name1 != ANY_NAME:
-        filter_list.append(lambda param_val: param_val.first.parameterValue.name == value_name1)
+    return matches
 
-    if parameter2 != ANY_PARAM:
-        filter_list.append(lambda param_val: param_val.second.parameter == parameter2)
 
-    if value_name2 != ANY_NAME:
-        filter_list.append(lambda param_val: param_val.second.parameterValue.name == value_name2)
+def _get_versions_matcher(
+    value_version1: Union[int, float, str], value_version2: Union[int, float, str]
+) -> Callable[[ValueVersion, ValueVersion], bool]:
+    """Returns a function, which checks if the value-versions of a parameter-value-pair match the
+    version search criteria of remove_parameter_value_pairs(). Version ranges are checked only once
+    for each distinct version."""
+    # packaging.specifiers is expensive to import and not required by the filter functions
+    from packaging.specifiers import SpecifierSet  # pylint: disable=import-outside-toplevel
 
-    def is_specifier_set(version: Union[int, float, str]) -> bool:
-        try:
-            SpecifierSet(str(version))
-            return True
-        except InvalidSpecifier:
-            return False
+    def in_range(value_version: Union[int, float, str]) -> Callable[[ValueVersion], bool]:
+        specifier_set = SpecifierSet(str(value_version))
+        results: Dict[ValueVersion, bool] = {}
+
+        def contains(version: ValueVersion) -> bool:
+            result = results.get(version)
+            if result is None:
+                result = results[version] = version in specifier_set
+            return result
+
+        return contains
 
     if (
         value_version1 != ANY_VERSION
         and value_version2 != ANY_VERSION
-        and is_specifier_set(value_version1)
-        and is_specifier_set(value_version2)
+        and _is_specifier_set(value_version1)
+        and _is_specifier_set(value_version2)
     ):
-        specifier_set_version1 = SpecifierSet(str(value_version1))
-        specifier_set_version2 = SpecifierSet(str(value_version2))
+        in_range1 = in_range(value_version1)
+        in_range2 = in_range(value_version2)
+        return lambda version1, version2: not (in_range1(version1) and in_range2(version2))
+
+    def version_matcher(value_version: Union[int, float, str]) -> Callable[[ValueVersion], bool]:
+        if value_version == ANY_VERSION:
+            return lambda _: True
+        if _is_specifier_set(value_version):
+            contains = in_range(value_version)
+            return lambda version: not contains(version)
+        parsed_version = intern_version(value_version)
+        return lambda version: version == parsed_version
+
+    version_matches1 = version_matcher(value_version1)
+    version_matches2 = version_matcher(value_version2)
+    return lambda version1, version2: version_matches1(version1) and version_matches2(version2)
+
+
+class ParameterValuePairCoverage:
+    """Set of all parameter-value-pairs, which are covered by a combination-list.
+
+    The set is created in a single pass over the combination-list. Afterwards, checking if a
+    parameter-value-pair is part of at least one combination is a single hash lookup instead of a
+    scan over the whole combination-list.
+    """
 
-        filter_list.append(
-            lambda param_val: not (
-                param_val.first.parameterValue.version in specifier_set_version1
-                and param_val.second.parameterValue.version in specifier_set_version2
-            )
-        )
+    def __init__(self, combination_list: CombinationList):
+        """Collect the covered parameter-value-pairs.
 
-    else:
-        if value_version1 != ANY_VERSION:
-            try:
-                specifier_set_version1 = SpecifierSet(str(value_version1))
-                filter_list.append(
-                    lambda param_val: not param_val.first.parameterValue.version
-                    in specifier_set_version1
-                )
-            except InvalidSpecifier:
-                parsed_value_version1 = packaging.version.parse(str(value_version1))
-                filter_list.append(
-                    lambda param_val: param_val.first.parameterValue.version
-                    == parsed_value_version1
-                )
+        Args:
+            combination_list (CombinationList): list of combinations
+        """
+        # stores each pair only in the order of the parameters in the combination, the other order
+        # is checked by the lookup
+        self._covered: Set[Tuple[Parameter, ParameterValue, Parameter, ParameterValue]] = set()
+        for comb in combination_list:
+            items = list(comb.items())
+            for index, (param1, param_val1) in enumerate(items):
+                for param2, param_val2 in items[index + 1 :]:
+                    self._covered.add((param1, param_val1, param2, param_val2))
+
+    def __contains__(self, param_val_pair: ParameterValuePair) -> bool:
+        (param1, param_val1), (param2, param_val2) = param_val_pair
+        return (param1, param_val1, param2, param_val2) in self._covered or (
+            param2,
+            param_val2,
+            param1,
+            param_val1,
+        ) in self._covered
+
+    def get_missing_pairs(
+        self, parameter_value_pairs: Iterable[ParameterValuePair]
+    ) -> List[ParameterValuePair]:
+        """Returns all parameter-value-pairs, which are not part of any combination.
 
-        if value_version2 != ANY_VERSION:
-            try:
-                specifier_set_version2 = SpecifierSet(str(value_version2))
-                filter_list.append(
-                    lambda param_val: not param_val.second.parameterValue.version
-                    in specifier_set_version2
-                )
-            except InvalidSpecifier:
-                parsed_value_version2 = packaging.version.parse(str(value_version2))
-                filter_list.append(
-                    lambda param_val: param_val.second.parameterValue.version
-                    == parsed_value_version2
-                )
+        Args:
+            parameter_value_pairs (Iterable[ParameterValuePair]): expected parameter-value-pairs
 
-    def filter_func(param_value_pair: ParameterValuePair) -> bool:
-        return_value = True
+        Returns:
+            List[ParameterValuePair]: missing parameter-value-pairs in the input order
+        """
+        return [pair for pair in parameter_value_pairs if pair not in self]
 
-        for f in filter_list:
-            return_value = return_value and f(param_value_pair)
+    def get_found_pairs(
+        self, parameter_value_pairs: Iterable[ParameterValuePair]
+    ) -> List[ParameterValuePair]:
+        """Returns all parameter-value-pairs, which are part of at least one combination.
 
-        return not return_value
+        Args:
+            parameter_value_pairs (Iterable[ParameterValuePair]): parameter-value-pairs to search
+                for
 
-    len_before = len(parameter_value_pairs)
-    bi_filter(parameter_value_pairs, removed_parameter_value_pairs, filter_func)
+        Returns:
+            List[ParameterValuePair]: found parameter-value-pairs in the input order
+        """
+        return [pair for pair in parameter_value_pairs if pair in self]
 
-    if symmetric:
-        remove_parameter_value_pairs(
-            parameter_value_pairs,
-            removed_parameter_value_pairs,
-            parameter2,
-            value_name2,
-            value_version2,
-            parameter1,
-            value_name1,
-            value_version1,
-            symmetric=False,
-        )
 
-    return len_before != len(parameter_value_pairs)
+@typechecked
+def get_missing_parameter_value_pairs(
+    combination_list: CombinationList,
+    parameter_value_pairs: List[ParameterValuePair],
+) -> List[ParameterValuePair]:
+    """Returns all parameter-value-pairs, which does not exist in any combination.
+
+    Args:
+        combination_list (CombinationList): list of given combination
+        parameter_value_pairs (List[ParameterValuePair]): list of parameter-value-pair to be search
+            for
+
+    Returns:
+        List[ParameterValuePair]: missing parameter-value-pairs
+    """
+    return ParameterValuePairCoverage(combination_list).get_missing_pairs(parameter_value_pairs)
+
+
+@typechecked
+def get_unexpected_parameter_value_pairs(
+    combination_list: CombinationList,
+    parameter_value_pairs: List[ParameterValuePair],
+) -> List[ParameterValuePair]:
+    """Returns all given parameter-value-pairs, which exist in at least one combination.
+
+    Args:
+        combination_list (CombinationList): list of given combination
+        parameter_value_pairs (List[ParameterValuePair]): list of unexpected parameter-value-pairs
+            to be search for
+
+    Returns:
+        List[ParameterValuePair]: unexpected parameter-value-pairs found in the combination-list
+    """
+    return ParameterValuePairCoverage(combination_list).get_found_pairs(parameter_value_pairs)
 
 
 @typechecked
@@ -378,23 +774,12 @@ def check_parameter_value_pair_in_combination_list(
     Returns:
         bool: returns True, if all given parameter-values-pairs was found in the combination-list
     """
-    missing_expected_param = False
-
-    for ex_param_val_pair in parameter_value_pairs:
-        param1, param_val1 = ex_param_val_pair[0]
-        param2, param_val2 = ex_param_val_pair[1]
-        found = False
-        for comb in combination_list:
-            # comb contains all parameters, therefore a check is not required
-            if comb[param1] == param_val1 and comb[param2] == param_val2:
-                found = True
-                break
+    missing_pairs = get_missing_parameter_value_pairs(combination_list, parameter_value_pairs)
 
-        if not found:
-            print(f"{ex_param_val_pair} is missing in combination list", file=output)
-            missing_expected_param = True
+    for ex_param_val_pair in missing_pairs:
+        print(f"{ex_param_val_pair} is missing in combination list", file=output)
 
-    return not missing_expected_param
+    return not missing_pairs
 
 
 @typechecked
@@ -415,23 +800,15 @@ def check_unexpected_parameter_value_pair_in_combination_list(
     Returns:
         bool: returns True, if no given parameter-values-pairs was found in the combination-list
     """
-    found_unexpected_param = False
+    unexpected_pairs = get_unexpected_parameter_value_pairs(combination_list, parameter_value_pairs)
 
-    for ex_param_val_pair in parameter_value_pairs:
-        param1, param_val1 = ex_param_val_pair[0]
-        param2, param_val2 = ex_param_val_pair[1]
-        for comb in combination_list:
-            # comb contains all parameters, therefore a check is not required
-            if comb[param1] == param_val1 and comb[param2] == param_val2:
-                print(
-                    f"found unexpected parameter-value-pair {ex_param_val_pair} "
-                    "in combination list",
-                    file=output,
-                )
-                found_unexpected_param = True
-                break
+    for ex_param_val_pair in unexpected_pairs:
+        print(
+            f"found unexpected parameter-value-pair {ex_param_val_pair} in combination list",
+            file=output,
+        )
 
-    return not found_unexpected_param
+    return not unexpected_pairs
 
 
 def reason(output: Optional[IO[str]], msg: str):
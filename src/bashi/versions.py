@@ -1,12 +1,21 @@
 """Provides all supported software versions"""
 
 import copy
-from typing import Dict, List, Union
+import functools
+import types
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, NoReturn, Optional, Tuple, Union
 from collections import OrderedDict
-from typeguard import typechecked
-import packaging.version as pkv
+from bashi.typecheck import typechecked
+from bashi.interning import intern_version
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
-from bashi.types import ValueName, ValueVersion, ParameterValue, ParameterValueMatrix
+from bashi.types import (
+    Parameter,
+    ValueName,
+    ValueVersion,
+    ParameterValue,
+    ParameterValueList,
+    ParameterValueMatrix,
+)
 
 
 class VersionSupportBase:
@@ -17,8 +26,8 @@ class VersionSupportBase:
     """
 
     def __init__(self, version1: str, version2: str):
-        self.version1 = pkv.parse(version1)
-        self.version2 = pkv.parse(version2)
+        self.version1 = intern_version(version1)
+        self.version2 = intern_version(version2)
 
     def __lt__(self, other: "VersionSupportBase") -> bool:
         return self.version1 < other.version1
@@ -64,44 +73,133 @@ class ClangCudaSDKSupport(VersionSupportBase):
         return f"Clang-CUDA {str(self.clang_cuda)} + CUDA SDK {self.cuda}"
 
 
-VERSIONS: Dict[str, List[Union[str, int, float]]] = {
-    GCC: [6, 7, 8, 9, 10, 11, 12, 13],
-    CLANG: [6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17],
-    NVCC: [
-        10.0,
-        10.1,
-        10.2,
-        11.0,
-        11.1,
-        11.2,
-        11.3,
-        11.4,
-        11.5,
-        11.6,
-        11.7,
-        11.8,
-        12.0,
-        12.1,
-        12.2,
-        12.3,
-    ],
-    HIPCC: [5.0, 5.1, 5.2, 5.3, 5.4, 5.5, 5.6, 5.7, 6.0],
-    ICPX: ["2023.1.0", "2023.2.0"],
-    UBUNTU: [18.04, 20.04],
-    CMAKE: [3.18, 3.19, 3.20, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26],
-    BOOST: [
-        "1.74.0",
-        "1.75.0",
-        "1.76.0",
-        "1.77.0",
-        "1.78.0",
-        "1.79.0",
-        "1.80.0",
-        "1.81.0",
-        "1.82.0",
-    ],
-    CXX_STANDARD: [17, 20],
-}
+# incremented by each modification of VERSIONS
+# the cached tables, which are derived from VERSIONS, store the stamp they were built from
+_versions_stamp: int = 0  # pylint: disable=invalid-name
+
+
+def _versions_changed():
+    """Invalidates all cached tables, which are derived from VERSIONS."""
+    global _versions_stamp  # pylint: disable=global-statement
+    _versions_stamp += 1
+
+
+def _invalidating(method: Any) -> Any:
+    """Wraps a modifying method of the version table, so that it invalidates the derived tables.
+
+    Args:
+        method (Any): method of list or dict
+
+    Returns:
+        Any: wrapped method
+    """
+
+    @functools.wraps(method)
+    def invalidating_method(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _versions_changed()
+
+    return invalidating_method
+
+
+class _VersionList(List[Union[str, int, float]]):
+    """List of the versions of a software in VERSIONS. Each modification invalidates the tables
+    derived from VERSIONS.
+    """
+
+    __setitem__ = _invalidating(list.__setitem__)
+    __delitem__ = _invalidating(list.__delitem__)
+    __iadd__ = _invalidating(list.__iadd__)
+    __imul__ = _invalidating(list.__imul__)
+    append = _invalidating(list.append)
+    extend = _invalidating(list.extend)
+    insert = _invalidating(list.insert)
+    remove = _invalidating(list.remove)
+    pop = _invalidating(list.pop)
+    clear = _invalidating(list.clear)
+    sort = _invalidating(list.sort)
+    reverse = _invalidating(list.reverse)
+
+
+class _VersionTable(Dict[str, List[Union[str, int, float]]]):
+    """Table of the supported versions of each software. Each modification of the table or of one
+    of its version lists invalidates the tables derived from VERSIONS, therefore checking whether
+    a derived table is up to date takes constant time. Assigned version lists are copied.
+    """
+
+    def __init__(self, versions: Dict[str, List[Union[str, int, float]]]):
+        super().__init__()
+        self.update(versions)
+
+    def __setitem__(self, name: str, versions: List[Union[str, int, float]]):
+        if not isinstance(versions, _VersionList):
+            versions = _VersionList(versions)
+        super().__setitem__(name, versions)
+        _versions_changed()
+
+    def update(self, *args: Any, **kwargs: Any):  # pylint: disable=arguments-differ
+        for name, versions in dict(*args, **kwargs).items():
+            self[name] = versions
+
+    def setdefault(  # pylint: disable=arguments-renamed
+        self, name: str, default: List[Union[str, int, float]]
+    ) -> List[Union[str, int, float]]:
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def __ior__(self, other: Any) -> "_VersionTable":  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    __delitem__ = _invalidating(dict.__delitem__)
+    pop = _invalidating(dict.pop)
+    popitem = _invalidating(dict.popitem)
+    clear = _invalidating(dict.clear)
+
+
+VERSIONS: Dict[str, List[Union[str, int, float]]] = _VersionTable(
+    {
+        GCC: [6, 7, 8, 9, 10, 11, 12, 13],
+        CLANG: [6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17],
+        NVCC: [
+            10.0,
+            10.1,
+            10.2,
+            11.0,
+            11.1,
+            11.2,
+            11.3,
+            11.4,
+            11.5,
+            11.6,
+            11.7,
+            11.8,
+            12.0,
+            12.1,
+            12.2,
+            12.3,
+        ],
+        HIPCC: [5.0, 5.1, 5.2, 5.3, 5.4, 5.5, 5.6, 5.7, 6.0],
+        ICPX: ["2023.1.0", "2023.2.0"],
+        UBUNTU: [18.04, 20.04],
+        CMAKE: [3.18, 3.19, 3.20, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26],
+        BOOST: [
+            "1.74.0",
+            "1.75.0",
+            "1.76.0",
+            "1.77.0",
+            "1.78.0",
+            "1.79.0",
+            "1.80.0",
+            "1.81.0",
+            "1.82.0",
+        ],
+        CXX_STANDARD: [17, 20],
+    }
+)
 # Clang and Clang-CUDA has the same version numbers
 VERSIONS[CLANG_CUDA] = copy.copy(VERSIONS[CLANG])
 
@@ -157,9 +255,133 @@ CLANG_CUDA_MAX_CUDA_VERSION: List[ClangCudaSDKSupport] = [
 ]
 CLANG_CUDA_MAX_CUDA_VERSION.sort(reverse=True)
 
+# version thresholds of the filter rules
+# the versions are parsed once at import time and not each time a rule is evaluated
+# rules c7 and b11: clang as host compiler is disabled for nvcc and CUDA 11.3 to 11.5
+NVCC_CLANG_DISABLED_MIN_VERSION: ValueVersion = intern_version("11.3")
+NVCC_CLANG_DISABLED_MAX_VERSION: ValueVersion = intern_version("11.5")
+# rule c8: oldest supported clang-cuda version
+CLANG_CUDA_MIN_VERSION: ValueVersion = intern_version("14")
+# rules c19 and d3: oldest Ubuntu version with ROCm support
+UBUNTU_ROCM_MIN_VERSION: ValueVersion = intern_version("20.04")
+# rule d1: GCC_UBUNTU_MAX_VERSION and older is not available on UBUNTU_GCC_MIN_VERSION and newer
+UBUNTU_GCC_MIN_VERSION: ValueVersion = intern_version("20.04")
+GCC_UBUNTU_MAX_VERSION: ValueVersion = intern_version("6")
+# rule d2: clang-cuda is not available with CMAKE_CLANG_CUDA_MAX_DISABLED_VERSION and older
+CMAKE_CLANG_CUDA_MAX_DISABLED_VERSION: ValueVersion = intern_version("3.18")
+
+
+class FrozenParameterValueList(List[ParameterValue]):
+    """Read-only list of parameter-values. Each method, which would modify the list, raises a
+    TypeError. Concatenating or copying the list returns a normal list.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(
+            "the parameter-value-list is read-only, replace the list instead of modifying it"
+        )
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def copy(self) -> List[ParameterValue]:
+        return list(self)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only  # type: ignore
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only  # type: ignore
+
+
+class FrozenParameterValueMatrix(OrderedDict[Parameter, ParameterValueList]):
+    """Read-only parameter-value-matrix. Each method, which would modify the matrix or one of its
+    parameter-value-lists, raises a TypeError.
+
+    derive() returns a normal parameter-value-matrix, which shares the read-only
+    parameter-value-lists. Therefore, deriving a matrix is cheap. Parameters of the derived matrix
+    can be added, removed or replaced, e.g. to add project specific parameters. To change the
+    parameter-values of an existing parameter, replace its list, e.g.
+    derived[CMAKE] = derived[CMAKE] + [ParameterValue(CMAKE, pkv.parse("3.27"))]
+
+    copy() behaves like derive(). copy.copy() and pickle return a read-only matrix again.
+    copy.deepcopy() returns a modifiable parameter-value-matrix with modifiable
+    parameter-value-lists.
+    """
+
+    def __init__(self, parameter_value_matrix: Optional[ParameterValueMatrix] = None):
+        """Copy the parameter-value-matrix.
+
+        Args:
+            parameter_value_matrix (Optional[ParameterValueMatrix]): parameter-value-matrix to
+                copy. If None, the matrix is empty. Defaults to None.
+        """
+        super().__init__()
+        if parameter_value_matrix is None:
+            return
+        for parameter, parameter_values in parameter_value_matrix.items():
+            OrderedDict.__setitem__(self, parameter, FrozenParameterValueList(parameter_values))
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(
+            "the parameter-value-matrix is read-only, use derive() to create a modifiable "
+            "parameter-value-matrix"
+        )
+
+    def __reduce__(self):
+        return (self.__class__, (OrderedDict(self),))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> ParameterValueMatrix:
+        # like for a normal matrix, the deep copy is completely modifiable
+        return copy.deepcopy(
+            OrderedDict(
+                (parameter, list(parameter_values)) for parameter, parameter_values in self.items()
+            ),
+            memo,
+        )
+
+    def copy(self) -> ParameterValueMatrix:  # type: ignore[override]
+        return self.derive()
+
+    def derive(self) -> ParameterValueMatrix:
+        """Returns a modifiable parameter-value-matrix, which shares the read-only
+        parameter-value-lists.
+
+        Returns:
+            ParameterValueMatrix: modifiable parameter-value-matrix
+        """
+        return OrderedDict(self)
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore
+    clear = pop = popitem = setdefault = update = move_to_end = _read_only  # type: ignore
+
+
+# Stamp of VERSIONS, from which the cached parameter-value-matrix was built, and the matrix itself
+_parameter_value_matrix_cache: Tuple[int, Optional[FrozenParameterValueMatrix]] = (-1, None)
+
+
+def get_parameter_value_matrix() -> FrozenParameterValueMatrix:
+    """Returns a parameter-value-matrix from all supported compilers, softwares and compilation
+    configuration.
+
+    The matrix is generated on the first call and shared by all callers, therefore it is
+    read-only. It is generated again, if VERSIONS has changed since then. To add project
+    specific parameters, use get_parameter_value_matrix().derive().
+
+    Returns:
+        FrozenParameterValueMatrix: read-only parameter-value-matrix
+    """
+    global _parameter_value_matrix_cache  # pylint: disable=global-statement
+
+    stamp, matrix = _parameter_value_matrix_cache
+    if matrix is not None and stamp == _versions_stamp:
+        return matrix
+
+    stamp = _versions_stamp
+    matrix = FrozenParameterValueMatrix(_create_parameter_value_matrix())
+    _parameter_value_matrix_cache = (stamp, matrix)
+    return matrix
+
 
 # pylint: disable=too-many-branches
-def get_parameter_value_matrix() -> ParameterValueMatrix:
+def _create_parameter_value_matrix() -> ParameterValueMatrix:
     """Generates a parameter-value-matrix from all supported compilers, softwares and compilation
     configuration.
 
@@ -174,7 +396,7 @@ def get_parameter_value_matrix() -> ParameterValueMatrix:
             if sw_name in COMPILERS:
                 for sw_version in sw_versions:
                     param_val_matrix[compiler_type].append(
-                        ParameterValue(sw_name, pkv.parse(str(sw_version)))
+                        ParameterValue(sw_name, intern_version(sw_version))
                     )
 
     for backend in BACKENDS:
@@ -182,7 +404,7 @@ def get_parameter_value_matrix() -> ParameterValueMatrix:
             param_val_matrix[backend] = [ParameterValue(backend, OFF_VER)]
             for cuda_version in VERSIONS[NVCC]:
                 param_val_matrix[backend].append(
-                    ParameterValue(backend, pkv.parse(str(cuda_version)))
+                    ParameterValue(backend, intern_version(cuda_version))
                 )
         else:
             param_val_matrix[backend] = [
@@ -194,11 +416,50 @@ def get_parameter_value_matrix() -> ParameterValueMatrix:
         if not other in COMPILERS + BACKENDS:
             param_val_matrix[other] = []
             for version in versions:
-                param_val_matrix[other].append(ParameterValue(other, pkv.parse(str(version))))
+                param_val_matrix[other].append(ParameterValue(other, intern_version(version)))
 
     return param_val_matrix
 
 
+# Stamp of VERSIONS, from which the lookup table of is_supported_version() was built, and the lookup
+# table itself. Both are stored in a single tuple, so that the cache is replaced atomically.
+_supported_versions_cache: Tuple[int, Mapping[ValueName, FrozenSet[ValueVersion]]] = (
+    -1,
+    types.MappingProxyType({}),
+)
+
+
+def get_supported_versions() -> Mapping[ValueName, FrozenSet[ValueVersion]]:
+    """Returns the supported versions of each software and backend. The lookup table is built from
+    VERSIONS on the first call and rebuilt if VERSIONS has changed since then. VERSIONS counts its
+    modifications, therefore checking for changes takes constant time.
+
+    Returns:
+        Mapping[ValueName, FrozenSet[ValueVersion]]: Read-only lookup table from the name of the
+            software or backend to its supported versions.
+    """
+    global _supported_versions_cache  # pylint: disable=global-statement
+
+    stamp, table = _supported_versions_cache
+    if stamp == _versions_stamp:
+        return table
+
+    stamp = _versions_stamp
+    supported_versions: Dict[ValueName, FrozenSet[ValueVersion]] = {
+        name: frozenset(intern_version(version) for version in versions)
+        for name, versions in VERSIONS.items()
+    }
+    for backend_name in BACKENDS:
+        if backend_name == ALPAKA_ACC_GPU_CUDA_ENABLE:
+            supported_versions[backend_name] = frozenset([OFF_VER]) | supported_versions[NVCC]
+        else:
+            supported_versions[backend_name] = frozenset([OFF_VER, ON_VER])
+
+    table = types.MappingProxyType(supported_versions)
+    _supported_versions_cache = (stamp, table)
+    return table
+
+
 @typechecked
 def is_supported_version(name: ValueName, version: ValueVersion) -> bool:
     """Check if a specific software version is supported by the bashi library.
@@ -213,22 +474,33 @@ def is_supported_version(name: ValueName, version: ValueVersion) -> bool:
     Returns:
         bool: True if supported otherwise False.
     """
-    known_names: List[ValueName] = list(VERSIONS.keys()) + [CLANG_CUDA] + BACKENDS
+    supported_versions = get_supported_versions()
 
-    if name not in known_names:
+    if name not in supported_versions:
         raise ValueError(f"Unknown software name: {name}")
 
-    local_versions = copy.deepcopy(VERSIONS)
+    return version in supported_versions[name]
 
-    local_versions[ALPAKA_ACC_GPU_CUDA_ENABLE] = [OFF]
-    local_versions[ALPAKA_ACC_GPU_CUDA_ENABLE] += VERSIONS[NVCC]
 
-    for backend_name in BACKENDS:
-        if backend_name != ALPAKA_ACC_GPU_CUDA_ENABLE:
-            local_versions[backend_name] = [OFF, ON]
+@typechecked
+def are_supported_versions(values: Iterable[Tuple[ValueName, ValueVersion]]) -> List[bool]:
+    """Check for many software versions at once, if they are supported by the bashi library.
+
+    Args:
+        values (Iterable[Tuple[ValueName, ValueVersion]]): Name and version of each software, for
+            example the parameter-values of a parameter-value-tuple.
 
-    for ver in local_versions[name]:
-        if pkv.parse(str(ver)) == version:
-            return True
+    Raises:
+        ValueError: If the name of a software is not known.
 
-    return False
+    Returns:
+        List[bool]: For each software True if supported otherwise False.
+    """
+    supported_versions = get_supported_versions()
+
+    results: List[bool] = []
+    for name, version in values:
+        if name not in supported_versions:
+            raise ValueError(f"Unknown software name: {name}")
+        results.append(version in supported_versions[name])
+    return results
@@ -0,0 +1 @@
+"""Command line tool bashi-validate to check filter rules."""  # pylint: disable=invalid-name
@@ -0,0 +1,119 @@
+"""Server mode of bashi-validate.
+
+The server listens on a Unix socket and keeps the filter functions and their caches loaded, so that
+a validation request does not pay the start-up time of the Python interpreter. A client sends rows
+in the same shape like in batch mode, one per line, and receives the result of each row as JSON
+line, see bashiValidate.validate.validate_row().
+"""
+
+from typing import Any, Callable, Dict, Iterable, List
+import functools
+import json
+import os
+import socket
+import socketserver
+
+# number of different rows, whose results are cached by the server
+SERVER_CACHE_SIZE: int = 2**16
+
+
+class ValidationRequestHandler(socketserver.StreamRequestHandler):
+    """Answers each row, which a client sends, with the result as JSON line. The rows have the
+    same shape like in batch mode. Empty lines and lines starting with '#' are skipped. The line
+    number of the result counts the lines of the connection.
+    """
+
+    server: "ValidationServer"
+
+    def handle(self):
+        for line_number, raw_line in enumerate(self.rfile, start=1):
+            line = raw_line.decode("utf-8", errors="replace")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            result: Dict[str, Any] = {"line": line_number}
+            result.update(self.server.validate(line.strip()))
+            self.wfile.write((json.dumps(result) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class ValidationServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Server on a Unix socket, which validates rows for many clients. Each client is served by an
+    own thread. The filter functions are loaded once and the results of the last
+    SERVER_CACHE_SIZE different rows are cached.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, validate: Callable[[str], Dict[str, Any]]):
+        """Create the server and bind it to the socket.
+
+        Args:
+            socket_path (str): Path of the Unix socket.
+            validate (Callable[[str], Dict[str, Any]]): Parses and tests a row and returns the
+                JSON serializable result, see bashiValidate.validate.validate_line().
+
+        Raises:
+            OSError: If the socket cannot be created, for example because another server uses it.
+        """
+        self.validate: Callable[[str], Dict[str, Any]] = functools.lru_cache(
+            maxsize=SERVER_CACHE_SIZE
+        )(validate)
+        _remove_stale_socket(socket_path)
+        super().__init__(socket_path, ValidationRequestHandler)
+        # load the filter functions and fill their caches before the first client connects
+        self.validate("--host-compiler gcc@10 --device-compiler gcc@10")
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(str(self.server_address)):
+            os.remove(str(self.server_address))
+
+
+def _remove_stale_socket(socket_path: str):
+    """Remove the socket file of a server, which is not running anymore.
+
+    Args:
+        socket_path (str): Path of the Unix socket.
+
+    Raises:
+        OSError: If a server is still listening on the socket.
+    """
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except ConnectionRefusedError:
+            os.remove(socket_path)
+            return
+    raise OSError(f"{socket_path} is used by another server")
+
+
+def query_server(socket_path: str, lines: Iterable[str]) -> List[Dict[str, Any]]:
+    """Send rows to a running server and return the results.
+
+    Args:
+        socket_path (str): Path of the Unix socket of the server.
+        lines (Iterable[str]): Rows in the same shape like in batch mode. Empty lines and lines
+            starting with '#' are skipped.
+
+    Raises:
+        ConnectionError: If the server closes the connection before it answered all rows.
+
+    Returns:
+        List[Dict[str, Any]]: The result of each row.
+    """
+    results: List[Dict[str, Any]] = []
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile("rb") as response_stream:
+            for line in lines:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                client.sendall(line.encode("utf-8") + b"\n")
+                response = response_stream.readline()
+                if not response:
+                    raise ConnectionError("server closed the connection")
+                results.append(json.loads(response))
+    return results
@@ -5,27 +5,45 @@
 import argparse
 from argparse import ArgumentParser, Namespace
 
-from typing import Sequence, Any, Callable, Optional, IO, Dict, NamedTuple, List
+from typing import (
+    TYPE_CHECKING,
+    Sequence,
+    Any,
+    Callable,
+    Optional,
+    IO,
+    Dict,
+    NamedTuple,
+    List,
+    Tuple,
+    Iterable,
+    NoReturn,
+)
 from collections import OrderedDict
+import functools
 import io
+import json
+import shlex
 import sys
-from typeguard import typechecked
 import packaging.version as pkv
 
+# The command line tool imports only the modules, which are required for the start up. The filter
+# functions are imported on demand, see import_filters().
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from bashi.types import ParameterValue, ParameterValueTuple
-from bashi.versions import is_supported_version
-from bashi.utils import PARAMETER_SHORT_NAME
-import bashi.filter_compiler
-import bashi.filter_backend
-import bashi.filter_software_dependency
+from bashi.interning import intern_version
+from bashi.typecheck import set_typecheck_enabled
+
+if TYPE_CHECKING:
+    from bashi.compatibility import PairCompatibilityIndex
 
 ArgumentAlias = NamedTuple("ArgumentAlias", [("alias", List[str]), ("parameter", Parameter)])
 # stores the ordering of the parameter arguments
 param_order: List[str] = []
+# number of rows, which a worker process validates at once in batch mode
+BATCH_CHUNK_SIZE: int = 64
 
 
-@typechecked
 def cs(text: str, color: str) -> str:
     """Prints colored text to the command line. The text printed after the function call has the
     default color of the command line.
@@ -52,7 +70,6 @@ def cs(text: str, color: str) -> str:
     return output + text + "\033[0m"
 
 
-@typechecked
 def exit_error(text: str):
     """Prints error message and exits application with error code 1.
 
@@ -63,7 +80,112 @@ def exit_error(text: str):
     sys.exit(1)
 
 
-@typechecked
+def parse_version(version: str, option_string: Optional[str] = None) -> pkv.Version:
+    """Parse the version of an argument. The special values "ON" and "OFF" are parsed to 1.0.0
+    and 0.0.0.
+
+    Args:
+        version (str): The version string.
+        option_string (Optional[str], optional): Name of the argument, which is used in the error
+            message. Defaults to None.
+
+    Raises:
+        ValueError: If the version cannot be parsed.
+
+    Returns:
+        pkv.Version: The parsed version.
+    """
+    if version == "OFF":
+        version = OFF
+
+    if version == "ON":
+        version = ON
+
+    # use parse() function to validate that the version has a valid shape
+    try:
+        return intern_version(version)
+    except pkv.InvalidVersion as error:
+        raise ValueError(
+            f"Could not parse version of argument {option_string}: {version}"
+        ) from error
+
+
+def parse_compiler(parameter_value_str: str, option_string: Optional[str] = None) -> ParameterValue:
+    """Parse a compiler string of the shape "name@version" to a parameter-value.
+
+    Args:
+        parameter_value_str (str): The compiler string.
+        option_string (Optional[str], optional): Name of the argument, which is used in the error
+            message. Defaults to None.
+
+    Raises:
+        ValueError: If the compiler string has a wrong shape, the compiler is unknown or the
+            version cannot be parsed.
+
+    Returns:
+        ParameterValue: The compiler name and version.
+    """
+    if "@" not in parameter_value_str:
+        raise ValueError(f"@ is missing in {option_string}={parameter_value_str}")
+
+    name, version = parameter_value_str.split("@", 1)
+
+    if name not in COMPILERS:
+        raise ValueError(f"Unknown compiler: {name}\nKnown compilers: {COMPILERS}")
+
+    # use parse() function to validate that the version has a valid shape
+    try:
+        return ParameterValue(name, intern_version(version))
+    except pkv.InvalidVersion as error:
+        raise ValueError(f"Could not parse version number of {name}: {version}") from error
+
+
+class RowArgumentParser(ArgumentParser):
+    """Parser for the parameter arguments of a single row in batch and server mode. Raises a
+    ValueError instead of exiting the application, if an argument is invalid. The order of the
+    parameter arguments is stored in the attribute param_order of the namespace.
+    """
+
+    def error(self, message: str) -> NoReturn:
+        raise ValueError(message)
+
+
+def argument_error(parser: ArgumentParser, message: str):
+    """Handles an invalid argument. Raises a ValueError for a RowArgumentParser, otherwise prints
+    the error message and exits the application.
+
+    Args:
+        parser (ArgumentParser): The parser of the argument.
+        message (str): Error message.
+
+    Raises:
+        ValueError: If the parser is a RowArgumentParser.
+    """
+    if isinstance(parser, RowArgumentParser):
+        raise ValueError(message)
+    exit_error(message)
+
+
+def add_param_order(
+    parser: ArgumentParser, namespace: Namespace, dest: str, option_string: Optional[str]
+):
+    """Stores the order of the parameter arguments. A RowArgumentParser stores the destination of
+    the argument in the namespace, otherwise the option string is added to param_order.
+
+    Args:
+        parser (ArgumentParser): The parser of the argument.
+        namespace (Namespace): The namespace of the parsed arguments.
+        dest (str): Name of the argument in the namespace.
+        option_string (Optional[str]): The argument name used on the command line.
+    """
+    if isinstance(parser, RowArgumentParser):
+        if getattr(namespace, "param_order", None) is None:
+            namespace.param_order = []
+        namespace.param_order.append(dest)
+    elif option_string:
+        param_order.append(option_string)
+
+
 class VersionCheck(argparse.Action):
     """Verify that version can be parsed to package.version.Version.
 
@@ -79,27 +201,17 @@ class VersionCheck(argparse.Action):
         option_string: str | None = None,
     ):
         if not values:
-            exit_error(f"argument {option_string}: expected one argument")
-
-        version: str = str(values)
-
-        if version == "OFF":
-            version = OFF
-
-        if version == "ON":
-            version = ON
+            argument_error(parser, f"argument {option_string}: expected one argument")
+            return
 
-        # use parse() function to validate that the version has a valid shape
         try:
-            parsed_version = pkv.parse(version)
-            setattr(namespace, self.dest, parsed_version)
-            if option_string:
-                param_order.append(option_string)
-        except packaging.version.InvalidVersion:
-            exit_error(f"Could not parse version of argument {option_string}: {version}")
+            setattr(namespace, self.dest, parse_version(str(values), option_string))
+        except ValueError as error:
+            argument_error(parser, str(error))
+            return
+        add_param_order(parser, namespace, self.dest, option_string)
 
 
-@typechecked
 class CompilerVersionCheck(argparse.Action):
     """Tries to parse compiler versions string of the shape "name@version" to a parameter-value."""
 
@@ -112,29 +224,15 @@ class CompilerVersionCheck(argparse.Action):
         option_string: str | None = None,
     ) -> None:
         if not values:
-            exit_error(f"argument {option_string}: expected one argument")
-
-        parameter_value_str: str = str(values)
-
-        if "@" not in parameter_value_str:
-            exit_error(f"@ is missing in {option_string}={parameter_value_str}")
+            argument_error(parser, f"argument {option_string}: expected one argument")
             return
 
-        splitted_name_version = parameter_value_str.split("@", 1)
-        name = splitted_name_version[0]
-        version = splitted_name_version[1]
-
-        if name not in COMPILERS:
-            exit_error(f"Unknown compiler: {name}\nKnown compilers: {COMPILERS}")
-
-        # use parse() function to validate that the version has a valid shape
         try:
-            parsed_version = pkv.parse(version)
-            setattr(namespace, self.dest, ParameterValue(name, parsed_version))
-            if option_string:
-                param_order.append(option_string)
-        except packaging.version.InvalidVersion:
-            exit_error(f"Could not parse version number of {name}: {version}")
+            setattr(namespace, self.dest, parse_compiler(str(values), option_string))
+        except ValueError as error:
+            argument_error(parser, str(error))
+            return
+        add_param_order(parser, namespace, self.dest, option_string)
 
 
 def get_args(args_alias: Dict[str, ArgumentAlias]) -> Namespace:
@@ -143,8 +241,72 @@ def get_args(args_alias: Dict[str, ArgumentAlias]) -> Namespace:
     Returns:
         Namespace: The parsed command line arguments
     """
+    return get_parser(args_alias).parse_args()
+
+
+def get_parser(args_alias: Dict[str, ArgumentAlias]) -> ArgumentParser:
+    """Set up command line arguments.
+
+    Args:
+        args_alias (Dict[str, ArgumentAlias]): Stores the alias and it's parameter for each
+            parameter argument
+
+    Returns:
+        ArgumentParser: The parser of the command line arguments
+    """
     parser = argparse.ArgumentParser(description="Check if combination of parameters is valid.")
 
+    parser.add_argument(
+        "--batch",
+        type=str,
+        metavar="FILE",
+        help="Validate many rows at once. Reads one row per line from FILE or from stdin, if FILE "
+        "is '-'. A row is either a JSON object, which maps argument names to values, or the "
+        "arguments in the same shape like on the command line. Prints the result of each row as "
+        "JSON line.",
+    )
+    parser.add_argument(
+        "--serve",
+        type=str,
+        metavar="SOCKET",
+        help="Start a server on the Unix socket SOCKET, which keeps the filter functions loaded. "
+        "Each client sends rows in the same shape like in batch mode and receives the result of "
+        "each row as JSON line.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes, which validate the rows in batch mode. Defaults to 1.",
+    )
+    add_parameter_arguments(parser, args_alias)
+    return parser
+
+
+@functools.cache
+def get_row_parser() -> Tuple[RowArgumentParser, Dict[str, ArgumentAlias]]:
+    """Returns the parser for a single row of the batch input. The parser knows the same parameter
+    arguments like the command line, but no other options. Created only once.
+
+    Returns:
+        Tuple[RowArgumentParser, Dict[str, ArgumentAlias]]: The parser and the alias and parameter
+            of each argument.
+    """
+    args_alias: Dict[str, ArgumentAlias] = {}
+    parser = RowArgumentParser(prog="row", add_help=False)
+    add_parameter_arguments(parser, args_alias)
+    return parser, args_alias
+
+
+def add_parameter_arguments(parser: ArgumentParser, args_alias: Dict[str, ArgumentAlias]):
+    """Adds an argument for each parameter to the parser.
+
+    Args:
+        parser (ArgumentParser): The parser.
+        args_alias (Dict[str, ArgumentAlias]): Stores the alias and it's parameter for each
+            parameter argument
+    """
+
     def add_param_alias(argument: str, args_alias: Dict[str, ArgumentAlias]) -> List[str]:
         """Returns the argument name and also an alias, if it is defined in the PARAMETER_SHORT_NAME
 
@@ -233,10 +395,7 @@ def get_args(args_alias: Dict[str, ArgumentAlias]) -> Namespace:
             help=help_text,
         )
 
-    return parser.parse_args()
 
-
-@typechecked
 def check_single_filter(
     filter_func: Callable[[ParameterValueTuple, Optional[IO[str]]], bool],
     row: ParameterValueTuple,
@@ -271,32 +430,52 @@ def check_single_filter(
     return False
 
 
-@typechecked
-def check_filter_chain(row: ParameterValueTuple) -> bool:
+# names of the filter functions, which are printed by check_filter_chain()
+FILTER_NAMES: List[str] = ["compiler_filter", "backend_filter", "software_dependency_filter"]
+
+
+def check_filter_chain(
+    row: ParameterValueTuple, pair_index: Optional["PairCompatibilityIndex"] = None
+) -> bool:
     """Test a row with the bashi default filter chain.
 
     Args:
         row (ParameterValueTuple): row to test
+        pair_index (Optional[PairCompatibilityIndex], optional): Precomputed compatibility of
+            parameter-value-pairs created with the default filter chain. If the row contains only
+            parameter-values of the index and is valid, the filter functions are not executed.
+            Invalid rows are always checked with the filter functions to print the reasons.
+            Defaults to None.
 
     Returns:
         bool: True if row passes all filters
     """
+    if pair_index is not None and pair_index.contains(row) and pair_index.is_valid(row):
+        for filter_name in FILTER_NAMES:
+            print(cs(f"{filter_name}() returns True", "Green"))
+        return True
+
+    # pylint: disable=import-outside-toplevel
+    from bashi.filter_compiler import compiler_filter
+    from bashi.filter_backend import backend_filter_typechecked
+    from bashi.filter_software_dependency import software_dependency_filter_typechecked
+
     all_true = 0
     all_true += int(
         check_single_filter(
-            bashi.filter_compiler.compiler_filter,
+            compiler_filter,
             row,
         )
     )
     all_true += int(
         check_single_filter(
-            bashi.filter_backend.backend_filter_typechecked,
+            backend_filter_typechecked,
             row,
         )
     )
     all_true += int(
         check_single_filter(
-            bashi.filter_software_dependency.software_dependency_filter_typechecked,
+            software_dependency_filter_typechecked,
             row,
         )
     )
@@ -305,12 +484,248 @@ def check_filter_chain(row: ParameterValueTuple) -> bool:
     return all_true == 3
 
 
+def parse_batch_row(line: str) -> ParameterValueTuple:
+    """Parse a row of the batch input. The row is either a JSON object, which maps argument names
+    to values, for example {"host-compiler": "gcc@10", "cmake": "3.22"}, or the arguments in the
+    same shape like on the command line, for example --host-compiler gcc@10 --cmake=3.22. Both
+    shapes are parsed with the same parser, see get_row_parser().
+
+    Args:
+        line (str): The row.
+
+    Raises:
+        ValueError: If the row cannot be parsed.
+
+    Returns:
+        ParameterValueTuple: The parameter-values in the order of the row.
+    """
+    parser, args_alias = get_row_parser()
+    namespace = parser.parse_args(_split_batch_row(line))
+
+    row: ParameterValueTuple = OrderedDict()
+    for dest in getattr(namespace, "param_order", None) or []:
+        parameter = args_alias[dest].parameter
+        value = getattr(namespace, dest)
+        if parameter in (HOST_COMPILER, DEVICE_COMPILER):
+            row[parameter] = value
+        else:
+            row[parameter] = ParameterValue(parameter, value)
+    return row
+
+
+def _split_batch_row(line: str) -> List[str]:
+    """Split a row of the batch input in command line arguments.
+
+    Args:
+        line (str): The row, either a JSON object or command line arguments.
+
+    Raises:
+        ValueError: If the row has a wrong shape.
+
+    Returns:
+        List[str]: The arguments.
+    """
+    if not line.lstrip().startswith("{"):
+        return shlex.split(line)
+
+    try:
+        json_row = json.loads(line)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"Could not parse JSON row: {error}") from error
+    if not isinstance(json_row, dict):
+        raise ValueError("JSON row needs to be an object")
+
+    arguments: List[str] = []
+    for name, value in json_row.items():
+        argument = name if name.startswith("--") else f"--{name}"
+        # numbers would lose their original shape, e.g. 3.20 is parsed as 3.2
+        if not isinstance(value, str):
+            raise ValueError(f"argument {argument}: value needs to be a string: {value!r}")
+        arguments.append(f"{argument}={value}")
+    return arguments
+
+
+def validate_row(row: ParameterValueTuple) -> Dict[str, Any]:
+    """Test a row with the bashi default filter chain without printing the result.
+
+    Args:
+        row (ParameterValueTuple): row to test
+
+    Returns:
+        Dict[str, Any]: JSON serializable result. Contains whether the row is valid, the result
+            and reason of each filter function and warnings for unsupported versions.
+    """
+    # pylint: disable=import-outside-toplevel
+    from bashi.filter_compiler import compiler_filter
+    from bashi.filter_backend import backend_filter
+    from bashi.filter_software_dependency import software_dependency_filter
+    from bashi.versions import are_supported_versions
+
+    filters: Dict[str, Dict[str, Any]] = {}
+    for filter_func in (compiler_filter, backend_filter, software_dependency_filter):
+        msg = io.StringIO()
+        filters[filter_func.__name__] = {"valid": filter_func(row, msg), "reason": msg.getvalue()}
+
+    return {
+        "valid": all(result["valid"] for result in filters.values()),
+        "filters": filters,
+        "warnings": [
+            f"{val_name} {val_version} is not officially supported."
+            for (val_name, val_version), supported in zip(
+                row.values(), are_supported_versions(row.values())
+            )
+            if not supported
+        ],
+    }
+
+
+def validate_batch_line(numbered_line: Tuple[int, str]) -> Dict[str, Any]:
+    """Parse and test a row of the batch input.
+
+    Args:
+        numbered_line (Tuple[int, str]): Line number and row.
+
+    Returns:
+        Dict[str, Any]: JSON serializable result, see validate_row(). Contains also the line
+            number. If the row cannot be parsed, the result contains the error message instead of
+            the results of the filter functions.
+    """
+    line_number, line = numbered_line
+    result: Dict[str, Any] = {"line": line_number}
+    result.update(validate_line(line))
+    return result
+
+
+def validate_line(line: str) -> Dict[str, Any]:
+    """Parse and test a row of the batch input.
+
+    Args:
+        line (str): The row.
+
+    Returns:
+        Dict[str, Any]: JSON serializable result, see validate_row(). If the row cannot be parsed,
+            the result contains the error message instead of the results of the filter functions.
+    """
+    try:
+        return validate_row(parse_batch_row(line))
+    except ValueError as error:
+        return {"valid": False, "error": str(error)}
+
+
+def run_batch(
+    input_stream: IO[str],
+    output_stream: IO[str],
+    jobs: int = 1,
+) -> bool:
+    """Validate each row of the input stream and write the results as JSON lines to the output
+    stream. Empty lines and lines starting with '#' are skipped.
+
+    Args:
+        input_stream (IO[str]): Rows to test, one per line.
+        output_stream (IO[str]): Receives one JSON line per row in the order of the rows.
+        jobs (int, optional): Number of worker processes. If 1, the rows are tested in the
+            current process. Defaults to 1.
+
+    Returns:
+        bool: True if all rows are valid.
+    """
+    numbered_lines: Iterable[Tuple[int, str]] = (
+        (line_number, line)
+        for line_number, line in enumerate(input_stream, start=1)
+        if line.strip() and not line.lstrip().startswith("#")
+    )
+    all_valid = True
+
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    def write_results(results: Iterable[Dict[str, Any]]):
+        nonlocal all_valid
+        for result in results:
+            all_valid = all_valid and result["valid"]
+            output_stream.write(json.dumps(result) + "\n")
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            write_results(
+                executor.map(validate_batch_line, numbered_lines, chunksize=BATCH_CHUNK_SIZE)
+            )
+    else:
+        write_results(map(validate_batch_line, numbered_lines))
+    return all_valid
+
+
+def main_batch(args: Namespace) -> None:
+    """Entry point for the batch mode.
+
+    Args:
+        args (Namespace): The parsed command line arguments
+    """
+    if param_order:
+        exit_error("parameter arguments cannot be combined with --batch")
+    if args.jobs < 1:
+        exit_error(f"argument --jobs: needs to be at least 1: {args.jobs}")
+
+    if args.batch == "-":
+        all_valid = run_batch(sys.stdin, sys.stdout, args.jobs)
+    else:
+        with open(args.batch, "r", encoding="utf-8") as input_stream:
+            all_valid = run_batch(input_stream, sys.stdout, args.jobs)
+    sys.exit(int(not all_valid))
+
+
+def main_serve(args: Namespace) -> None:
+    """Entry point for the server mode. Runs until the process receives SIGINT or SIGTERM.
+
+    Args:
+        args (Namespace): The parsed command line arguments
+    """
+    if param_order or args.batch is not None:
+        exit_error("--serve cannot be combined with parameter arguments or --batch")
+
+    # pylint: disable=import-outside-toplevel
+    import signal
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        exit_error("--serve requires Unix sockets, which are not supported on this platform")
+
+    from bashiValidate.server import ValidationServer
+
+    try:
+        server = ValidationServer(args.serve, validate_line)
+    except OSError as error:
+        exit_error(f"could not start server: {error}")
+
+    def shutdown(_signum, _frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, shutdown)
+    print(f"bashi-validate listens on {args.serve}", flush=True)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    sys.exit(0)
+
+
 def main() -> None:
     """Entry point for the application."""
+    # The command line tool checks the types of the arguments itself. Skipping the type checking of
+    # the bashi functions avoids importing typeguard, which takes most of the start-up time.
+    set_typecheck_enabled(False)
+
     # stores alias for parameter arguments and it parameter itself
     args_alias: Dict[str, ArgumentAlias] = {}
     args = get_args(args_alias)
 
+    if args.serve is not None:
+        main_serve(args)
+
+    if args.batch is not None:
+        main_batch(args)
+
     row: ParameterValueTuple = OrderedDict()
 
     # Add parameter-values in the order in which they are passed via arguments
@@ -323,6 +738,8 @@ def main() -> None:
                     else:
                         row[alias.parameter] = ParameterValue(alias.parameter, getattr(args, arg))
 
+    from bashi.versions import is_supported_version  # pylint: disable=import-outside-toplevel
+
     for val_name, val_version in row.values():
         if not is_supported_version(val_name, val_version):
             print(
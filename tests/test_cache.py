@@ -0,0 +1,204 @@
+# pylint: disable=missing-docstring
+import unittest
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+from collections import OrderedDict
+from unittest import mock
+from utils_test import parse_param_vals
+from bashi.cache import (
+    CombinationListCache,
+    generate_combination_list_cached,
+    get_cache_key,
+    get_filter_fingerprint,
+    CACHE_ENTRY_SUFFIX,
+)
+from bashi.engine import UncoveredPairsWarning
+from bashi.generator import generate_combination_list, ENGINE_COVERTABLE
+from bashi.types import FilterFunction, ParameterValueMatrix, ParameterValueTuple
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+BLOCKED_CMAKE_VERSION = "3.22"
+
+
+def is_blocked_cmake(row: ParameterValueTuple) -> bool:
+    return CMAKE in row and str(row[CMAKE].version) == BLOCKED_CMAKE_VERSION
+
+
+def filter_blocked_cmake(row: ParameterValueTuple) -> bool:
+    return not is_blocked_cmake(row)
+
+
+class TestCombinationListCache(unittest.TestCase):
+    def setUp(self):
+        self.param_matrix: ParameterValueMatrix = OrderedDict()
+        self.param_matrix[HOST_COMPILER] = parse_param_vals([(GCC, 10), (CLANG, 16), (NVCC, 12.0)])
+        self.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 12.0), (GCC, 10), (CLANG, 16)]
+        )
+        self.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        self.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache = CombinationListCache(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def get_entries(self):
+        return [name for name in os.listdir(self.tmp_dir.name) if name.endswith(CACHE_ENTRY_SUFFIX)]
+
+    def test_cache_hit(self):
+        comb_list = generate_combination_list(self.param_matrix)
+        self.assertEqual(generate_combination_list_cached(self.param_matrix, self.cache), comb_list)
+        self.assertEqual(len(self.get_entries()), 1)
+
+        with mock.patch("bashi.cache.generate_combination_list") as generator_mock:
+            self.assertEqual(
+                generate_combination_list_cached(self.param_matrix, self.cache), comb_list
+            )
+            generator_mock.assert_not_called()
+
+    def test_key_depends_on_inputs(self):
+        key = get_cache_key(self.param_matrix)
+        self.assertEqual(key, get_cache_key(self.param_matrix.copy()))
+        self.assertNotEqual(key, get_cache_key(self.param_matrix, "custom"))
+        self.assertNotEqual(key, get_cache_key(self.param_matrix, engine_name=ENGINE_COVERTABLE))
+
+        changed_matrix = self.param_matrix.copy()
+        changed_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.24)])
+        self.assertNotEqual(key, get_cache_key(changed_matrix))
+
+        reordered_matrix: ParameterValueMatrix = OrderedDict(
+            reversed(list(self.param_matrix.items()))
+        )
+        self.assertNotEqual(key, get_cache_key(reordered_matrix))
+
+    def test_filter_fingerprint(self):
+        def filter1(row: ParameterValueTuple) -> bool:
+            return CMAKE not in row
+
+        def filter2(row: ParameterValueTuple) -> bool:
+            return BOOST not in row
+
+        self.assertEqual(get_filter_fingerprint(filter1), get_filter_fingerprint(filter1))
+        self.assertNotEqual(get_filter_fingerprint(filter1), get_filter_fingerprint(filter2))
+        self.assertRaises(ValueError, get_filter_fingerprint, print)
+
+    def test_filter_fingerprint_dependencies(self):
+        # global variable, which is read by a helper function of the filter
+        fingerprint = get_filter_fingerprint(filter_blocked_cmake)
+        with mock.patch(f"{__name__}.BLOCKED_CMAKE_VERSION", "3.23"):
+            self.assertNotEqual(get_filter_fingerprint(filter_blocked_cmake), fingerprint)
+        # changed helper function
+        with mock.patch(f"{__name__}.is_blocked_cmake", lambda row: False):
+            self.assertNotEqual(get_filter_fingerprint(filter_blocked_cmake), fingerprint)
+        self.assertEqual(get_filter_fingerprint(filter_blocked_cmake), fingerprint)
+
+        # values of a closure and default arguments
+        def make_filter(blocked: str) -> FilterFunction:
+            def closure_filter(row: ParameterValueTuple, blocked_name: str = GCC) -> bool:
+                return blocked not in row and blocked_name not in row
+
+            return closure_filter
+
+        self.assertEqual(
+            get_filter_fingerprint(make_filter(CMAKE)), get_filter_fingerprint(make_filter(CMAKE))
+        )
+        self.assertNotEqual(
+            get_filter_fingerprint(make_filter(CMAKE)), get_filter_fingerprint(make_filter(BOOST))
+        )
+        closure_filter = make_filter(CMAKE)
+        fingerprint = get_filter_fingerprint(closure_filter)
+        closure_filter.__defaults__ = (CLANG,)  # type: ignore
+        self.assertNotEqual(get_filter_fingerprint(closure_filter), fingerprint)
+
+        # the representation of the object contains its address
+        unknown_object = object()
+        self.assertRaises(
+            ValueError, get_filter_fingerprint, lambda row: unknown_object is not None
+        )
+
+    def test_filter_fingerprint_library_globals(self):
+        example_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example", "example.py"
+        )
+        spec = importlib.util.spec_from_file_location("bashi_example", example_path)
+        assert spec is not None and spec.loader is not None
+        example = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(example)
+
+        # NVCC_GCC_MAX_VERSION of bashi.versions contains objects with the default repr()
+        fingerprint = get_filter_fingerprint(example.custom_filter)
+        self.assertEqual(get_filter_fingerprint(example.custom_filter), fingerprint)
+        with mock.patch.object(example, "NVCC_GCC_MAX_VERSION", []):
+            self.assertNotEqual(get_filter_fingerprint(example.custom_filter), fingerprint)
+
+    def test_filter_fingerprint_hash_seed(self):
+        code = (
+            "from bashi.cache import get_filter_fingerprint\n"
+            "BLOCKED = {'cmake', 'boost', 'gcc', 'clang', 'nvcc', 'ubuntu'}\n"
+            "print(get_filter_fingerprint(lambda row: not BLOCKED & set(row)))\n"
+        )
+        fingerprints = [
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": hash_seed},
+            ).stdout
+            for hash_seed in ("1", "2", "3")
+        ]
+        self.assertEqual(len(set(fingerprints)), 1, fingerprints)
+
+    def test_custom_filter(self):
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            return not (HOST_COMPILER in row and row[HOST_COMPILER].name == CLANG)
+
+        comb_list = generate_combination_list_cached(self.param_matrix, self.cache)
+        # without clang as host compiler, there is no valid combination for clang as device
+        # compiler
+        with self.assertWarns(UncoveredPairsWarning):
+            filtered_comb_list = generate_combination_list_cached(
+                self.param_matrix, self.cache, custom_filter
+            )
+        self.assertEqual(len(self.get_entries()), 2)
+        self.assertNotEqual(comb_list, filtered_comb_list)
+        with self.assertWarns(UncoveredPairsWarning):
+            self.assertEqual(
+                filtered_comb_list, generate_combination_list(self.param_matrix, custom_filter)
+            )
+
+    def test_broken_entry(self):
+        key = get_cache_key(self.param_matrix)
+        with open(os.path.join(self.tmp_dir.name, key + CACHE_ENTRY_SUFFIX), "wb") as entry_file:
+            entry_file.write(b"broken")
+
+        self.assertIsNone(self.cache.load(key, self.param_matrix))
+        self.assertEqual(self.get_entries(), [])
+
+    def test_eviction(self):
+        comb_list = generate_combination_list(self.param_matrix)
+        self.cache.store("old", self.param_matrix, comb_list)
+        old_path = os.path.join(self.tmp_dir.name, "old" + CACHE_ENTRY_SUFFIX)
+        os.utime(old_path, (0, 0))
+        self.cache.store("new", self.param_matrix, comb_list)
+
+        self.cache.max_size = os.path.getsize(old_path)
+        self.cache.evict()
+        self.assertEqual(self.get_entries(), ["new" + CACHE_ENTRY_SUFFIX])
+
+        self.cache.max_size = None
+        self.cache.store("old", self.param_matrix, comb_list)
+        os.utime(old_path, (0, 0))
+        self.cache.max_age = 60
+        self.cache.evict()
+        self.assertEqual(self.get_entries(), ["new" + CACHE_ENTRY_SUFFIX])
+        self.assertEqual(self.cache.load("new", self.param_matrix), comb_list)
+
+        self.cache.clear()
+        self.assertEqual(self.get_entries(), [])
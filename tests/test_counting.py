@@ -0,0 +1,96 @@
+# pylint: disable=missing-docstring
+import unittest
+import itertools
+from collections import OrderedDict
+import packaging.version as pkv
+from utils_test import parse_param_vals
+from bashi.engine import UncoveredPairsWarning
+from bashi.counting import count_valid_combinations, get_combination_statistics
+from bashi.filter_chain import get_default_filter_chain
+from bashi.generator import generate_combination_list
+from bashi.types import FilterFunction, ParameterValueMatrix, ParameterValueTuple
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+def count_cartesian_product(
+    param_matrix: ParameterValueMatrix, custom_filter: FilterFunction = lambda _: True
+) -> int:
+    filter_chain = get_default_filter_chain(custom_filter)
+    return sum(
+        1
+        for param_vals in itertools.product(*param_matrix.values())
+        if filter_chain(OrderedDict(zip(param_matrix.keys(), param_vals)))
+    )
+
+
+class TestCountValidCombinations(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (CLANG, 16), (NVCC, 12.0), (HIPCC, 5.1), (ICPX, 2023.2)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 11), (CLANG, 16), (HIPCC, 5.1)]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_HIP_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_GPU_HIP_ENABLE, OFF), (ALPAKA_ACC_GPU_HIP_ENABLE, ON)]
+        )
+        cls.param_matrix[ALPAKA_ACC_SYCL_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_SYCL_ENABLE, OFF), (ALPAKA_ACC_SYCL_ENABLE, ON)]
+        )
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 18.04), (UBUNTU, 20.04)])
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+
+    def test_same_like_cartesian_product(self):
+        self.assertEqual(
+            count_valid_combinations(self.param_matrix), count_cartesian_product(self.param_matrix)
+        )
+
+    def test_custom_filter(self):
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            return not (
+                CMAKE in row
+                and BOOST in row
+                and row[CMAKE].version == pkv.parse("3.23")
+                and row[BOOST].version == pkv.parse("1.82")
+            )
+
+        self.assertEqual(
+            count_valid_combinations(self.param_matrix, custom_filter),
+            count_cartesian_product(self.param_matrix, custom_filter),
+        )
+
+    def test_no_valid_combination(self):
+        self.assertEqual(
+            count_valid_combinations(self.param_matrix, lambda row: BOOST not in row), 0
+        )
+
+    def test_independent_parameters(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        for param, length in (("param1", 3), ("param2", 4), ("param3", 5)):
+            param_matrix[param] = parse_param_vals([(param, ver) for ver in range(length)])
+
+        self.assertEqual(count_valid_combinations(param_matrix), 3 * 4 * 5)
+
+    def test_combination_statistics(self):
+        # some valid pairs of the matrix cannot be part of a valid combination
+        with self.assertWarns(UncoveredPairsWarning):
+            statistics = get_combination_statistics(self.param_matrix)
+            comb_list = generate_combination_list(self.param_matrix)
+
+        self.assertEqual(statistics.cartesian_product, 6 * 6 * 3 * 2 * 2 * 2 * 2 * 2)
+        self.assertEqual(statistics.valid_combinations, count_valid_combinations(self.param_matrix))
+        self.assertEqual(statistics.pairwise_combinations, len(comb_list))
+        self.assertAlmostEqual(
+            statistics.reduction_ratio,
+            1 - statistics.pairwise_combinations / statistics.valid_combinations,
+        )
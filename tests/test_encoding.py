@@ -0,0 +1,94 @@
+# pylint: disable=missing-docstring
+import unittest
+from collections import OrderedDict
+from utils_test import parse_param_vals, parse_expected_val_pairs
+from bashi.encoding import EncodedMatrix
+from bashi.versions import get_parameter_value_matrix
+from bashi.utils import get_expected_parameter_value_pairs
+from bashi.types import ParameterValue, ParameterValueMatrix
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+class TestEncodedMatrix(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (CLANG, 16), (NVCC, 12.0)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (CLANG, 16)]
+        )
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.encoded = EncodedMatrix(cls.param_matrix)
+
+    def test_value_ids(self):
+        self.assertEqual(len(self.encoded), 10)
+        self.assertEqual(self.encoded.parameters, [HOST_COMPILER, DEVICE_COMPILER, CMAKE])
+        self.assertEqual(self.encoded.parameter_values, [range(0, 4), range(4, 8), range(8, 10)])
+        self.assertEqual(self.encoded.parameter_mask(1), 0b0011110000)
+        for value_id, param_val in enumerate(self.encoded.values):
+            param = self.encoded.parameters[self.encoded.value_parameter[value_id]]
+            self.assertEqual(self.encoded.encode_value(param, param_val), value_id)
+            self.assertIn(param_val, self.param_matrix[param])
+
+    def test_same_parameter_value_different_parameter(self):
+        gcc10 = ParameterValue(GCC, parse_param_vals([(GCC, 10)])[0].version)
+        self.assertNotEqual(
+            self.encoded.encode_value(HOST_COMPILER, gcc10),
+            self.encoded.encode_value(DEVICE_COMPILER, gcc10),
+        )
+
+    def test_unknown_value(self):
+        self.assertRaises(
+            KeyError,
+            self.encoded.encode_value,
+            CMAKE,
+            parse_param_vals([(CMAKE, 3.30)])[0],
+        )
+
+    def test_version_keys_are_sortable(self):
+        for id1, val1 in enumerate(self.encoded.values):
+            for id2, val2 in enumerate(self.encoded.values):
+                self.assertEqual(
+                    self.encoded.version_key[id1] < self.encoded.version_key[id2],
+                    val1.version < val2.version,
+                )
+                self.assertEqual(
+                    self.encoded.version_key[id1] == self.encoded.version_key[id2],
+                    val1.version == val2.version,
+                )
+
+    def test_value_names(self):
+        for value_id, param_val in enumerate(self.encoded.values):
+            self.assertEqual(self.encoded.names[self.encoded.value_name[value_id]], param_val.name)
+
+    def test_encode_decode_row(self):
+        row = OrderedDict()
+        row[CMAKE] = self.param_matrix[CMAKE][1]
+        row[HOST_COMPILER] = self.param_matrix[HOST_COMPILER][2]
+        value_ids = self.encoded.encode_row(row)
+        self.assertEqual(value_ids, [9, 2])
+
+        decoded = self.encoded.decode_row(value_ids)
+        self.assertEqual(dict(decoded), dict(row))
+        # decoded rows use the parameter order of the matrix
+        self.assertEqual(list(decoded.keys()), [HOST_COMPILER, CMAKE])
+
+        self.assertRaises(ValueError, self.encoded.decode_combination, value_ids)
+        comb = self.encoded.decode_combination([0, 4, 8])
+        self.assertEqual(list(comb.keys()), list(self.param_matrix.keys()))
+
+    def test_encode_decode_pair(self):
+        pair = parse_expected_val_pairs(
+            [OrderedDict({HOST_COMPILER: (CLANG, 16), CMAKE: (CMAKE, 3.22)})]
+        )[0]
+        value_ids = self.encoded.encode_pair(pair)
+        self.assertEqual(value_ids, (2, 8))
+        self.assertEqual(self.encoded.decode_pair(*value_ids), pair)
+
+    def test_full_matrix_pairs(self):
+        param_matrix = get_parameter_value_matrix()
+        encoded = EncodedMatrix(param_matrix)
+        for pair in get_expected_parameter_value_pairs(param_matrix):
+            self.assertEqual(encoded.decode_pair(*encoded.encode_pair(pair)), pair)
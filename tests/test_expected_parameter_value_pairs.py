@@ -29,6 +29,9 @@ from bashi.utils import (
     check_unexpected_parameter_value_pair_in_combination_list,
     remove_parameter_value_pairs,
     create_parameter_value_pair,
+    get_missing_parameter_value_pairs,
+    get_unexpected_parameter_value_pairs,
+    ParameterValuePairCoverage,
 )
 
 
@@ -600,6 +603,48 @@ class TestExpectedValuePairs(unittest.TestCase):
                 error_list,
             )
 
+    def test_get_missing_and_unexpected_parameter_value_pairs(self):
+        existing_parameter_value_pairs: List[ParameterValuePair] = parse_expected_val_pairs(
+            [
+                OD({HOST_COMPILER: (GCC, 10), BOOST: (BOOST, 1.82)}),
+                # reversed order of the parameters in the combination
+                OD({CMAKE: (CMAKE, 3.22), HOST_COMPILER: (GCC, 10)}),
+            ]
+        )
+        not_parameter_value_pairs: List[ParameterValuePair] = parse_expected_val_pairs(
+            [
+                OD({DEVICE_COMPILER: (CLANG_CUDA, 16), CMAKE: (CMAKE, 3.23)}),
+                OD({DEVICE_COMPILER: (GCC, 7), "unknown_param": (UBUNTU, 22.04)}),
+            ]
+        )
+        parameter_value_pairs = [
+            not_parameter_value_pairs[0],
+            existing_parameter_value_pairs[0],
+            not_parameter_value_pairs[1],
+            existing_parameter_value_pairs[1],
+        ]
+
+        self.assertEqual(
+            get_missing_parameter_value_pairs(self.handwritten_comb_list, parameter_value_pairs),
+            not_parameter_value_pairs,
+        )
+        self.assertEqual(
+            get_unexpected_parameter_value_pairs(self.handwritten_comb_list, parameter_value_pairs),
+            existing_parameter_value_pairs,
+        )
+        self.assertEqual(
+            get_missing_parameter_value_pairs(
+                self.handwritten_comb_list, self.handwritten_all_existing_pairs
+            ),
+            [],
+        )
+
+        coverage = ParameterValuePairCoverage(self.handwritten_comb_list)
+        for param_val_pair in self.handwritten_all_existing_pairs:
+            self.assertIn(param_val_pair, coverage)
+        self.assertNotIn(not_parameter_value_pairs[0], coverage)
+        self.assertNotIn(not_parameter_value_pairs[0], ParameterValuePairCoverage([]))
+
     def test_unrestricted_covertable_generator(self):
         comb_list: CombinationList = []
         # pylance shows a warning, because it cannot determine the concrete type of a namedtuple,
@@ -1,11 +1,22 @@
 # pylint: disable=missing-docstring
 import unittest
+import os
+import tempfile
+import itertools
 from typing import Dict, List
 from collections import OrderedDict
 import packaging.version as pkv
+from utils_test import parse_param_vals
 from bashi.types import ParameterValue, ParameterValueTuple, FilterFunction
 from bashi.utils import FilterAdapter
-from bashi.filter_chain import get_default_filter_chain
+from bashi.rules import RuleProfiler
+from bashi.filter_chain import (
+    get_default_filter_chain,
+    load_rule_order,
+    MemoizedFilterChain,
+    AdaptiveFilterChain,
+)
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 
 
 class TestFilterChain(unittest.TestCase):
@@ -99,3 +110,150 @@ class TestFilterChain(unittest.TestCase):
             "The production filters should return True all the time, because the test data set "
             "does not contain any production data. The custom filter should match the test data.",
         )
+
+
+class TestMemoizedFilterChain(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_val_tuple: ParameterValueTuple = OrderedDict()
+        cls.param_val_tuple["param1"] = ParameterValue("param-val-name1", pkv.parse("1"))
+        cls.param_val_tuple["param2"] = ParameterValue("param-val-name2", pkv.parse("2"))
+        cls.param_val_tuple["param3"] = ParameterValue("param-val-name3", pkv.parse("3"))
+
+    def test_memoized_filter_chain_result(self):
+        calls: List[ParameterValueTuple] = []
+
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            calls.append(row)
+            return "param3" not in row
+
+        filter_chain = get_default_filter_chain(custom_filter, memoize_size=16)
+        self.assertIsInstance(filter_chain, MemoizedFilterChain)
+
+        prefix: ParameterValueTuple = OrderedDict(list(self.param_val_tuple.items())[:2])
+        self.assertTrue(filter_chain(prefix))
+        self.assertFalse(filter_chain(self.param_val_tuple))
+        self.assertTrue(filter_chain(prefix))
+        self.assertFalse(filter_chain(self.param_val_tuple))
+        self.assertEqual(len(calls), 2)
+
+        info = filter_chain.cache_info()  # type: ignore
+        self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (2, 2, 16, 2))
+
+    def test_memoized_filter_chain_parameter_order(self):
+        filter_chain = MemoizedFilterChain(lambda _: True)
+        filter_chain(self.param_val_tuple)
+        filter_chain(OrderedDict(reversed(list(self.param_val_tuple.items()))))
+        self.assertEqual(filter_chain.cache_info().hits, 1)
+        self.assertEqual(filter_chain.cache_info().misses, 1)
+
+    def test_memoized_filter_chain_lru(self):
+        filter_chain = MemoizedFilterChain(lambda _: True, maxsize=2)
+        rows: List[ParameterValueTuple] = [
+            OrderedDict([item]) for item in self.param_val_tuple.items()
+        ]
+
+        filter_chain(rows[0])
+        filter_chain(rows[1])
+        # rows[0] is the most recently used entry now
+        filter_chain(rows[0])
+        # removes rows[1]
+        filter_chain(rows[2])
+        self.assertEqual(filter_chain.cache_info().currsize, 2)
+
+        filter_chain(rows[0])
+        self.assertEqual(filter_chain.cache_info().hits, 2)
+        filter_chain(rows[1])
+        self.assertEqual(filter_chain.cache_info().misses, 4)
+
+        filter_chain.cache_clear()
+        self.assertEqual(tuple(filter_chain.cache_info()), (0, 0, 2, 0))
+
+    def test_memoized_filter_chain_invalid_size(self):
+        self.assertRaises(ValueError, MemoizedFilterChain, lambda _: True, 0)
+
+
+class TestAdaptiveFilterChain(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        host_compilers = parse_param_vals([(GCC, 10), (CLANG, 16), (HIPCC, 6.0), (CLANG_CUDA, 16)])
+        device_compilers = parse_param_vals([(NVCC, 12.0), (CLANG, 16), (HIPCC, 6.0)])
+        cuda_backends = parse_param_vals(
+            [(ALPAKA_ACC_GPU_CUDA_ENABLE, OFF), (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0)]
+        )
+        ubuntus = parse_param_vals([(UBUNTU, 18.04), (UBUNTU, 20.04)])
+
+        cls.rows: List[ParameterValueTuple] = []
+        for host, device, cuda, ubuntu in itertools.product(
+            host_compilers, device_compilers, cuda_backends, ubuntus
+        ):
+            row: ParameterValueTuple = OrderedDict()
+            row[HOST_COMPILER] = host
+            row[DEVICE_COMPILER] = device
+            row[ALPAKA_ACC_GPU_CUDA_ENABLE] = cuda
+            row[UBUNTU] = ubuntu
+            cls.rows.append(row)
+
+    def test_adaptive_filter_chain_result(self):
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            return row[UBUNTU].version != pkv.parse("18.04")
+
+        filter_chain = get_default_filter_chain(custom_filter)
+        adaptive_filter_chain = get_default_filter_chain(custom_filter, adaptive_warm_up=10)
+        self.assertIsInstance(adaptive_filter_chain, AdaptiveFilterChain)
+
+        # the first 10 rows are checked during the warm-up
+        for row in self.rows:
+            self.assertEqual(adaptive_filter_chain(row), filter_chain(row), f"{row}")
+        self.assertTrue(adaptive_filter_chain.frozen)  # type: ignore
+
+    def test_adaptive_filter_chain_deterministic_order(self):
+        filter_chain1 = AdaptiveFilterChain(warm_up_size=len(self.rows))
+        filter_chain2 = AdaptiveFilterChain(warm_up_size=len(self.rows))
+        for row in self.rows:
+            filter_chain1(row)
+        for row in reversed(self.rows):
+            filter_chain2(row)
+
+        self.assertTrue(filter_chain1.frozen)
+        self.assertEqual(filter_chain1.rule_order, filter_chain2.rule_order)
+        self.assertEqual(filter_chain1.rejections, filter_chain2.rejections)
+
+        # the rules are ordered by the number of rejections
+        rejections = [filter_chain1.rejections.get(r, 0) for r in filter_chain1.rule_order]
+        self.assertEqual(rejections, sorted(rejections, reverse=True))
+
+        # the order is frozen after the warm-up
+        rule_order = filter_chain1.rule_order
+        for _ in range(3):
+            filter_chain1(self.rows[0])
+        self.assertEqual(filter_chain1.rule_order, rule_order)
+
+    def test_adaptive_filter_chain_rule_order(self):
+        filter_chain = get_default_filter_chain(rule_order=["d3", "b1"])
+        self.assertTrue(filter_chain.frozen)  # type: ignore
+        rule_order = filter_chain.rule_order  # type: ignore
+        self.assertEqual(rule_order[:3], ["d3", "b1", "c1"])
+        self.assertEqual(len(rule_order), len(set(rule_order)))
+
+        for row in self.rows:
+            self.assertEqual(filter_chain(row), get_default_filter_chain()(row), f"{row}")
+
+        self.assertRaises(ValueError, AdaptiveFilterChain, rule_order=["c1", "x42"])
+        self.assertRaises(ValueError, AdaptiveFilterChain, warm_up_size=0)
+        self.assertRaises(
+            ValueError, get_default_filter_chain, rule_profiler=RuleProfiler(), adaptive_warm_up=1
+        )
+
+    def test_adaptive_filter_chain_profile_file(self):
+        filter_chain = AdaptiveFilterChain(warm_up_size=len(self.rows))
+        for row in self.rows:
+            filter_chain(row)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "rule_order.json")
+            filter_chain.save_rule_order(path)
+            rule_order = load_rule_order(path)
+
+        self.assertEqual(rule_order, filter_chain.rule_order)
+        self.assertEqual(AdaptiveFilterChain(rule_order=rule_order).rule_order, rule_order)
@@ -0,0 +1,82 @@
+# pylint: disable=missing-docstring
+import unittest
+import itertools
+from collections import OrderedDict
+import packaging.version as pkv
+from utils_test import parse_param_vals
+from bashi.filter_incremental import IncrementalFilterChain
+from bashi.filter_chain import get_default_filter_chain
+from bashi.types import ParameterValueMatrix, ParameterValueTuple
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+class TestIncrementalFilterChain(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 6), (GCC, 12), (CLANG, 16), (NVCC, 12.0), (HIPCC, 6.0), (CLANG_CUDA, 13)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 6), (CLANG, 16), (HIPCC, 6.0), (CLANG_CUDA, 16)]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_HIP_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_GPU_HIP_ENABLE, OFF), (ALPAKA_ACC_GPU_HIP_ENABLE, ON)]
+        )
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 18.04), (UBUNTU, 20.04)])
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.18), (CMAKE, 3.22)])
+
+    def test_same_result_like_filter_chain(self):
+        filter_chain = get_default_filter_chain()
+        incremental_filter = IncrementalFilterChain()
+        parameters = list(self.param_matrix.keys())
+
+        # add the parameters in different orders
+        for param_order in (parameters, list(reversed(parameters))):
+            for values in itertools.product(*(self.param_matrix[p] for p in param_order)):
+                row: ParameterValueTuple = OrderedDict()
+                for param, param_val in zip(param_order, values):
+                    extended_row: ParameterValueTuple = OrderedDict(row)
+                    extended_row[param] = param_val
+                    result = incremental_filter.check_parameter_value(row, param, param_val)
+                    self.assertEqual(result, filter_chain(extended_row), f"{extended_row}")
+                    if not result:
+                        break
+                    row = extended_row
+
+    def test_custom_filter(self):
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            return not (
+                CMAKE in row
+                and UBUNTU in row
+                and row[CMAKE].version == pkv.parse("3.22")
+                and row[UBUNTU].version == pkv.parse("18.04")
+            )
+
+        incremental_filter = IncrementalFilterChain(custom_filter)
+        row: ParameterValueTuple = OrderedDict({UBUNTU: self.param_matrix[UBUNTU][0]})
+        self.assertTrue(
+            incremental_filter.check_parameter_value(row, CMAKE, self.param_matrix[CMAKE][0])
+        )
+        self.assertFalse(
+            incremental_filter.check_parameter_value(row, CMAKE, self.param_matrix[CMAKE][1])
+        )
+        # the input row is not modified
+        self.assertEqual(list(row.keys()), [UBUNTU])
+
+    def test_parameter_already_in_row(self):
+        row: ParameterValueTuple = OrderedDict({UBUNTU: self.param_matrix[UBUNTU][0]})
+        self.assertRaises(
+            ValueError,
+            IncrementalFilterChain().check_parameter_value,
+            row,
+            UBUNTU,
+            self.param_matrix[UBUNTU][1],
+        )
@@ -0,0 +1,70 @@
+# pylint: disable=missing-docstring
+import unittest
+import gc
+import pickle
+import weakref
+import packaging.version as pkv
+from bashi.interning import intern_version, _interned_versions, _get_weakref_slots
+from bashi.utils import create_parameter_value_pair
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+class TestInternVersion(unittest.TestCase):
+    def test_same_object(self):
+        self.assertIs(intern_version("3.22"), intern_version("3.22"))
+        self.assertIs(intern_version(12), intern_version("12"))
+        self.assertIs(intern_version(ON), ON_VER)
+        self.assertIs(intern_version(OFF), OFF_VER)
+
+    def test_compatible_with_version(self):
+        version = intern_version("1.81.0")
+        self.assertIsInstance(version, pkv.Version)
+        self.assertEqual(version, pkv.parse("1.81.0"))
+        self.assertEqual(pkv.parse("1.81.0"), version)
+        self.assertEqual(hash(version), hash(pkv.parse("1.81.0")))
+        self.assertLess(version, intern_version("1.82.0"))
+        self.assertNotEqual(version, intern_version("1.82.0"))
+        self.assertEqual(repr(version), repr(pkv.parse("1.81.0")))
+        self.assertEqual(str(version), "1.81.0")
+
+    def test_pickle(self):
+        version = intern_version("11.2")
+        self.assertIs(pickle.loads(pickle.dumps(version)), version)
+
+    def test_parameter_value_pair(self):
+        pair1 = create_parameter_value_pair(CMAKE, CMAKE, "3.22", BOOST, BOOST, "1.80.0")
+        pair2 = create_parameter_value_pair(CMAKE, CMAKE, 3.22, BOOST, BOOST, "1.80.0")
+        self.assertEqual(pair1, pair2)
+        self.assertIs(pair1.first.parameterValue.version, pair2.first.parameterValue.version)
+        self.assertIs(pair1.second.parameterValue.version, pair2.second.parameterValue.version)
+
+    def test_unused_versions_are_released(self):
+        version_str = "987.654.321"
+        version = intern_version(version_str)
+        self.assertIn(version_str, _interned_versions)
+        del version
+        gc.collect()
+        self.assertNotIn(version_str, _interned_versions)
+
+    def test_weakref_slots(self):
+        # depending on the packaging version, Version is defined with or without __slots__
+        class PlainVersion(pkv.Version):
+            pass
+
+        class SlottedVersion(pkv.Version):
+            __slots__ = ()
+
+        for base in (PlainVersion, SlottedVersion, pkv.Version):
+            interned_version_class = type(
+                "InternedVersion", (base,), {"__slots__": _get_weakref_slots(base)}
+            )
+            version = interned_version_class("1.2.3")
+            self.assertIs(weakref.ref(version)(), version)
+        self.assertEqual(_get_weakref_slots(PlainVersion), ())
+
+    def test_invalid_version(self):
+        self.assertRaises(pkv.InvalidVersion, intern_version, "not a version")
+
+
+if __name__ == "__main__":
+    unittest.main()
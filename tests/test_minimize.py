@@ -0,0 +1,111 @@
+# pylint: disable=missing-docstring
+import unittest
+from collections import OrderedDict
+import packaging.version as pkv
+from utils_test import parse_param_vals
+from bashi.generator import generate_combination_list
+from bashi.minimize import minimize_combination_list
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.utils import (
+    get_expected_parameter_value_pairs,
+    check_parameter_value_pair_in_combination_list,
+    check_unexpected_parameter_value_pair_in_combination_list,
+)
+from bashi.types import ParameterValueMatrix, ParameterValueTuple
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+class TestMinimizeCombinationList(unittest.TestCase):
+    def test_without_filter_rules(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        for index in range(5):
+            param = f"param{index}"
+            param_matrix[param] = parse_param_vals([(param, ver) for ver in range(3)])
+
+        comb_list = generate_combination_list(param_matrix)
+        minimized = minimize_combination_list(comb_list, param_matrix)
+
+        # the greedy engine creates 15 combinations, the optimum is 11
+        self.assertLess(len(minimized.combination_list), len(comb_list))
+        self.assertEqual(
+            minimized.saved_combinations, len(comb_list) - len(minimized.combination_list)
+        )
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(
+                minimized.combination_list, get_expected_parameter_value_pairs(param_matrix)
+            )
+        )
+        for comb in minimized.combination_list:
+            self.assertEqual(list(comb.keys()), list(param_matrix.keys()))
+
+    def test_with_filter_rules(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (CLANG, 16), (NVCC, 12.0)]
+        )
+        param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 11), (CLANG, 16)]
+        )
+        param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23), (CMAKE, 3.24)])
+        param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82), (BOOST, 1.83)])
+
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            return not (
+                CMAKE in row
+                and BOOST in row
+                and row[CMAKE].version == pkv.parse("3.23")
+                and row[BOOST].version == pkv.parse("1.82")
+            )
+
+        comb_list = generate_combination_list(param_matrix, custom_filter)
+        minimized = minimize_combination_list(comb_list, param_matrix, custom_filter)
+
+        self.assertLessEqual(len(minimized.combination_list), len(comb_list))
+        expected_pairs, unexpected_pairs = get_expected_bashi_parameter_value_pairs(param_matrix)
+        unexpected_pairs += [
+            pair
+            for pair in expected_pairs
+            if custom_filter(OrderedDict([pair.first, pair.second])) is False
+        ]
+        expected_pairs = [pair for pair in expected_pairs if pair not in unexpected_pairs]
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(
+                minimized.combination_list, expected_pairs
+            )
+        )
+        self.assertTrue(
+            check_unexpected_parameter_value_pair_in_combination_list(
+                minimized.combination_list, unexpected_pairs
+            )
+        )
+
+    def test_zero_time_budget(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        for index in range(5):
+            param = f"param{index}"
+            param_matrix[param] = parse_param_vals([(param, ver) for ver in range(3)])
+
+        comb_list = generate_combination_list(param_matrix)
+        minimized = minimize_combination_list(comb_list, param_matrix, time_budget=0)
+        self.assertEqual(minimized.combination_list, comb_list)
+        self.assertEqual(minimized.saved_combinations, 0)
+
+    def test_unknown_parameter_value(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        comb_list = generate_combination_list(param_matrix)
+
+        smaller_param_matrix: ParameterValueMatrix = OrderedDict(param_matrix)
+        smaller_param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81)])
+        self.assertRaises(ValueError, minimize_combination_list, comb_list, smaller_param_matrix)
+
+        del smaller_param_matrix[BOOST]
+        self.assertRaises(ValueError, minimize_combination_list, comb_list, smaller_param_matrix)
@@ -0,0 +1,97 @@
+# pylint: disable=missing-docstring
+import unittest
+import itertools
+from collections import OrderedDict
+from utils_test import parse_param_vals
+from bashi.compatibility import PairCompatibilityIndex
+from bashi.engine import PairwiseEngine
+from bashi.generator import generate_combination_list
+from bashi.filter_chain import get_default_filter_chain
+from bashi.types import ParameterValueMatrix, ParameterValueTuple
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+class TestPairCompatibilityIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (CLANG, 16), (NVCC, 12.0), (CLANG_CUDA, 16)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (CLANG, 16), (CLANG_CUDA, 16)]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.filter_chain = staticmethod(get_default_filter_chain())
+        cls.index = PairCompatibilityIndex(cls.param_matrix)
+
+    def test_pairs_match_filter_chain(self):
+        encoded = self.index.matrix
+        for id1, id2 in itertools.combinations(range(len(encoded)), 2):
+            if encoded.value_parameter[id1] == encoded.value_parameter[id2]:
+                self.assertFalse(self.index.is_compatible(id1, id2))
+                continue
+            row: ParameterValueTuple = OrderedDict(
+                [encoded.decode_value(id1), encoded.decode_value(id2)]
+            )
+            self.assertEqual(
+                self.index.is_compatible(id1, id2),
+                self.filter_chain(row),
+                f"{row}",
+            )
+            self.assertEqual(self.index.is_compatible(id1, id2), self.index.is_compatible(id2, id1))
+
+    def test_rows_match_filter_chain(self):
+        for values in itertools.product(*self.param_matrix.values()):
+            row: ParameterValueTuple = OrderedDict(zip(self.param_matrix.keys(), values))
+            self.assertEqual(self.index.is_valid(row), self.filter_chain(row), f"{row}")
+
+            # the index is independent of the parameter order
+            reversed_row: ParameterValueTuple = OrderedDict(reversed(list(row.items())))
+            self.assertEqual(self.index.is_valid(reversed_row), self.index.is_valid(row))
+
+    def test_invalid_parameters(self):
+        row: ParameterValueTuple = OrderedDict()
+        row[HOST_COMPILER] = self.param_matrix[HOST_COMPILER][0]  # gcc 10
+        row[DEVICE_COMPILER] = self.param_matrix[DEVICE_COMPILER][1]  # nvcc 12.0
+        row[ALPAKA_ACC_GPU_CUDA_ENABLE] = self.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE][0]  # OFF
+        row[CMAKE] = self.param_matrix[CMAKE][0]
+
+        self.assertFalse(self.index.is_valid(row))
+        self.assertEqual(
+            self.index.get_invalid_parameters(row),
+            [(DEVICE_COMPILER, ALPAKA_ACC_GPU_CUDA_ENABLE)],
+        )
+
+        row[ALPAKA_ACC_GPU_CUDA_ENABLE] = self.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE][2]
+        self.assertTrue(self.index.is_valid(row))
+        self.assertEqual(self.index.get_invalid_parameters(row), [])
+
+    def test_unknown_parameter_value(self):
+        row: ParameterValueTuple = OrderedDict()
+        row[CMAKE] = parse_param_vals([(CMAKE, 3.30)])[0]
+        self.assertFalse(self.index.contains(row))
+        self.assertRaises(KeyError, self.index.is_valid, row)
+
+        row[CMAKE] = self.param_matrix[CMAKE][1]
+        self.assertTrue(self.index.contains(row))
+
+    def test_engine_with_index(self):
+        self.assertEqual(
+            generate_combination_list(self.param_matrix, pair_index=self.index),
+            generate_combination_list(self.param_matrix),
+        )
+
+    def test_engine_with_index_of_different_matrix(self):
+        param_matrix = OrderedDict(self.param_matrix)
+        param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22)])
+        self.assertRaises(
+            ValueError, PairwiseEngine, param_matrix, self.filter_chain, pair_index=self.index
+        )
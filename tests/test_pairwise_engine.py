@@ -0,0 +1,333 @@
+# pylint: disable=missing-docstring
+import unittest
+import importlib.util
+import warnings
+from collections import OrderedDict
+import packaging.version as pkv
+from utils_test import parse_param_vals
+from bashi.engine import PairwiseEngine, UncoveredPairsWarning
+from bashi.generator import (
+    generate_combination_list,
+    iter_combinations,
+    regenerate_combination_list,
+    get_combination_list_cost,
+    ENGINE_BASHI,
+    ENGINE_COVERTABLE,
+)
+from bashi.filter_chain import get_default_filter_chain
+from bashi.utils import (
+    get_expected_parameter_value_pairs,
+    check_parameter_value_pair_in_combination_list,
+    check_unexpected_parameter_value_pair_in_combination_list,
+)
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.versions import get_parameter_value_matrix
+from bashi.types import ParameterValue, ParameterValueMatrix, ParameterValueTuple
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+class TestPairwiseEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (CLANG, 16), (NVCC, 12.0)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 11), (CLANG, 16)]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82), (BOOST, 1.83)])
+
+    def test_all_pairs_covered(self):
+        expected_pairs, unexpected_pairs = get_expected_bashi_parameter_value_pairs(
+            self.param_matrix
+        )
+        comb_list = generate_combination_list(self.param_matrix, engine=ENGINE_BASHI)
+
+        self.assertTrue(check_parameter_value_pair_in_combination_list(comb_list, expected_pairs))
+        self.assertTrue(
+            check_unexpected_parameter_value_pair_in_combination_list(comb_list, unexpected_pairs)
+        )
+
+    def test_combination_parameter_order(self):
+        for comb in generate_combination_list(self.param_matrix):
+            self.assertEqual(list(comb.keys()), list(self.param_matrix.keys()))
+
+    def test_deterministic(self):
+        self.assertEqual(
+            generate_combination_list(self.param_matrix),
+            generate_combination_list(self.param_matrix),
+        )
+
+    def test_without_filter_rules(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        for param, length in (("param1", 3), ("param2", 3), ("param3", 2), ("param4", 4)):
+            param_matrix[param] = parse_param_vals([(param, ver) for ver in range(length)])
+
+        comb_list = list(PairwiseEngine(param_matrix, lambda _: True).generate())
+
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(
+                comb_list, get_expected_parameter_value_pairs(param_matrix)
+            )
+        )
+        # the pair-wise combinations needs to be smaller than the cartesian product
+        self.assertLess(len(comb_list), 3 * 3 * 2 * 4)
+
+    def test_skip_uncoverable_pair(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix["param1"] = parse_param_vals([("param1", 1), ("param1", 2)])
+        param_matrix["param2"] = parse_param_vals([("param2", 1), ("param2", 2)])
+        param_matrix["param3"] = parse_param_vals([("param3", 1), ("param3", 2)])
+
+        # param1=2 and param2=2 is a valid pair, but it is not possible to find a valid value for
+        # param3
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            if "param3" in row and row["param3"].version == pkv.parse("2"):
+                return False
+            if (
+                "param1" in row
+                and "param2" in row
+                and "param3" in row
+                and row["param1"].version == pkv.parse("2")
+                and row["param2"].version == pkv.parse("2")
+            ):
+                return False
+            return True
+
+        engine = PairwiseEngine(param_matrix, get_default_filter_chain(custom_filter))
+        with self.assertWarns(UncoveredPairsWarning):
+            comb_list = list(engine.generate())
+
+        self.assertEqual(len(engine.uncoverable), 1)
+        self.assertEqual(engine.unresolved, [])
+        for comb in comb_list:
+            self.assertTrue(custom_filter(comb))
+
+        with self.assertWarns(UncoveredPairsWarning):
+            generate_combination_list(param_matrix, custom_filter)
+
+    def test_backtracking_budget_exhausted(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        for index in range(4):
+            param = f"param{index}"
+            param_matrix[param] = parse_param_vals([(param, ver) for ver in range(3)])
+
+        # each pair is valid, but param0, param1 and param3 restrict each other
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            if "param0" not in row or "param1" not in row or "param3" not in row:
+                return True
+            return (row["param0"].version.major + row["param1"].version.major) % 3 == row[
+                "param3"
+            ].version.major
+
+        engine = PairwiseEngine(
+            param_matrix, get_default_filter_chain(custom_filter), max_backtracking_steps=2
+        )
+        with self.assertWarns(UncoveredPairsWarning) as context:
+            comb_list = list(engine.generate())
+
+        # the pairs could be covered, but the search was aborted
+        self.assertEqual(engine.uncoverable, [])
+        self.assertNotEqual(engine.unresolved, [])
+        self.assertIn("aborted after 2 backtracking steps", str(context.warning))
+        for comb in comb_list:
+            self.assertTrue(custom_filter(comb))
+
+        # with the default budget, all pairs are covered without warning
+        engine = PairwiseEngine(param_matrix, get_default_filter_chain(custom_filter))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UncoveredPairsWarning)
+            comb_list = list(engine.generate())
+        self.assertEqual(engine.unresolved, [])
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(
+                comb_list,
+                [
+                    pair
+                    for pair in get_expected_parameter_value_pairs(param_matrix)
+                    if custom_filter(OrderedDict([pair.first, pair.second]))
+                ],
+            )
+        )
+
+    def test_regenerate_combination_list(self):
+        previous_comb_list = generate_combination_list(self.param_matrix)
+
+        # nothing changed
+        self.assertEqual(
+            regenerate_combination_list(previous_comb_list, self.param_matrix), previous_comb_list
+        )
+
+        new_param_matrix: ParameterValueMatrix = OrderedDict(self.param_matrix)
+        new_param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (NVCC, 12.0)]
+        )
+        new_param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16)]
+        )
+        # remove a value, which is used by previous combinations
+        new_param_matrix[BOOST] = parse_param_vals([(BOOST, 1.82), (BOOST, 1.83)])
+
+        comb_list = regenerate_combination_list(previous_comb_list, new_param_matrix)
+
+        kept_comb_list = [
+            comb for comb in previous_comb_list if comb[BOOST] in new_param_matrix[BOOST]
+        ]
+        self.assertLess(len(kept_comb_list), len(previous_comb_list))
+        self.assertEqual(comb_list[: len(kept_comb_list)], kept_comb_list)
+
+        expected_pairs, unexpected_pairs = get_expected_bashi_parameter_value_pairs(
+            new_param_matrix
+        )
+        self.assertTrue(check_parameter_value_pair_in_combination_list(comb_list, expected_pairs))
+        self.assertTrue(
+            check_unexpected_parameter_value_pair_in_combination_list(comb_list, unexpected_pairs)
+        )
+
+    def test_regenerate_combination_list_invalid_combinations(self):
+        previous_comb_list = generate_combination_list(self.param_matrix)
+
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            return not (CMAKE in row and row[CMAKE].version == pkv.parse("3.22"))
+
+        comb_list = regenerate_combination_list(
+            previous_comb_list, self.param_matrix, custom_filter
+        )
+        for comb in comb_list:
+            self.assertTrue(custom_filter(comb))
+
+        # combinations with different parameters are not kept
+        new_param_matrix: ParameterValueMatrix = OrderedDict(self.param_matrix)
+        del new_param_matrix[BOOST]
+        self.assertEqual(
+            regenerate_combination_list(previous_comb_list, new_param_matrix),
+            generate_combination_list(new_param_matrix),
+        )
+
+    def test_cost_function(self):
+        def create_matrix(number_of_parameters: int, number_of_values: int) -> ParameterValueMatrix:
+            param_matrix: ParameterValueMatrix = OrderedDict()
+            for index in range(number_of_parameters):
+                param = f"param{index}"
+                param_matrix[param] = parse_param_vals(
+                    [(param, ver) for ver in range(number_of_values)]
+                )
+            return param_matrix
+
+        def cost_function(param: str, param_val: ParameterValue) -> float:
+            if param == "param0" and param_val.version == pkv.parse("0"):
+                return 10.0
+            return 1.0
+
+        for param_matrix in (create_matrix(5, 4), create_matrix(4, 3)):
+            comb_list = generate_combination_list(param_matrix)
+            cost_comb_list = generate_combination_list(param_matrix, cost_function=cost_function)
+
+            self.assertTrue(
+                check_parameter_value_pair_in_combination_list(
+                    cost_comb_list, get_expected_parameter_value_pairs(param_matrix)
+                )
+            )
+            self.assertLessEqual(
+                get_combination_list_cost(cost_comb_list, cost_function),
+                get_combination_list_cost(comb_list, cost_function),
+            )
+            self.assertEqual(
+                list(iter_combinations(param_matrix, cost_function=cost_function)), cost_comb_list
+            )
+
+        # for this matrix, preferring cheap parameter-values saves costs
+        param_matrix = create_matrix(5, 4)
+        self.assertLess(
+            get_combination_list_cost(
+                generate_combination_list(param_matrix, cost_function=cost_function), cost_function
+            ),
+            get_combination_list_cost(generate_combination_list(param_matrix), cost_function),
+        )
+
+        self.assertRaises(
+            ValueError,
+            generate_combination_list,
+            param_matrix,
+            engine=ENGINE_COVERTABLE,
+            cost_function=cost_function,
+        )
+
+    def test_combination_list_cost(self):
+        comb_list = generate_combination_list(self.param_matrix)
+
+        def cost_function(param: str, param_val: ParameterValue) -> float:
+            if param == ALPAKA_ACC_GPU_CUDA_ENABLE and param_val.version != OFF_VER:
+                return 10.0
+            return 1.0
+
+        self.assertEqual(
+            get_combination_list_cost(comb_list, cost_function),
+            sum(
+                10.0 if comb[ALPAKA_ACC_GPU_CUDA_ENABLE].version != OFF_VER else 1.0
+                for comb in comb_list
+            ),
+        )
+        self.assertEqual(get_combination_list_cost([], cost_function), 0)
+
+    def test_single_parameter(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        self.assertEqual(
+            generate_combination_list(param_matrix),
+            [OrderedDict([(CMAKE, param_val)]) for param_val in param_matrix[CMAKE]],
+        )
+
+        def custom_filter(row: ParameterValueTuple) -> bool:
+            return row[CMAKE].version != pkv.parse("3.22")
+
+        self.assertEqual(
+            generate_combination_list(param_matrix, custom_filter),
+            [OrderedDict([(CMAKE, param_matrix[CMAKE][1])])],
+        )
+
+    def test_unknown_engine(self):
+        self.assertRaises(ValueError, generate_combination_list, self.param_matrix, engine="foo")
+
+    @unittest.skipIf(importlib.util.find_spec("covertable") is None, "covertable is not installed")
+    def test_covertable_engine(self):
+        expected_pairs, _ = get_expected_bashi_parameter_value_pairs(self.param_matrix)
+        comb_list = generate_combination_list(self.param_matrix, engine=ENGINE_COVERTABLE)
+
+        self.assertTrue(check_parameter_value_pair_in_combination_list(comb_list, expected_pairs))
+
+    @unittest.skipIf(importlib.util.find_spec("covertable") is None, "covertable is not installed")
+    def test_covertable_engine_default_matrix(self):
+        # covertable copies the read-only default parameter-value-matrix and modifies the copy
+        param_matrix = get_parameter_value_matrix()
+        expected_pairs, _ = get_expected_bashi_parameter_value_pairs(param_matrix)
+        comb_list = generate_combination_list(param_matrix, engine=ENGINE_COVERTABLE)
+
+        self.assertTrue(check_parameter_value_pair_in_combination_list(comb_list, expected_pairs))
+
+    def test_iter_combinations(self):
+        combinations = iter_combinations(self.param_matrix)
+        first_comb = next(combinations)
+        self.assertEqual(list(first_comb.keys()), list(self.param_matrix.keys()))
+
+        comb_list = generate_combination_list(self.param_matrix)
+        self.assertEqual([first_comb] + list(combinations), comb_list)
+
+        # errors are raised when the generator is created
+        self.assertRaises(ValueError, iter_combinations, self.param_matrix, engine="foo")
+
+    @unittest.skipIf(importlib.util.find_spec("covertable") is None, "covertable is not installed")
+    def test_iter_combinations_covertable(self):
+        self.assertEqual(
+            list(iter_combinations(self.param_matrix, engine=ENGINE_COVERTABLE)),
+            generate_combination_list(self.param_matrix, engine=ENGINE_COVERTABLE),
+        )
@@ -1,6 +1,10 @@
 # pylint: disable=missing-docstring
 import unittest
+import copy
+import pickle
+import packaging.version as pkv
 from bashi.versions import VERSIONS, get_parameter_value_matrix
+from bashi.types import ParameterValue
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 
 
@@ -55,3 +59,85 @@ class TestParameterValueGenerator(unittest.TestCase):
         for sw_name, sw_versions in VERSIONS.items():
             if sw_name not in COMPILERS:
                 self.assertEqual(len(self.param_val_matrix[sw_name]), len(sw_versions))
+
+
+class TestFrozenParameterValueMatrix(unittest.TestCase):
+    def test_cached(self):
+        self.assertIs(get_parameter_value_matrix(), get_parameter_value_matrix())
+
+    def test_read_only(self):
+        param_val_matrix = get_parameter_value_matrix()
+        cmake_versions = list(param_val_matrix[CMAKE])
+        new_cmake = ParameterValue(CMAKE, pkv.parse("3.27"))
+
+        for modify in (
+            lambda: param_val_matrix.__setitem__("SoftwareA", []),
+            lambda: param_val_matrix.__delitem__(CMAKE),
+            lambda: param_val_matrix.pop(CMAKE),
+            lambda: param_val_matrix.update({CMAKE: []}),
+            param_val_matrix.clear,
+            lambda: param_val_matrix[CMAKE].append(new_cmake),
+            lambda: param_val_matrix[CMAKE].__setitem__(0, new_cmake),
+            lambda: param_val_matrix[CMAKE].__delitem__(0),
+            param_val_matrix[CMAKE].pop,
+            lambda: param_val_matrix[CMAKE].sort(reverse=True),
+        ):
+            self.assertRaises(TypeError, modify)
+
+        self.assertIs(param_val_matrix, get_parameter_value_matrix())
+        self.assertEqual(param_val_matrix[CMAKE], cmake_versions)
+        self.assertIn(CMAKE, param_val_matrix)
+
+    def test_derive(self):
+        param_val_matrix = get_parameter_value_matrix()
+        new_cmake = ParameterValue(CMAKE, pkv.parse("3.27"))
+
+        derived_matrix = param_val_matrix.derive()
+        derived_matrix["SoftwareA"] = [ParameterValue("SoftwareA", pkv.parse("1.0"))]
+        derived_matrix[CMAKE] = derived_matrix[CMAKE] + [new_cmake]
+        del derived_matrix[BOOST]
+        # the parameter-value-lists are shared with the read-only matrix
+        self.assertRaises(TypeError, derived_matrix[UBUNTU].append, new_cmake)
+
+        self.assertEqual(list(derived_matrix.keys())[-1], "SoftwareA")
+        self.assertIn(new_cmake, derived_matrix[CMAKE])
+        self.assertNotIn("SoftwareA", param_val_matrix)
+        self.assertNotIn(new_cmake, param_val_matrix[CMAKE])
+        self.assertIn(BOOST, param_val_matrix)
+
+    def test_copy_and_pickle(self):
+        param_val_matrix = get_parameter_value_matrix()
+        for copied_matrix in (
+            copy.copy(param_val_matrix),
+            pickle.loads(pickle.dumps(param_val_matrix)),
+        ):
+            self.assertEqual(copied_matrix, param_val_matrix)
+            self.assertRaises(TypeError, copied_matrix[CMAKE].append, copied_matrix[CMAKE][0])
+
+    def test_modifiable_copies(self):
+        param_val_matrix = get_parameter_value_matrix()
+        new_cmake = ParameterValue(CMAKE, pkv.parse("3.27"))
+
+        shallow_copy = param_val_matrix.copy()
+        self.assertEqual(shallow_copy, param_val_matrix)
+        shallow_copy[CMAKE] = [new_cmake]
+        del shallow_copy[BOOST]
+
+        deep_copy = copy.deepcopy(param_val_matrix)
+        self.assertEqual(deep_copy, param_val_matrix)
+        deep_copy[CMAKE].append(new_cmake)
+        del deep_copy[BOOST]
+
+        self.assertIn(BOOST, param_val_matrix)
+        self.assertNotIn(new_cmake, param_val_matrix[CMAKE])
+        self.assertEqual(type(param_val_matrix)(), {})
+
+    def test_changed_versions(self):
+        param_val_matrix = get_parameter_value_matrix()
+        VERSIONS[CMAKE].append("3.27")
+        try:
+            changed_param_val_matrix = get_parameter_value_matrix()
+            self.assertIn(ParameterValue(CMAKE, pkv.parse("3.27")), changed_param_val_matrix[CMAKE])
+        finally:
+            VERSIONS[CMAKE].remove("3.27")
+        self.assertEqual(get_parameter_value_matrix(), param_val_matrix)
@@ -0,0 +1,121 @@
+# pylint: disable=missing-docstring
+import unittest
+import io
+from typing import List, Optional, IO
+from collections import OrderedDict
+import packaging.version as pkv
+from utils_test import parse_param_vals
+from bashi.rules import RuleSet, RuleProfiler
+from bashi.filter_compiler import COMPILER_RULES
+from bashi.filter_backend import BACKEND_RULES
+from bashi.filter_software_dependency import SOFTWARE_DEPENDENCY_RULES
+from bashi.filter_chain import get_default_filter_chain
+from bashi.types import ParameterValue, ParameterValueTuple
+from bashi.utils import reason
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+class TestRuleSet(unittest.TestCase):
+    def setUp(self):
+        self.called: List[str] = []
+        self.rule_set = RuleSet()
+
+        @self.rule_set.rule("r1", "param1")
+        def _r1(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+            self.called.append("r1")
+            if row["param1"].version == pkv.parse("1"):
+                reason(output, "r1 rejects param1=1")
+                return False
+            return True
+
+        @self.rule_set.rule("r2", "param1", "param2")
+        def _r2(row: ParameterValueTuple, output: Optional[IO[str]]) -> bool:
+            self.called.append("r2")
+            if row["param1"].version == row["param2"].version:
+                reason(output, "r2 rejects same versions")
+                return False
+            return True
+
+        self.rule_set.add("r3", ("param2",), lambda row, output: True)
+
+    def make_row(self, **params: int) -> ParameterValueTuple:
+        row: ParameterValueTuple = OrderedDict()
+        for param, version in params.items():
+            row[param] = ParameterValue(param, pkv.parse(str(version)))
+        return row
+
+    def test_skip_rules_with_missing_parameters(self):
+        filter_function = self.rule_set.make_filter()
+
+        self.assertTrue(filter_function(self.make_row(param1=2)))
+        self.assertEqual(self.called, ["r1"])
+
+        self.called.clear()
+        self.assertTrue(filter_function(self.make_row(param3=1)))
+        self.assertEqual(self.called, [])
+
+        self.called.clear()
+        self.assertTrue(filter_function(self.make_row(param2=2, param1=3)))
+        self.assertEqual(self.called, ["r1", "r2"])
+
+    def test_first_rejecting_rule_writes_reason(self):
+        filter_function = self.rule_set.make_filter()
+
+        output = io.StringIO()
+        self.assertFalse(filter_function(self.make_row(param1=1, param2=1), output))
+        self.assertEqual(output.getvalue(), "r1 rejects param1=1")
+        self.assertEqual(self.called, ["r1"])
+
+        output = io.StringIO()
+        self.assertFalse(filter_function(self.make_row(param1=2, param2=2), output))
+        self.assertEqual(output.getvalue(), "r2 rejects same versions")
+
+    def test_rule_parameters(self):
+        self.rule_set.add("r3", ("param4",), lambda row, output: True)
+        self.assertEqual(
+            self.rule_set.get_rule_parameters(),
+            {"r1": ("param1",), "r2": ("param1", "param2"), "r3": ("param2", "param4")},
+        )
+
+    def test_profiler(self):
+        profiler = RuleProfiler()
+        filter_function = self.rule_set.make_filter(profiler)
+
+        filter_function(self.make_row(param1=2, param2=3))
+        filter_function(self.make_row(param1=1, param2=3))
+
+        self.assertEqual(profiler.calls, {"r1": 2, "r2": 1, "r3": 1})
+        self.assertEqual(profiler.rejections, {"r1": 1})
+        self.assertEqual(set(profiler.time_ns.keys()), {"r1", "r2", "r3"})
+        self.assertEqual(len(profiler.report().splitlines()), 4)
+
+
+class TestBashiRuleRegistry(unittest.TestCase):
+    def test_rule_ids(self):
+        self.assertEqual(
+            set(COMPILER_RULES.get_rule_parameters().keys()), {f"c{i}" for i in range(1, 20)}
+        )
+        self.assertEqual(
+            set(BACKEND_RULES.get_rule_parameters().keys()), {f"b{i}" for i in range(1, 18)}
+        )
+        self.assertEqual(
+            set(SOFTWARE_DEPENDENCY_RULES.get_rule_parameters().keys()), {"d1", "d2", "d3"}
+        )
+
+    def test_all_rules_use_at_most_two_parameters(self):
+        for rule_set in (COMPILER_RULES, BACKEND_RULES, SOFTWARE_DEPENDENCY_RULES):
+            for rule in rule_set.rules:
+                self.assertIn(len(rule.parameters), (1, 2), rule.rule_id)
+
+    def test_profiled_filter_chain(self):
+        profiler = RuleProfiler()
+        filter_chain = get_default_filter_chain(rule_profiler=profiler)
+
+        row: ParameterValueTuple = OrderedDict()
+        row[HOST_COMPILER] = parse_param_vals([(GCC, 10)])[0]
+        row[DEVICE_COMPILER] = parse_param_vals([(NVCC, 12.0)])[0]
+        row[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals([(ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2)])[0]
+
+        self.assertFalse(filter_chain(row))
+        self.assertEqual(profiler.rejections, {"c15": 1})
+        self.assertNotIn("b1", profiler.calls)
@@ -2,7 +2,14 @@
 import unittest
 from typing import List, Union
 import packaging.version as pkv
-from bashi.versions import VERSIONS, is_supported_version
+from bashi.versions import (
+    VERSIONS,
+    is_supported_version,
+    are_supported_versions,
+    get_supported_versions,
+    get_parameter_value_matrix,
+)
+from bashi.types import ParameterValue
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 
 
@@ -101,3 +108,65 @@ class TestParameterValueGenerator(unittest.TestCase):
                 f"{name} {version} is supported by bashi",
             )
             self.assertFalse(is_supported_version(name, pkv.parse(str(version))))
+
+    def test_are_supported_versions(self):
+        values = [
+            param_val
+            for param_vals in get_parameter_value_matrix().values()
+            for param_val in param_vals
+        ]
+        values += [
+            ParameterValue(GCC, pkv.parse("1")),
+            ParameterValue(NVCC, pkv.parse("4.7")),
+            ParameterValue(ALPAKA_ACC_GPU_HIP_ENABLE, pkv.parse("12.1")),
+        ]
+        self.assertEqual(
+            are_supported_versions(values),
+            [is_supported_version(name, version) for name, version in values],
+        )
+        self.assertEqual(are_supported_versions(values[-3:]), [False, False, False])
+        self.assertEqual(are_supported_versions([]), [])
+        self.assertRaises(
+            ValueError,
+            are_supported_versions,
+            [(GCC, pkv.parse("12")), ("fancy-cpp-compiler", pkv.parse("12"))],
+        )
+
+    def test_supported_versions_read_only(self):
+        supported_versions = get_supported_versions()
+        self.assertIn(pkv.parse("12"), supported_versions[GCC])
+        with self.assertRaises(TypeError):
+            supported_versions[GCC] = frozenset()  # type: ignore
+        self.assertIsInstance(supported_versions[GCC], frozenset)
+
+    def test_changed_versions(self):
+        self.assertFalse(is_supported_version(GCC, pkv.parse("99")))
+        VERSIONS[GCC].append(99)
+        try:
+            self.assertTrue(is_supported_version(GCC, pkv.parse("99")))
+            self.assertTrue(are_supported_versions([(GCC, pkv.parse("99"))])[0])
+        finally:
+            VERSIONS[GCC].remove(99)
+        self.assertFalse(is_supported_version(GCC, pkv.parse("99")))
+
+    def test_cached_supported_versions(self):
+        supported_versions = get_supported_versions()
+        self.assertIs(get_supported_versions(), supported_versions)
+
+        gcc_versions = VERSIONS[GCC]
+        VERSIONS[GCC] = gcc_versions + [99]
+        try:
+            self.assertTrue(is_supported_version(GCC, pkv.parse("99")))
+            VERSIONS[GCC] += [100]
+            self.assertTrue(is_supported_version(GCC, pkv.parse("100")))
+            del VERSIONS[GCC][-2:]
+            self.assertFalse(is_supported_version(GCC, pkv.parse("99")))
+            VERSIONS["fancy-cpp-compiler"] = [1]
+            self.assertTrue(is_supported_version("fancy-cpp-compiler", pkv.parse("1")))
+            del VERSIONS["fancy-cpp-compiler"]
+            self.assertRaises(
+                ValueError, is_supported_version, "fancy-cpp-compiler", pkv.parse("1")
+            )
+        finally:
+            VERSIONS[GCC] = gcc_versions
+        self.assertEqual(get_supported_versions(), supported_versions)
@@ -0,0 +1,75 @@
+# pylint: disable=missing-docstring
+import unittest
+import os
+import subprocess
+import sys
+from bashi.typecheck import typechecked, set_typecheck_enabled, is_typecheck_enabled
+
+
+def add(first: int, second: int) -> int:
+    return first + second
+
+
+class TestTypecheck(unittest.TestCase):
+    def tearDown(self):
+        set_typecheck_enabled(True)
+
+    def test_enabled(self):
+        set_typecheck_enabled(True)
+        self.assertTrue(is_typecheck_enabled())
+        checked_add = typechecked(add)
+        self.assertEqual(checked_add(1, 2), 3)
+        self.assertRaises(Exception, checked_add, 1, "2")
+
+    def test_disabled(self):
+        set_typecheck_enabled(False)
+        self.assertFalse(is_typecheck_enabled())
+        self.assertIs(typechecked(add), add)
+
+    def test_validate_without_typeguard(self):
+        # bashi-validate disables type checking before it imports the filter functions
+        code = (
+            "import sys\n"
+            "from bashiValidate.validate import main\n"
+            "sys.argv = ['bashi-validate', '--host-compiler', 'gcc@10', '--cmake', '3.22']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit as error:\n"
+            "    print(error.code, 'typeguard' in sys.modules)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.splitlines()[-1], "0 False")
+
+    def test_environment_variable(self):
+        code = (
+            "import sys\n"
+            "from bashi.typecheck import is_typecheck_enabled\n"
+            "from bashi.results import get_expected_bashi_parameter_value_pairs\n"
+            "from bashi.versions import get_parameter_value_matrix\n"
+            "expected, unexpected = get_expected_bashi_parameter_value_pairs(\n"
+            "    get_parameter_value_matrix()\n"
+            ")\n"
+            "print(is_typecheck_enabled(), 'typeguard' in sys.modules, len(expected), "
+            "len(unexpected))\n"
+        )
+        outputs = {}
+        for value in ("1", "0", "off"):
+            outputs[value] = (
+                subprocess.run(
+                    [sys.executable, "-c", code],
+                    env={**os.environ, "BASHI_TYPECHECK": value},
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                .stdout.strip()
+                .split()
+            )
+
+        self.assertEqual(outputs["1"][:2], ["True", "True"])
+        self.assertEqual(outputs["0"][:2], ["False", "False"])
+        self.assertEqual(outputs["off"], outputs["0"])
+        # both modes return the same parameter-value-pairs
+        self.assertEqual(outputs["1"][2:], outputs["0"][2:])
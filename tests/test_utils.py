@@ -1,10 +1,18 @@
 # pylint: disable=missing-docstring
 import unittest
-from typing import List
+from typing import List, Union
 from collections import OrderedDict as OD
+import packaging.version as pkv
+from packaging.specifiers import SpecifierSet, InvalidSpecifier
 from utils_test import parse_expected_val_pairs, create_diff_parameter_value_pairs
 
-from bashi.utils import bi_filter
+from bashi.utils import (
+    bi_filter,
+    remove_parameter_value_pairs,
+    get_expected_parameter_value_pairs,
+    ParameterValuePairIndex,
+)
+from bashi.versions import get_parameter_value_matrix
 from bashi.types import ParameterValuePair
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 
@@ -83,3 +91,161 @@ class TestBiFilter(unittest.TestCase):
             unexpected_result,
             create_diff_parameter_value_pairs(removed_elements, unexpected_result),
         )
+
+
+def remove_matching_pairs(  # pylint: disable=too-many-arguments,too-many-locals
+    pairs: List[ParameterValuePair],
+    removed: List[ParameterValuePair],
+    parameter1: str = ANY_PARAM,
+    value_name1: str = ANY_NAME,
+    value_version1: Union[int, float, str] = ANY_VERSION,
+    parameter2: str = ANY_PARAM,
+    value_name2: str = ANY_NAME,
+    value_version2: Union[int, float, str] = ANY_VERSION,
+    symmetric: bool = True,
+) -> bool:
+    """Straightforward implementation of the documented behavior of remove_parameter_value_pairs()
+    to check the optimized implementations."""
+
+    def is_range(value_version: Union[int, float, str]) -> bool:
+        try:
+            SpecifierSet(str(value_version))
+            return value_version != ANY_VERSION
+        except InvalidSpecifier:
+            return False
+
+    def version_matches(version: pkv.Version, value_version: Union[int, float, str]) -> bool:
+        if value_version == ANY_VERSION:
+            return True
+        if is_range(value_version):
+            # versions outside a version range are removed
+            return version not in SpecifierSet(str(value_version))
+        return version == pkv.parse(str(value_version))
+
+    def matches(pair: ParameterValuePair, first: tuple, second: tuple) -> bool:
+        if is_range(first[2]) and is_range(second[2]):
+            # two version ranges: pairs, which are in both ranges are kept
+            versions_match = not (
+                pair.first.parameterValue.version in SpecifierSet(str(first[2]))
+                and pair.second.parameterValue.version in SpecifierSet(str(second[2]))
+            )
+        else:
+            versions_match = version_matches(
+                pair.first.parameterValue.version, first[2]
+            ) and version_matches(pair.second.parameterValue.version, second[2])
+        return (
+            first[0] in (ANY_PARAM, pair.first.parameter)
+            and first[1] in (ANY_NAME, pair.first.parameterValue.name)
+            and second[0] in (ANY_PARAM, pair.second.parameter)
+            and second[1] in (ANY_NAME, pair.second.parameterValue.name)
+            and versions_match
+        )
+
+    first = (parameter1, value_name1, value_version1)
+    second = (parameter2, value_name2, value_version2)
+    length = len(pairs)
+    for criteria in [(first, second), (second, first)] if symmetric else [(first, second)]:
+        removed += [pair for pair in pairs if matches(pair, *criteria)]
+        pairs[:] = [pair for pair in pairs if not matches(pair, *criteria)]
+    return length != len(pairs)
+
+
+class TestParameterValuePairIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pairs: List[ParameterValuePair] = get_expected_parameter_value_pairs(
+            get_parameter_value_matrix()
+        )
+
+    def test_remove_same_result_like_list(self):
+        criteria = [
+            {"parameter1": HOST_COMPILER, "value_name1": NVCC},
+            {"parameter1": HOST_COMPILER, "value_name1": CLANG_CUDA, "value_version1": ">13"},
+            {"value_name1": GCC, "value_version1": 7, "parameter2": UBUNTU},
+            {
+                "parameter1": UBUNTU,
+                "value_version1": ">=20.04",
+                "parameter2": ALPAKA_ACC_GPU_HIP_ENABLE,
+                "value_version2": ON,
+            },
+            {
+                "parameter1": DEVICE_COMPILER,
+                "value_name1": NVCC,
+                "value_version1": ">=11.3,<=11.5",
+                "parameter2": HOST_COMPILER,
+                "value_name2": CLANG,
+                "value_version2": "<1",
+            },
+            {"parameter1": CMAKE, "value_version1": 3.20, "symmetric": False},
+            {"value_name2": BOOST},
+        ]
+
+        pair_list = list(self.pairs)
+        pair_index = ParameterValuePairIndex(self.pairs)
+        expected_pairs = list(self.pairs)
+        removed_list: List[ParameterValuePair] = []
+        removed_index: List[ParameterValuePair] = []
+        expected_removed: List[ParameterValuePair] = []
+        for criterion in criteria:
+            expected_result = remove_matching_pairs(expected_pairs, expected_removed, **criterion)
+            self.assertNotEqual(expected_removed, [], f"{criterion}")
+            self.assertEqual(
+                remove_parameter_value_pairs(pair_list, removed_list, **criterion),  # type: ignore
+                expected_result,
+                f"{criterion}",
+            )
+            self.assertEqual(
+                remove_parameter_value_pairs(
+                    pair_index, removed_index, **criterion  # type: ignore
+                ),
+                expected_result,
+                f"{criterion}",
+            )
+            self.assertEqual(pair_list, expected_pairs, f"{criterion}")
+            self.assertEqual(pair_index.get_pairs(), expected_pairs, f"{criterion}")
+            self.assertEqual(removed_list, expected_removed, f"{criterion}")
+            self.assertEqual(removed_index, expected_removed, f"{criterion}")
+            self.assertEqual(len(pair_index), len(expected_pairs))
+
+        # nothing to remove
+        self.assertFalse(
+            remove_parameter_value_pairs(
+                pair_index, removed_index, parameter1=HOST_COMPILER, value_name1=NVCC
+            )
+        )
+
+    def test_bi_filter_parameters(self):
+        def filter_func(param_value_pair: ParameterValuePair) -> bool:
+            return param_value_pair.first.parameterValue.name != GCC
+
+        pair_list = list(self.pairs)
+        pair_index = ParameterValuePairIndex(self.pairs)
+        removed_list: List[ParameterValuePair] = []
+        removed_index: List[ParameterValuePair] = []
+        bi_filter(pair_list, removed_list, filter_func, (HOST_COMPILER, UBUNTU))
+        bi_filter(pair_index, removed_index, filter_func, (HOST_COMPILER, UBUNTU))
+
+        self.assertEqual(pair_index.get_pairs(), pair_list)
+        self.assertEqual(removed_index, removed_list)
+        self.assertNotEqual(len(removed_list), 0)
+        for param_value_pair in removed_list:
+            self.assertEqual(param_value_pair.first.parameter, HOST_COMPILER)
+            self.assertEqual(param_value_pair.second.parameter, UBUNTU)
+
+        bi_filter(pair_list, removed_list, filter_func)
+        bi_filter(pair_index, removed_index, filter_func)
+        self.assertEqual(pair_index.get_pairs(), pair_list)
+        self.assertEqual(removed_index, removed_list)
+
+    def test_remove_unknown_values(self):
+        pair_index = ParameterValuePairIndex(self.pairs)
+        removed: List[ParameterValuePair] = []
+        self.assertFalse(pair_index.remove(removed, parameter1="unknown_param"))
+        self.assertFalse(pair_index.remove(removed, value_name1=GCC, value_version1=99))
+        self.assertFalse(pair_index.remove(removed, parameter1=UBUNTU, value_version1=">=1"))
+        self.assertEqual(removed, [])
+        self.assertEqual(len(pair_index), len(self.pairs))
+
+        empty_list: List[ParameterValuePair] = []
+        self.assertFalse(remove_parameter_value_pairs(empty_list, removed, value_name1=GCC))
+        self.assertEqual(ParameterValuePairIndex([]).get_pairs(), [])
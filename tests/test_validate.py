@@ -0,0 +1,183 @@
+# pylint: disable=missing-docstring
+import unittest
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+from utils_test import parse_param_val
+from bashiValidate.validate import (
+    parse_batch_row,
+    run_batch,
+    validate_line,
+)
+from bashiValidate.server import ValidationServer, query_server
+from bashi.types import ParameterValueTuple
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+class TestBatchValidation(unittest.TestCase):
+    def test_parse_command_line_row(self):
+        expected_row: ParameterValueTuple = OrderedDict(
+            {
+                HOST_COMPILER: parse_param_val((GCC, 10)),
+                ALPAKA_ACC_GPU_CUDA_ENABLE: parse_param_val((ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0)),
+                ALPAKA_ACC_GPU_HIP_ENABLE: parse_param_val((ALPAKA_ACC_GPU_HIP_ENABLE, OFF)),
+                CMAKE: parse_param_val((CMAKE, 3.22)),
+            }
+        )
+        row = parse_batch_row(
+            "--host gcc@10 --bCUDA=12.0 --alpaka_ACC_GPU_HIP_ENABLE OFF --cmake 3.22",
+        )
+        self.assertEqual(row, expected_row)
+        self.assertEqual(list(row.keys()), list(expected_row.keys()))
+
+    def test_parse_json_row(self):
+        self.assertEqual(
+            parse_batch_row(
+                '{"host-compiler": "gcc@10", "--bCUDA": "12.0", '
+                '"alpaka_ACC_GPU_HIP_ENABLE": "OFF", "cmake": "3.22"}',
+            ),
+            parse_batch_row(
+                "--host gcc@10 --bCUDA=12.0 --alpaka_ACC_GPU_HIP_ENABLE OFF --cmake 3.22",
+            ),
+        )
+
+    def test_parse_invalid_row(self):
+        for line in (
+            "--host gcc10",
+            "--host foo@10",
+            "--host gcc@foo",
+            "--cmake",
+            "--cmake 3.22 3.23",
+            "--foo 1",
+            "--bHIP 1",
+            '{"host-compiler": "gcc@10"',
+            "[1, 2]",
+            '{"cmake": 3.20}',
+            '{"bHIP": true}',
+            "--batch -",
+            "--help",
+        ):
+            self.assertRaises(ValueError, parse_batch_row, line)
+
+    def test_parse_json_row_keeps_version_string(self):
+        row = parse_batch_row('{"cmake": "3.20", "boost": "1.80.0"}')
+        self.assertEqual(str(row[CMAKE].version), "3.20")
+        self.assertEqual(str(row[BOOST].version), "1.80.0")
+
+    def test_same_errors_for_both_shapes(self):
+        for line, json_line in (
+            ("--bHIP 1", '{"bHIP": "1"}'),
+            ("--host foo@10", '{"host": "foo@10"}'),
+            ("--foo=1", '{"foo": "1"}'),
+        ):
+            with self.assertRaises(ValueError) as line_error:
+                parse_batch_row(line)
+            with self.assertRaises(ValueError) as json_error:
+                parse_batch_row(json_line)
+            self.assertEqual(str(line_error.exception), str(json_error.exception), line)
+
+    def test_run_batch(self):
+        input_stream = io.StringIO(
+            "# comment\n"
+            "--host gcc@10 --device gcc@10\n"
+            "\n"
+            '{"host-compiler": "clang@16", "device-compiler": "nvcc@12.0", "bCUDA": "12.0"}\n'
+            "--host foo@10\n"
+        )
+        output_stream = io.StringIO()
+
+        self.assertFalse(run_batch(input_stream, output_stream))
+        results = [json.loads(line) for line in output_stream.getvalue().splitlines()]
+
+        self.assertEqual([result["line"] for result in results], [2, 4, 5])
+        self.assertEqual([result["valid"] for result in results], [True, False, False])
+        self.assertTrue(results[0]["filters"]["compiler_filter"]["valid"])
+        self.assertFalse(results[1]["filters"]["compiler_filter"]["valid"])
+        self.assertNotEqual(results[1]["filters"]["compiler_filter"]["reason"], "")
+        self.assertIn("error", results[2])
+
+    def test_run_batch_worker_pool(self):
+        lines = "".join(
+            f"--host gcc@{version} --device nvcc@12.0 --bCUDA 12.0\n" for version in range(6, 14)
+        )
+        serial_output = io.StringIO()
+        parallel_output = io.StringIO()
+
+        serial_valid = run_batch(io.StringIO(lines), serial_output)
+        parallel_valid = run_batch(io.StringIO(lines), parallel_output, jobs=2)
+
+        self.assertEqual(serial_valid, parallel_valid)
+        self.assertEqual(serial_output.getvalue(), parallel_output.getvalue())
+        self.assertEqual(len(serial_output.getvalue().splitlines()), 8)
+
+
+class TestValidationServer(unittest.TestCase):
+    def setUp(self):
+        self.validate = validate_line
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.socket_path = os.path.join(self.tmp_dir.name, "bashi-validate.sock")
+        self.server = ValidationServer(self.socket_path, self.validate)
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+        self.tmp_dir.cleanup()
+
+    def test_query(self):
+        lines = [
+            "--host gcc@10 --device gcc@10",
+            "# comment",
+            '{"host-compiler": "clang@16", "device-compiler": "nvcc@12.0", "bCUDA": "12.0"}',
+            "--host foo@10",
+        ]
+        results = query_server(self.socket_path, lines)
+
+        self.assertEqual([result["line"] for result in results], [1, 2, 3])
+        for result, line in zip(results, (lines[0], lines[2], lines[3])):
+            del result["line"]
+            self.assertEqual(result, self.validate(line))
+
+    def test_concurrent_clients(self):
+        lines = [
+            f"--host gcc@{version} --device nvcc@12.0 --bCUDA 12.0" for version in range(6, 14)
+        ]
+        expected_results = query_server(self.socket_path, lines)
+        results: List[List[Dict]] = []
+
+        def query():
+            results.append(query_server(self.socket_path, lines))
+
+        clients = [threading.Thread(target=query) for _ in range(4)]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+
+        self.assertEqual(results, [expected_results] * 4)
+
+    def test_socket_in_use(self):
+        self.assertRaises(OSError, ValidationServer, self.socket_path, self.validate)
+
+    def test_remove_socket(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertFalse(os.path.exists(self.socket_path))
+
+        # socket file of a crashed server
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+            stale_socket.bind(self.socket_path)
+        self.assertTrue(os.path.exists(self.socket_path))
+
+        # restart server for tearDown()
+        self.server = ValidationServer(self.socket_path, self.validate)
+        self.server_thread.join()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()